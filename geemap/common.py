@@ -2907,6 +2907,8 @@ def get_image_collection_thumbnails(
         timeout (int, optional): The number of seconds after which the request will be terminated. Defaults to 300.
         proxies (dict, optional): A dictionary of proxy servers to use for the request. Defaults to None.
     """
+    import concurrent.futures
+
     if not isinstance(ee_object, ee.ImageCollection):
         print("The ee_object must be an ee.ImageCollection.")
         raise TypeError("The ee_object must be an ee.Image.")
@@ -2931,7 +2933,7 @@ def get_image_collection_thumbnails(
 
         images = ee_object.toList(count)
 
-        for i in range(0, count):
+        def download_thumbnail(i):
             image = ee.Image(images.get(i))
             name = str(names[i])
             ext = os.path.splitext(name)[1][1:]
@@ -2941,10 +2943,12 @@ def get_image_collection_thumbnails(
             if verbose:
                 print(f"Downloading {i+1}/{count}: {name} ...")
 
+            # get_image_thumbnail adds the region, dimensions and format to the
+            # vis params, so give each download its own copy
             get_image_thumbnail(
                 image,
                 out_img,
-                vis_params,
+                dict(vis_params),
                 dimensions,
                 region,
                 format,
@@ -2952,6 +2956,13 @@ def get_image_collection_thumbnails(
                 proxies=proxies,
             )
 
+        # The downloads are bound by request latency, so overlap a few of them.
+        # Results are collected in order, so the first failure is still raised.
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            futures = [executor.submit(download_thumbnail, i) for i in range(count)]
+            for future in futures:
+                future.result()
+
     except Exception as e:
         print(e)
 
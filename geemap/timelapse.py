@@ -1,4 +1,12 @@
-"""Module for creating timelapse from Earth Engine data."""
+"""Module for creating timelapse from Earth Engine data.
+
+The GIF post-processing steps (e.g., add_text_to_gif, add_sample_markers_to_gif,
+combine_gif_with_chart) are pure Pillow work. Replacing Pillow with the
+API-compatible Pillow-SIMD build (pip uninstall pillow, then
+CC="cc -mavx2" pip install pillow-simd) speeds up resizing, compositing, and
+quantization without any code changes. Pillow-SIMD must be swapped in manually,
+as it installs under the same module name as Pillow.
+"""
 
 # *******************************************************************************#
 # This module contains extra features of the geemap package.                     #
@@ -10,6 +18,7 @@ import glob
 import io
 import os
 import shutil
+from functools import lru_cache
 
 import ee
 
@@ -101,6 +110,36 @@ def add_overlay(
         raise Exception(e)
 
 
+def _maybe_add_overlay(
+    collection,
+    overlay_data,
+    color="black",
+    width=1,
+    opacity=1.0,
+    region=None,
+):
+    """Adds an overlay to an image collection, skipping the per-frame paint when the overlay is empty.
+
+    Args:
+        collection (ee.ImageCollection): The image collection to add the overlay to.
+        overlay_data (str | list | ee.Geometry | ee.FeatureCollection): The overlay data. See add_overlay().
+        color (str, optional): The color of the overlay. Defaults to 'black'.
+        width (int, optional): The width of the overlay. Defaults to 1.
+        opacity (float, optional): The opacity of the overlay. Defaults to 1.0.
+        region (ee.Geometry | ee.FeatureCollection, optional): The region of interest to add the overlay to. Defaults to None.
+
+    Returns:
+        ee.ImageCollection: The image collection, with the overlay added if there is anything to draw.
+    """
+    # Only check what is known client-side; asking the server whether a
+    # FeatureCollection is empty would cost a request of its own.
+    if overlay_data is None or (
+        isinstance(overlay_data, (list, str)) and len(overlay_data) == 0
+    ):
+        return collection
+    return add_overlay(collection, overlay_data, color, width, opacity, region)
+
+
 def make_gif(
     images: Union[List[str], str],
     out_gif: str,
@@ -195,6 +234,212 @@ def gif_to_mp4(in_gif, out_mp4):
         raise Exception(f"Failed to create mp4 file.")
 
 
+@lru_cache(maxsize=1)
+def _h264_encoder():
+    """Returns the H.264 encoder to use with ffmpeg, preferring NVENC when it works.
+
+    Returns:
+        str: 'h264_nvenc' if ffmpeg can encode a test frame with it, otherwise 'libx264'.
+    """
+    import subprocess
+
+    # Stock ffmpeg builds list h264_nvenc even without an NVIDIA GPU or driver,
+    # so encode one blank frame to check that the encoder actually works.
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-f",
+        "lavfi",
+        "-i",
+        "nullsrc=s=256x256",
+        "-frames:v",
+        "1",
+        "-c:v",
+        "h264_nvenc",
+        "-f",
+        "null",
+        "-",
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, check=False, timeout=30)
+    except Exception:
+        return "libx264"
+
+    return "h264_nvenc" if result.returncode == 0 else "libx264"
+
+
+def _direct_mp4_from_jpegs(names, out_mp4, fps):
+    """Encodes a sequence of JPEG frames into an MP4 without an intermediate GIF.
+
+    Args:
+        names (list): The JPEG frames, named like {prefix}_{index}.jpg with a zero-padded, 1-based index.
+        out_mp4 (str): The output mp4 file.
+        fps (int): The frames per second of the mp4.
+    """
+    import subprocess
+
+    if not is_tool("ffmpeg"):
+        print("ffmpeg is not installed on your computer.")
+        return
+
+    if not names:
+        raise ValueError("There are no frames to encode into the mp4 file.")
+
+    out_mp4 = os.path.abspath(out_mp4)
+    if not os.path.exists(os.path.dirname(out_mp4)):
+        os.makedirs(os.path.dirname(out_mp4))
+
+    # Remove the output of an earlier run, so that a failed encode is not
+    # mistaken for a successful one
+    if os.path.exists(out_mp4):
+        os.remove(out_mp4)
+
+    prefix = names[0].rsplit("_", 1)[0]
+    pad = len(str(len(names)))
+    encoder = _h264_encoder()
+    preset = ["-preset", "p4"] if encoder == "h264_nvenc" else ["-crf", "25"]
+    cmd = [
+        "ffmpeg",
+        "-loglevel",
+        "error",
+        "-y",
+        "-framerate",
+        str(fps),
+        "-i",
+        f"{prefix}_%0{pad}d.jpg",
+        "-vf",
+        "scale=trunc(iw/2)*2:trunc(ih/2)*2",
+        "-c:v",
+        encoder,
+        *preset,
+        "-pix_fmt",
+        "yuv420p",
+        out_mp4,
+    ]
+    try:
+        subprocess.run(cmd, check=True)
+    except subprocess.CalledProcessError as e:
+        raise Exception("Failed to create mp4 file.") from e
+
+    if not os.path.exists(out_mp4):
+        raise Exception(f"Failed to create mp4 file.")
+
+
+def _mp4_pipe(out_mp4, width, height, fps):
+    """Starts an ffmpeg process that encodes raw RGB frames into an MP4.
+
+    Args:
+        out_mp4 (str): The output mp4 file.
+        width (int): The width of the frames.
+        height (int): The height of the frames.
+        fps (float): The frames per second of the mp4.
+
+    Returns:
+        subprocess.Popen: The ffmpeg process. Write rgb24 frame bytes to its stdin, then close it and wait.
+    """
+    import subprocess
+
+    encoder = _h264_encoder()
+    preset = ["-preset", "p4"] if encoder == "h264_nvenc" else ["-crf", "25"]
+    cmd = [
+        "ffmpeg",
+        "-loglevel",
+        "error",
+        "-y",
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        f"{width}x{height}",
+        "-framerate",
+        str(fps),
+        "-i",
+        "-",
+        "-vf",
+        "scale=trunc(iw/2)*2:trunc(ih/2)*2",
+        "-c:v",
+        encoder,
+        *preset,
+        "-pix_fmt",
+        "yuv420p",
+        out_mp4,
+    ]
+    return subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+
+@lru_cache(maxsize=1)
+def _mp4_executor():
+    """Returns the module-level worker used for background MP4 conversion."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def _finalize_mp4(out_gif, wait=True):
+    """Converts a finished timelapse GIF to MP4, optionally in the background.
+
+    Args:
+        out_gif (str): The finished GIF file. The MP4 is written next to it.
+        wait (bool, optional): Whether to block until the MP4 is written. Defaults to True.
+
+    Returns:
+        concurrent.futures.Future | None: The pending conversion if wait is False, otherwise None. A failed background conversion is also reported with print.
+    """
+    out_mp4 = out_gif.replace(".gif", ".mp4")
+    if wait:
+        gif_to_mp4(out_gif, out_mp4)
+        return None
+
+    def _report_error(future):
+        # Nobody waits on the future, so surface a failed conversion here
+        error = future.exception()
+        if error is not None:
+            print(f"Failed to convert {out_gif} to mp4: {error}")
+
+    future = _mp4_executor().submit(gif_to_mp4, out_gif, out_mp4)
+    future.add_done_callback(_report_error)
+    return future
+
+
+def _download_video_with_labels(
+    collection,
+    video_args,
+    out_gif,
+    labels=None,
+    font=None,
+    add_text=False,
+    text_sequence=None,
+):
+    """Downloads a timelapse GIF while fetching its frame labels and loading its font concurrently.
+
+    Args:
+        collection (ee.ImageCollection): The image collection to download.
+        video_args (dict): Parameters for the video thumbnail.
+        out_gif (str): File path to the output GIF.
+        labels (ee.List, optional): The frame labels to fetch alongside the video. Defaults to None.
+        font (tuple, optional): The (font_type, font_size) to preload for add_text_to_gif. Defaults to None.
+        add_text (bool, optional): Whether text will be drawn on the frames. If True and neither labels nor text_sequence is given, the "system:date" of each image is fetched as the labels. Defaults to False.
+        text_sequence (int, str, list, optional): The text the caller already has for the frames. Defaults to None.
+
+    Returns:
+        list | None: The fetched labels, or text_sequence if no labels were fetched.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if labels is None and add_text and text_sequence is None:
+        labels = collection.aggregate_array("system:date")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if font is not None:
+            executor.submit(_load_font, *font)
+        future = executor.submit(labels.getInfo) if labels is not None else None
+        download_ee_video(collection, video_args, out_gif)
+        return future.result() if future is not None else text_sequence
+
+
 def merge_gifs(in_gifs, out_gif):
     """Merge multiple gifs into one.
 
@@ -377,6 +622,46 @@ def gif_fading(in_gif, out_gif, duration=1, verbose=True):
     os.chdir(current_dir)
 
 
+@lru_cache(maxsize=16)
+def _load_font(font_type="arial.ttf", font_size=20):
+    """Loads a font for drawing text on GIF frames, parsing each (font_type, font_size) once.
+
+    Args:
+        font_type (str, optional): Font type. Either one of the bundled fonts ("arial.ttf", "alibaba.otf") or a system font. Defaults to "arial.ttf".
+        font_size (int, optional): Font size. Defaults to 20.
+
+    Returns:
+        PIL.ImageFont.FreeTypeFont: The loaded font, or the bundled Arial font if font_type cannot be found.
+    """
+    import importlib.resources
+    from PIL import ImageFont
+
+    pkg_dir = str(importlib.resources.files("geemap").joinpath("geemap.py").parent)
+    default_font = os.path.join(pkg_dir, "data/fonts/arial.ttf")
+
+    if font_type == "arial.ttf":
+        font = ImageFont.truetype(default_font, font_size)
+    elif font_type == "alibaba.otf":
+        default_font = os.path.join(pkg_dir, "data/fonts/alibaba.otf")
+        font = ImageFont.truetype(default_font, font_size)
+    else:
+        try:
+            font_list = system_fonts(show_full_path=True)
+            font_names = [os.path.basename(f) for f in font_list]
+            if (font_type in font_list) or (font_type in font_names):
+                font = ImageFont.truetype(font_type, font_size)
+            else:
+                print(
+                    "The specified font type could not be found on your system. Using the default font instead."
+                )
+                font = ImageFont.truetype(default_font, font_size)
+        except Exception as e:
+            print(e)
+            font = ImageFont.truetype(default_font, font_size)
+
+    return font
+
+
 def add_text_to_gif(
     in_gif,
     out_gif,
@@ -411,14 +696,11 @@ def add_text_to_gif(
     # import io
     import warnings
 
-    import importlib.resources
-    from PIL import Image, ImageDraw, ImageFont, ImageSequence
+    import numpy as np
+    from PIL import Image, ImageColor, ImageDraw, ImageSequence
 
     warnings.simplefilter("ignore")
 
-    pkg_dir = str(importlib.resources.files("geemap").joinpath("geemap.py").parent)
-    default_font = os.path.join(pkg_dir, "data/fonts/arial.ttf")
-
     in_gif = os.path.abspath(in_gif)
     out_gif = os.path.abspath(out_gif)
 
@@ -429,25 +711,7 @@ def add_text_to_gif(
     if not os.path.exists(os.path.dirname(out_gif)):
         os.makedirs(os.path.dirname(out_gif))
 
-    if font_type == "arial.ttf":
-        font = ImageFont.truetype(default_font, font_size)
-    elif font_type == "alibaba.otf":
-        default_font = os.path.join(pkg_dir, "data/fonts/alibaba.otf")
-        font = ImageFont.truetype(default_font, font_size)
-    else:
-        try:
-            font_list = system_fonts(show_full_path=True)
-            font_names = [os.path.basename(f) for f in font_list]
-            if (font_type in font_list) or (font_type in font_names):
-                font = ImageFont.truetype(font_type, font_size)
-            else:
-                print(
-                    "The specified font type could not be found on your system. Using the default font instead."
-                )
-                font = ImageFont.truetype(default_font, font_size)
-        except Exception as e:
-            print(e)
-            font = ImageFont.truetype(default_font, font_size)
+    font = _load_font(font_type, font_size)
 
     color = check_color(font_color)
     progress_bar_color = check_color(progress_bar_color)
@@ -461,10 +725,8 @@ def add_text_to_gif(
 
     count = image.n_frames
     W, H = image.size
-    progress_bar_widths = [i * 1.0 / count * W for i in range(1, count + 1)]
-    progress_bar_shapes = [
-        [(0, H - progress_bar_height), (x, H)] for x in progress_bar_widths
-    ]
+    progress_bar_widths = np.linspace(W / count, W, count).round().astype(int).tolist()
+    progress_bar_rgb = ImageColor.getrgb(progress_bar_color)
 
     if xy is None:
         # default text location is 5% width and 5% height of the image.
@@ -526,7 +788,10 @@ def add_text_to_gif(
             # w, h = draw.textsize(text[index])
             draw.text(xy, text[index], font=font, fill=color)
             if add_progress_bar:
-                draw.rectangle(progress_bar_shapes[index], fill=progress_bar_color)
+                frame.paste(
+                    progress_bar_rgb,
+                    (0, H - progress_bar_height, progress_bar_widths[index], H),
+                )
             del draw
 
             b = io.BytesIO()
@@ -535,16 +800,19 @@ def add_text_to_gif(
 
             frames.append(frame)
         # https://www.pythoninformer.com/python-libraries/pillow/creating-animated-gif/
-        # Save the frames as a new image
-
+        # Save the frames as a new image. gifsicle optimizes much faster than
+        # Pillow's optimize pass, so use it when it is installed.
+        use_gifsicle = is_tool("gifsicle")
         frames[0].save(
             out_gif,
             save_all=True,
             append_images=frames[1:],
             duration=duration,
             loop=loop,
-            optimize=True,
+            optimize=not use_gifsicle,
         )
+        if use_gifsicle:
+            _gifsicle_optimize(out_gif)
     except Exception as e:
         print(e)
 
@@ -707,12 +975,12 @@ def reduce_gif_size(in_gif, out_gif=None):
         os.makedirs(os.path.dirname(out_gif))
 
     if in_gif == out_gif:
+        # Write to a temporary file and swap it in, rather than copying the input first.
         tmp_gif = in_gif.replace(".gif", "_tmp.gif")
-        shutil.copyfile(in_gif, tmp_gif)
-        stream = ffmpeg.input(tmp_gif)
-        stream = ffmpeg.output(stream, in_gif, loglevel="quiet").overwrite_output()
+        stream = ffmpeg.input(in_gif)
+        stream = ffmpeg.output(stream, tmp_gif, loglevel="quiet").overwrite_output()
         ffmpeg.run(stream)
-        os.remove(tmp_gif)
+        os.replace(tmp_gif, in_gif)
 
     else:
         stream = ffmpeg.input(in_gif)
@@ -720,6 +988,45 @@ def reduce_gif_size(in_gif, out_gif=None):
         ffmpeg.run(stream)
 
 
+def _gifsicle_optimize(in_gif):
+    """Optimizes a GIF image in place using gifsicle.
+
+    Args:
+        in_gif (str): The file path to the GIF image.
+    """
+    import subprocess
+
+    subprocess.run(["gifsicle", "-O3", "--batch", in_gif], check=True)
+
+
+def _gifski_encode(frames, out_gif, fps, loop=0, quality=90):
+    """Encodes frames into a GIF image using gifski.
+
+    Args:
+        frames (iterable): The frames as PIL images.
+        out_gif (str): The file path to the output GIF image.
+        fps (int): Frames per second.
+        loop (int, optional): Number of times to loop the GIF, 0 loops forever. Defaults to 0.
+        quality (int, optional): The encoding quality, from 1 to 100. Defaults to 90.
+    """
+    import subprocess
+    import tempfile
+
+    # gifski reads PNG frames and quantizes them on all CPU cores. The PNGs are
+    # only intermediates, so favor write speed over size.
+    with tempfile.TemporaryDirectory() as temp_dir:
+        frame_prefix = os.path.join(temp_dir, "frame_")
+        frame_paths = []
+        for index, frame in enumerate(frames):
+            frame_path = f"{frame_prefix}{index:05d}.png"
+            frame.save(frame_path, compress_level=1)
+            frame_paths.append(frame_path)
+
+        cmd = ["gifski", "-o", out_gif, "--fps", str(fps)]
+        cmd += ["--quality", str(quality), "--repeat", str(loop), *frame_paths]
+        subprocess.run(cmd, check=True)
+
+
 def create_timeseries(
     collection,
     start_date,
@@ -871,6 +1178,7 @@ def create_timelapse(
     fading=False,
     parallel_scale=1,
     step=1,
+    wait_mp4=True,
 ):
     """Create a timelapse from any ee.ImageCollection.
 
@@ -922,6 +1230,7 @@ def create_timelapse(
         fading (int | bool, optional): If True, add fading effect to the timelapse. Defaults to False, no fading. To add fading effect, set it to True (1 second fading duration) or to an integer value (fading duration).
         parallel_scale (int, optional): A scaling factor used to limit memory use; using a larger parallel_scale (e.g. 2 or 4) may enable computations that run out of memory with the default. Defaults to 1.
         step (int, optional): The step size to use when creating the date sequence. Defaults to 1.
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
 
     Returns:
         str: File path to the timelapse gif.
@@ -1056,12 +1365,25 @@ def create_timelapse(
     else:
         video_args["bands"] = ["vis-gray"]
 
-    if (
+    large_frames = (
         isinstance(dimensions, int)
         and dimensions > 768
         or isinstance(dimensions, str)
         and any(dim > 768 for dim in list(map(int, dimensions.split("x"))))
-    ):
+    )
+    # Frames larger than the video thumbnail limit are fetched one JPEG at a
+    # time, and those JPEGs can be encoded straight to MP4 when no text,
+    # colorbar or fading is drawn on the GIF
+    direct_mp4 = (
+        large_frames
+        and mp4
+        and not title
+        and not add_text
+        and not add_colorbar
+        and not fading
+    )
+
+    if large_frames:
         count = col.size().getInfo()
         basename = os.path.basename(out_gif)[:-4]
         names = [
@@ -1081,6 +1403,9 @@ def create_timelapse(
             dimensions=dimensions,
             names=names,
         )
+        if direct_mp4:
+            out_mp4 = out_gif.replace(".gif", ".mp4")
+            _direct_mp4_from_jpegs(names, out_mp4, frames_per_second)
         make_gif(
             names,
             out_gif,
@@ -1090,7 +1415,10 @@ def create_timelapse(
             clean_up=True,
         )
     else:
-        download_ee_video(col, video_args, out_gif)
+        # Fetch the frame labels while the video downloads
+        text_sequence = _download_video_with_labels(
+            col, video_args, out_gif, add_text=add_text, text_sequence=text_sequence
+        )
 
     if title is not None and isinstance(title, str):
         add_text_to_gif(
@@ -1151,11 +1479,9 @@ def create_timelapse(
     if fading > 0:
         gif_fading(out_gif, out_gif, duration=fading, verbose=False)
 
-    if mp4:
-        out_mp4 = out_gif.replace(".gif", ".mp4")
-        gif_to_mp4(out_gif, out_mp4)
+    future = _finalize_mp4(out_gif, wait=wait_mp4) if mp4 and not direct_mp4 else None
 
-    return out_gif
+    return out_gif if wait_mp4 else (out_gif, future)
 
 
 def naip_timeseries(roi=None, start_year=2003, end_year=None, RGBN=False, step=1):
@@ -1241,6 +1567,7 @@ def naip_timelapse(
     mp4=False,
     fading=False,
     step=1,
+    wait_mp4=True,
 ):
     """Create a timelapse from NAIP imagery.
 
@@ -1274,6 +1601,7 @@ def naip_timelapse(
         mp4 (bool, optional): Whether to create an mp4 file. Defaults to False.
         fading (int | bool, optional): If True, add fading effect to the timelapse. Defaults to False, no fading. To add fading effect, set it to True (1 second fading duration) or to an integer value (fading duration).
         step (int, optional): The step size to use when creating the date sequence. Defaults to 1.
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
 
     Returns:
         str: File path to the timelapse gif.
@@ -1329,6 +1657,7 @@ def naip_timelapse(
             mp4=mp4,
             fading=fading,
             step=step,
+            wait_mp4=wait_mp4,
         )
 
     except Exception as e:
@@ -1349,11 +1678,10 @@ def valid_roi(roi):
     return ee.Geometry(geojson)
 
 
-def sentinel1_defaults():
-    from datetime import date
-
-    year = date.today().year
-    roi = ee.Geometry.Polygon(
+@lru_cache(maxsize=1)
+def _default_roi():
+    """Returns the default region of interest (Las Vegas & Lake Mead), built once."""
+    return ee.Geometry.Polygon(
         [
             [
                 [-115.471773, 35.892718],
@@ -1366,7 +1694,13 @@ def sentinel1_defaults():
         None,
         False,
     )
-    return year, roi
+
+
+def sentinel1_defaults():
+    from datetime import date
+
+    year = date.today().year
+    return year, _default_roi()
 
 
 def sentinel1_filtering(
@@ -1510,6 +1844,47 @@ def sentinel1_timeseries(
     return imgColl
 
 
+# Sentinel-2 band names by common name, the band labels used in sample charts, and
+# the spectral indices supported by sentinel2_timelapse_with_samples.
+_S2_BAND_NAMES = {
+    "Blue": "B2",
+    "Green": "B3",
+    "Red": "B4",
+    "Red Edge 1": "B5",
+    "Red Edge 2": "B6",
+    "Red Edge 3": "B7",
+    "NIR": "B8",
+    "Red Edge 4": "B8A",
+    "SWIR1": "B11",
+    "SWIR2": "B12",
+    "QA60": "QA60",
+}
+_S2_BAND_LABELS = {
+    "B2": "Blue",
+    "B3": "Green",
+    "B4": "Red",
+    "B5": "Red Edge 1",
+    "B6": "Red Edge 2",
+    "B7": "Red Edge 3",
+    "B8": "NIR",
+    "B8A": "Red Edge 4",
+    "B11": "SWIR1",
+    "B12": "SWIR2",
+}
+_S2_INDICES = (
+    "NDVI",
+    "EVI",
+    "NDWI",
+    "MNDWI",
+    "NDBI",
+    "NBR",
+    "SAVI",
+    "GNDVI",
+    "NDRE",
+    "CIRE",
+)
+
+
 def sentinel2_timeseries(
     roi,
     start_year=2015,
@@ -1587,23 +1962,9 @@ def sentinel2_timeseries(
         )
 
     if bands is not None:
-        allowed_bands = {
-            "Blue": "B2",
-            "Green": "B3",
-            "Red": "B4",
-            "Red Edge 1": "B5",
-            "Red Edge 2": "B6",
-            "Red Edge 3": "B7",
-            "NIR": "B8",
-            "Red Edge 4": "B8A",
-            "SWIR1": "B11",
-            "SWIR2": "B12",
-            "QA60": "QA60",
-        }
-
         for index, band in enumerate(bands):
-            if band in allowed_bands:
-                bands[index] = allowed_bands[band]
+            if band in _S2_BAND_NAMES:
+                bands[index] = _S2_BAND_NAMES[band]
 
         collection = collection.select(bands)
 
@@ -1950,6 +2311,80 @@ def sentinel2_timeseries_legacy(
     return imgCol
 
 
+# Spectral indices supported by landsat_timelapse_with_samples, as computed by
+# calculate_landsat_indices.
+_LANDSAT_INDICES = (
+    "NDVI",
+    "EVI",
+    "NDWI",
+    "MNDWI",
+    "NDBI",
+    "NBR",
+    "SAVI",
+    "GNDVI",
+    "NDMI",
+    "TCB",
+    "TCG",
+    "TCW",
+    "MSAVI2",
+    "VARI",
+    "MCARI",
+)
+
+
+# Default Landsat index visualization parameters and chart labels, returned as
+# copies by get_default_landsat_index_vis_params, get_default_landsat_band_labels
+# and get_landsat_index_chart_labels. Index palettes are shared between entries
+# as tuples, so they stay intact when callers modify the copies they get.
+_RDYLBU_PALETTE = ("#d7191c", "#fdae61", "#ffffbf", "#abd9e9", "#2c7bb6")
+_BROWN_BLUE_PALETTE = ("#8b4513", "#daa520", "#ffffbf", "#87ceeb", "#0000ff")
+_BLUE_BROWN_PALETTE = ("#0000ff", "#87ceeb", "#ffffbf", "#daa520", "#8b4513")
+_GRAY_PALETTE = ("#000000", "#404040", "#808080", "#c0c0c0", "#ffffff")
+_BROWN_GREEN_PALETTE = ("#8b4513", "#daa520", "#ffffbf", "#90ee90", "#006400")
+_DEFAULT_LANDSAT_INDEX_VIS_PARAMS = {
+    "NDVI": {"min": -0.1, "max": 1, "palette": _RDYLBU_PALETTE},
+    "EVI": {"min": -0.2, "max": 0.8, "palette": _RDYLBU_PALETTE},
+    "NDWI": {"min": -0.3, "max": 0.8, "palette": _BROWN_BLUE_PALETTE},
+    "MNDWI": {"min": -0.3, "max": 0.8, "palette": _BROWN_BLUE_PALETTE},
+    "NDBI": {"min": -0.5, "max": 0.5, "palette": _BLUE_BROWN_PALETTE},
+    "NBR": {"min": -0.5, "max": 0.8, "palette": _RDYLBU_PALETTE},
+    "SAVI": {"min": -0.2, "max": 0.8, "palette": _RDYLBU_PALETTE},
+    "GNDVI": {"min": -0.2, "max": 0.8, "palette": _RDYLBU_PALETTE},
+    "NDMI": {"min": -0.2, "max": 0.6, "palette": _BROWN_BLUE_PALETTE},
+    "MSAVI2": {"min": -0.2, "max": 0.8, "palette": _RDYLBU_PALETTE},
+    "VARI": {"min": -0.2, "max": 0.6, "palette": _RDYLBU_PALETTE},
+    "MCARI": {"min": 0, "max": 2, "palette": _RDYLBU_PALETTE},
+    "TCB": {"min": 0, "max": 0.4, "palette": _GRAY_PALETTE},
+    "TCG": {"min": -0.1, "max": 0.1, "palette": _BROWN_GREEN_PALETTE},
+    "TCW": {"min": -0.2, "max": 0.1, "palette": _BROWN_BLUE_PALETTE},
+}
+_DEFAULT_LANDSAT_BAND_LABELS = {
+    "Blue": "Blue",
+    "Green": "Green",
+    "Red": "Red",
+    "NIR": "NIR",
+    "SWIR1": "SWIR1",
+    "SWIR2": "SWIR2",
+}
+_LANDSAT_INDEX_CHART_LABELS = {
+    "NDVI": "NDVI",
+    "EVI": "EVI",
+    "NDWI": "NDWI",
+    "MNDWI": "MNDWI",
+    "NDBI": "NDBI",
+    "NBR": "NBR",
+    "SAVI": "SAVI",
+    "GNDVI": "GNDVI",
+    "NDMI": "NDMI",
+    "MSAVI2": "MSAVI2",
+    "VARI": "VARI",
+    "MCARI": "MCARI",
+    "TCB": "Tasseled Cap Brightness",
+    "TCG": "Tasseled Cap Greenness",
+    "TCW": "Tasseled Cap Wetness",
+}
+
+
 def landsat_timeseries(
     roi=None,
     start_year=1984,
@@ -2679,6 +3114,7 @@ def landsat_timelapse(
     mp4=False,
     fading=False,
     step=1,
+    wait_mp4=True,
 ):
     """Generates a Landsat timelapse GIF image. This function is adapted from https://emaprlab.users.earthengine.app/view/lt-gee-time-series-animator. A huge thank you to Justin Braaten for sharing his fantastic work.
 
@@ -2719,6 +3155,7 @@ def landsat_timelapse(
         mp4 (bool, optional): Whether to convert the GIF to MP4. Defaults to False.
         fading (int | bool, optional): If True, add fading effect to the timelapse. Defaults to False, no fading. To add fading effect, set it to True (1 second fading duration) or to an integer value (fading duration).
         step (int, optional): Step size for the timelapse. Defaults to 1.
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
 
     Returns:
         str: File path to the output GIF image.
@@ -2812,12 +3249,18 @@ def landsat_timelapse(
                 col, overlay_data, overlay_color, overlay_width, overlay_opacity
             )
 
-        if (
+        large_frames = (
             isinstance(dimensions, int)
             and dimensions > 768
             or isinstance(dimensions, str)
             and any(dim > 768 for dim in list(map(int, dimensions.split("x"))))
-        ):
+        )
+        # Frames larger than the video thumbnail limit are fetched one JPEG at a
+        # time, and those JPEGs can be encoded straight to MP4 when no text or
+        # fading is drawn on the GIF
+        direct_mp4 = large_frames and mp4 and not title and not add_text and not fading
+
+        if large_frames:
             count = col.size().getInfo()
             basename = os.path.basename(out_gif)[:-4]
             names = [
@@ -2837,6 +3280,9 @@ def landsat_timelapse(
                 dimensions=dimensions,
                 names=names,
             )
+            if direct_mp4:
+                out_mp4 = out_gif.replace(".gif", ".mp4")
+                _direct_mp4_from_jpegs(names, out_mp4, frames_per_second)
             make_gif(
                 names,
                 out_gif,
@@ -2847,16 +3293,21 @@ def landsat_timelapse(
             )
 
         else:
-            video_args = vis_params.copy()
-            video_args["dimensions"] = dimensions
-            video_args["region"] = roi
-            video_args["framesPerSecond"] = frames_per_second
-            video_args["crs"] = crs
-            video_args["bands"] = ["vis-red", "vis-green", "vis-blue"]
-            video_args["min"] = 0
-            video_args["max"] = 255
+            video_args = {
+                **vis_params,
+                "dimensions": dimensions,
+                "region": roi,
+                "framesPerSecond": frames_per_second,
+                "crs": crs,
+                "bands": ["vis-red", "vis-green", "vis-blue"],
+                "min": 0,
+                "max": 255,
+            }
 
-            download_ee_video(col, video_args, out_gif)
+            # Fetch the frame labels while the video downloads
+            text_sequence = _download_video_with_labels(
+                col, video_args, out_gif, add_text=add_text, text_sequence=text_sequence
+            )
 
         if os.path.exists(out_gif):
             if title is not None and isinstance(title, str):
@@ -2914,11 +3365,11 @@ def landsat_timelapse(
         if fading > 0:
             gif_fading(out_gif, out_gif, duration=fading, verbose=False)
 
-        if mp4:
-            out_mp4 = out_gif.replace(".gif", ".mp4")
-            gif_to_mp4(out_gif, out_mp4)
+        future = (
+            _finalize_mp4(out_gif, wait=wait_mp4) if mp4 and not direct_mp4 else None
+        )
 
-        return out_gif
+        return out_gif if wait_mp4 else (out_gif, future)
 
     except Exception as e:
         raise Exception(e)
@@ -2960,6 +3411,7 @@ def landsat_timelapse_legacy(
     loop=0,
     mp4=False,
     fading=False,
+    wait_mp4=True,
 ):
     """Generates a Landsat timelapse GIF image. This function is adapted from https://emaprlab.users.earthengine.app/view/lt-gee-time-series-animator. A huge thank you to Justin Braaten for sharing his fantastic work.
 
@@ -2999,6 +3451,7 @@ def landsat_timelapse_legacy(
         loop (int, optional): Controls how many times the animation repeats. The default, 1, means that the animation will play once and then stop (displaying the last frame). A value of 0 means that the animation will repeat forever. Defaults to 0.
         mp4 (bool, optional): Whether to convert the GIF to MP4. Defaults to False.
         fading (int | bool, optional): If True, add fading effect to the timelapse. Defaults to False, no fading. To add fading effect, set it to True (1 second fading duration) or to an integer value (fading duration).
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
 
     Returns:
         str: File path to the output GIF image.
@@ -3091,12 +3544,18 @@ def landsat_timelapse_legacy(
                 col, overlay_data, overlay_color, overlay_width, overlay_opacity
             )
 
-        if (
+        large_frames = (
             isinstance(dimensions, int)
             and dimensions > 768
             or isinstance(dimensions, str)
             and any(dim > 768 for dim in list(map(int, dimensions.split("x"))))
-        ):
+        )
+        # Frames larger than the video thumbnail limit are fetched one JPEG at a
+        # time, and those JPEGs can be encoded straight to MP4 when no text or
+        # fading is drawn on the GIF
+        direct_mp4 = large_frames and mp4 and not title and not add_text and not fading
+
+        if large_frames:
             count = col.size().getInfo()
             basename = os.path.basename(out_gif)[:-4]
             names = [
@@ -3116,6 +3575,9 @@ def landsat_timelapse_legacy(
                 dimensions=dimensions,
                 names=names,
             )
+            if direct_mp4:
+                out_mp4 = out_gif.replace(".gif", ".mp4")
+                _direct_mp4_from_jpegs(names, out_mp4, frames_per_second)
             make_gif(
                 names,
                 out_gif,
@@ -3126,16 +3588,21 @@ def landsat_timelapse_legacy(
             )
 
         else:
-            video_args = vis_params.copy()
-            video_args["dimensions"] = dimensions
-            video_args["region"] = roi
-            video_args["framesPerSecond"] = frames_per_second
-            video_args["crs"] = crs
-            video_args["bands"] = ["vis-red", "vis-green", "vis-blue"]
-            video_args["min"] = 0
-            video_args["max"] = 255
+            video_args = {
+                **vis_params,
+                "dimensions": dimensions,
+                "region": roi,
+                "framesPerSecond": frames_per_second,
+                "crs": crs,
+                "bands": ["vis-red", "vis-green", "vis-blue"],
+                "min": 0,
+                "max": 255,
+            }
 
-            download_ee_video(col, video_args, out_gif)
+            # Fetch the frame labels while the video downloads
+            text_sequence = _download_video_with_labels(
+                col, video_args, out_gif, add_text=add_text, text_sequence=text_sequence
+            )
 
         if os.path.exists(out_gif):
             if title is not None and isinstance(title, str):
@@ -3193,11 +3660,11 @@ def landsat_timelapse_legacy(
         if fading > 0:
             gif_fading(out_gif, out_gif, duration=fading, verbose=False)
 
-        if mp4:
-            out_mp4 = out_gif.replace(".gif", ".mp4")
-            gif_to_mp4(out_gif, out_mp4)
+        future = (
+            _finalize_mp4(out_gif, wait=wait_mp4) if mp4 and not direct_mp4 else None
+        )
 
-        return out_gif
+        return out_gif if wait_mp4 else (out_gif, future)
 
     except Exception as e:
         raise Exception(e)
@@ -3234,6 +3701,7 @@ def sentinel1_timelapse_legacy(
     loop=0,
     mp4=False,
     fading=False,
+    wait_mp4=True,
 ):
     """Generates a Sentinel-1 timelapse animated GIF or MP4.
 
@@ -3268,6 +3736,7 @@ def sentinel1_timelapse_legacy(
         loop (int, optional): Controls how many times the animation repeats. The default, 1, means that the animation will play once and then stop (displaying the last frame). A value of 0 means that the animation will repeat forever. Defaults to 0.
         mp4 (bool, optional): Whether to convert the GIF to MP4. Defaults to False.
         fading (int | bool, optional): If True, add fading effect to the timelapse. Defaults to False, no fading. To add fading effect, set it to True (1 second fading duration) or to an integer value (fading duration).
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
 
     Returns:
         str: File path to the output GIF image.
@@ -3309,12 +3778,18 @@ def sentinel1_timelapse_legacy(
             col, overlay_data, overlay_color, overlay_width, overlay_opacity
         )
 
-    if (
+    large_frames = (
         isinstance(dimensions, int)
         and dimensions > 768
         or isinstance(dimensions, str)
         and any(dim > 768 for dim in list(map(int, dimensions.split("x"))))
-    ):
+    )
+    # Frames larger than the video thumbnail limit are fetched one JPEG at a
+    # time, and those JPEGs can be encoded straight to MP4 when no text or
+    # fading is drawn on the GIF
+    direct_mp4 = large_frames and mp4 and not title and not add_text and not fading
+
+    if large_frames:
         count = col.size().getInfo()
         basename = os.path.basename(out_gif)[:-4]
         names = [
@@ -3330,6 +3805,9 @@ def sentinel1_timelapse_legacy(
             dimensions=dimensions,
             names=names,
         )
+        if direct_mp4:
+            out_mp4 = out_gif.replace(".gif", ".mp4")
+            _direct_mp4_from_jpegs(names, out_mp4, frames_per_second)
         make_gif(
             names,
             out_gif,
@@ -3339,16 +3817,20 @@ def sentinel1_timelapse_legacy(
             clean_up=True,
         )
     else:
-        video_args = vis_params.copy()
-        video_args["dimensions"] = dimensions
-        video_args["region"] = roi
-        video_args["framesPerSecond"] = frames_per_second
-        video_args["crs"] = crs
-        video_args["min"] = vis_params["min"]
-        video_args["max"] = vis_params["max"]
+        video_args = {
+            **vis_params,
+            "dimensions": dimensions,
+            "region": roi,
+            "framesPerSecond": frames_per_second,
+            "crs": crs,
+        }
 
-        download_ee_video(col, video_args, out_gif)
+        # Fetch the frame labels while the video downloads
+        text_sequence = _download_video_with_labels(
+            col, video_args, out_gif, add_text=add_text, text_sequence=text_sequence
+        )
 
+    future = None
     if os.path.exists(out_gif):
         if title is not None and isinstance(title, str):
             add_text_to_gif(
@@ -3388,11 +3870,10 @@ def sentinel1_timelapse_legacy(
             fading = int(fading)
         if fading > 0:
             gif_fading(out_gif, out_gif, duration=fading, verbose=False)
-        if mp4:
-            out_mp4 = out_gif.replace(".gif", ".mp4")
-            gif_to_mp4(out_gif, out_mp4)
+        if mp4 and not direct_mp4:
+            future = _finalize_mp4(out_gif, wait=wait_mp4)
 
-    return out_gif
+    return out_gif if wait_mp4 else (out_gif, future)
 
 
 def sentinel2_timelapse(
@@ -3430,6 +3911,7 @@ def sentinel2_timelapse(
     mp4=False,
     fading=False,
     step=1,
+    wait_mp4=True,
     **kwargs,
 ):
     """Generates a Sentinel-2 timelapse GIF image. This function is adapted from https://emaprlab.users.earthengine.app/view/lt-gee-time-series-animator. A huge thank you to Justin Braaten for sharing his fantastic work.
@@ -3469,6 +3951,7 @@ def sentinel2_timelapse(
         mp4 (bool, optional): Whether to convert the GIF to MP4. Defaults to False.
         fading (int | bool, optional): If True, add fading effect to the timelapse. Defaults to False, no fading. To add fading effect, set it to True (1 second fading duration) or to an integer value (fading duration).
         step (int, optional): Step size for selecting images. Defaults to 1.
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
         kwargs (optional): Additional arguments to pass the geemap.create_timeseries() function.
 
     Returns:
@@ -3479,19 +3962,7 @@ def sentinel2_timelapse(
         end_year = datetime.datetime.now().year
 
     if roi is None:
-        roi = ee.Geometry.Polygon(
-            [
-                [
-                    [-115.471773, 35.892718],
-                    [-115.471773, 36.409454],
-                    [-114.271283, 36.409454],
-                    [-114.271283, 35.892718],
-                    [-115.471773, 35.892718],
-                ]
-            ],
-            None,
-            False,
-        )
+        roi = _default_roi()
     elif isinstance(roi, ee.Feature) or isinstance(roi, ee.FeatureCollection):
         roi = roi.geometry()
     elif isinstance(roi, ee.Geometry):
@@ -3514,19 +3985,7 @@ def sentinel2_timelapse(
     if not os.path.exists(out_dir):
         os.makedirs(out_dir)
 
-    allowed_bands = {
-        "Blue": "B2",
-        "Green": "B3",
-        "Red": "B4",
-        "Red Edge 1": "B5",
-        "Red Edge 2": "B6",
-        "Red Edge 3": "B7",
-        "NIR": "B8",
-        "Red Edge 4": "B8A",
-        "SWIR1": "B11",
-        "SWIR2": "B12",
-        "QA60": "QA60",
-    }
+    allowed_bands = _S2_BAND_NAMES
 
     if bands is None:
         bands = ["SWIR1", "NIR", "Red"]
@@ -3585,12 +4044,18 @@ def sentinel2_timelapse(
                 col, overlay_data, overlay_color, overlay_width, overlay_opacity
             )
 
-        if (
+        large_frames = (
             isinstance(dimensions, int)
             and dimensions > 768
             or isinstance(dimensions, str)
             and any(dim > 768 for dim in list(map(int, dimensions.split("x"))))
-        ):
+        )
+        # Frames larger than the video thumbnail limit are fetched one JPEG at a
+        # time, and those JPEGs can be encoded straight to MP4 when no text or
+        # fading is drawn on the GIF
+        direct_mp4 = large_frames and mp4 and not title and not add_text and not fading
+
+        if large_frames:
             count = col.size().getInfo()
             basename = os.path.basename(out_gif)[:-4]
             names = [
@@ -3610,6 +4075,9 @@ def sentinel2_timelapse(
                 dimensions=dimensions,
                 names=names,
             )
+            if direct_mp4:
+                out_mp4 = out_gif.replace(".gif", ".mp4")
+                _direct_mp4_from_jpegs(names, out_mp4, frames_per_second)
             make_gif(
                 names,
                 out_gif,
@@ -3619,16 +4087,21 @@ def sentinel2_timelapse(
                 clean_up=True,
             )
         else:
-            video_args = vis_params.copy()
-            video_args["dimensions"] = dimensions
-            video_args["region"] = roi
-            video_args["framesPerSecond"] = frames_per_second
-            video_args["crs"] = crs
-            video_args["bands"] = ["vis-red", "vis-green", "vis-blue"]
-            video_args["min"] = 0
-            video_args["max"] = 255
+            video_args = {
+                **vis_params,
+                "dimensions": dimensions,
+                "region": roi,
+                "framesPerSecond": frames_per_second,
+                "crs": crs,
+                "bands": ["vis-red", "vis-green", "vis-blue"],
+                "min": 0,
+                "max": 255,
+            }
 
-            download_ee_video(col, video_args, out_gif)
+            # Fetch the frame labels while the video downloads
+            text_sequence = _download_video_with_labels(
+                col, video_args, out_gif, add_text=add_text, text_sequence=text_sequence
+            )
 
         if os.path.exists(out_gif):
             if title is not None and isinstance(title, str):
@@ -3672,11 +4145,10 @@ def sentinel2_timelapse(
         if fading > 0:
             gif_fading(out_gif, out_gif, duration=fading, verbose=False)
 
-        if mp4:
-            out_mp4 = out_gif.replace(".gif", ".mp4")
-            gif_to_mp4(out_gif, out_mp4)
-
-        return out_gif
+        future = (
+            _finalize_mp4(out_gif, wait=wait_mp4) if mp4 and not direct_mp4 else None
+        )
+        return out_gif if wait_mp4 else (out_gif, future)
 
     except Exception as e:
         print(e)
@@ -3759,18 +4231,58 @@ def landsat_ts_norm_diff_gif(
         gif_to_mp4(out_gif, out_mp4)
 
 
-def goes_timeseries(
-    start_date="2021-10-24T14:00:00",
-    end_date="2021-10-25T01:00:00",
-    data="GOES-17",
-    scan="full_disk",
-    region=None,
-    show_night=[False, "a_mode"],
-):
-    """Create a time series of GOES data. The code is adapted from Justin Braaten's code: https://code.earthengine.google.com/57245f2d3d04233765c42fb5ef19c1f4.
-    Credits to Justin Braaten. See also https://jstnbraaten.medium.com/goes-in-earth-engine-53fbc8783c16
+# Supported GOES satellites and the collection suffix for each scan type.
+_GOES_DATASETS = frozenset(["GOES-16", "GOES-17"])
+_GOES_CMI_SCANS = {"full_disk": "MCMIPF", "conus": "MCMIPC", "mesoscale": "MCMIPM"}
+_GOES_FDC_SCANS = {"full_disk": "FDCF", "conus": "FDCC"}
 
-    Args:
+# GOES fire mask codes and their detection confidence values. Kept as plain lists
+# so that importing the module does not require an initialized Earth Engine session.
+_FDC_MASK_CODES = [10, 30, 11, 31, 12, 32, 13, 33, 14, 34, 15, 35]
+_FDC_CONF_VALS = [1.0, 1.0, 0.9, 0.9, 0.8, 0.8, 0.5, 0.5, 0.3, 0.3, 0.1, 0.1]
+
+# Visualization parameters for the GOES fire overlay.
+_CMI_VIS = {
+    "bands": ["CMI_C02", "CMI_GREEN", "CMI_C01"],
+    "min": 0,
+    "max": 0.8,
+    "gamma": 0.8,
+}
+_FDC_VIS = {"palette": ["ff5349"], "min": 0, "max": 1, "opacity": 0.7}
+
+# Unit-scale ranges used by the GOES night modes. Plain numbers, for the same reason.
+_GOES_NIGHT_A_IR_RANGE = (90, 313)
+_GOES_NIGHT_B_C03_RANGE = (0, 0.016)
+_GOES_NIGHT_B_IR_LOW = [100, 100, 100]
+_GOES_NIGHT_B_IR_HIGH = [310, 300, 310]
+
+
+@lru_cache(maxsize=8)
+def _goes_collection(data_suffix, scan_code):
+    """Returns the GOES image collection for a satellite and product, built once per pair.
+
+    Args:
+        data_suffix (str): The satellite number, e.g., "17".
+        scan_code (str): The product code, e.g., "MCMIPF" or "FDCC".
+
+    Returns:
+        ee.ImageCollection: The unfiltered GOES image collection.
+    """
+    return ee.ImageCollection(f"NOAA/GOES/{data_suffix}/{scan_code}")
+
+
+def goes_timeseries(
+    start_date="2021-10-24T14:00:00",
+    end_date="2021-10-25T01:00:00",
+    data="GOES-17",
+    scan="full_disk",
+    region=None,
+    show_night=[False, "a_mode"],
+):
+    """Create a time series of GOES data. The code is adapted from Justin Braaten's code: https://code.earthengine.google.com/57245f2d3d04233765c42fb5ef19c1f4.
+    Credits to Justin Braaten. See also https://jstnbraaten.medium.com/goes-in-earth-engine-53fbc8783c16
+
+    Args:
         start_date (str, optional): The start date of the time series. Defaults to "2021-10-24T14:00:00".
         end_date (str, optional): The end date of the time series. Defaults to "2021-10-25T01:00:00".
         data (str, optional): The GOES satellite data to use. Defaults to "GOES-17".
@@ -3785,19 +4297,13 @@ def goes_timeseries(
         ee.ImageCollection: GOES timeseries.
     """
 
-    if data not in ["GOES-16", "GOES-17"]:
+    if data not in _GOES_DATASETS:
         raise ValueError("The data must be either GOES-16 or GOES-17.")
 
-    if scan.lower() not in ["full_disk", "conus", "mesoscale"]:
+    if scan.lower() not in _GOES_CMI_SCANS:
         raise ValueError("The scan must be either full_disk, conus, or mesoscale.")
 
-    scan_types = {
-        "full_disk": "MCMIPF",
-        "conus": "MCMIPC",
-        "mesoscale": "MCMIPM",
-    }
-
-    col = ee.ImageCollection(f"NOAA/GOES/{data[-2:]}/{scan_types[scan.lower()]}")
+    col = _goes_collection(data[-2:], _GOES_CMI_SCANS[scan.lower()])
 
     if region is None:
         region = ee.Geometry.Polygon(
@@ -3821,7 +4327,10 @@ def goes_timeseries(
 
         scaleImg = getFactorImg(["CMI_C.._scale"])
         offsetImg = getFactorImg(["CMI_C.._offset"])
-        scaled = img.select("CMI_C..").multiply(scaleImg).add(offsetImg)
+        # Resample here, while the bands still carry their native projection.
+        scaled = (
+            img.select("CMI_C..").resample("bicubic").multiply(scaleImg).add(offsetImg)
+        )
         return img.addBands(**{"srcImg": scaled, "overwrite": True})
 
     # Adds a synthetic green band.
@@ -3839,7 +4348,7 @@ def goes_timeseries(
     # Show at clouds at night (a-mode)
     def showNighta(img):
         # Make normalized infrared
-        IR_n = img.select("CMI_C13").unitScale(ee.Number(90), ee.Number(313))
+        IR_n = img.select("CMI_C13").unitScale(*_GOES_NIGHT_A_IR_RANGE)
         IR_n = IR_n.expression(
             "ir_p = (1 -IR_n)/1.4",
             {
@@ -3847,21 +4356,34 @@ def goes_timeseries(
             },
         )
 
-        # Add infrared to rgb bands
-        R_ir = img.select("CMI_C02").max(IR_n)
-        G_ir = img.select("CMI_GREEN").max(IR_n)
-        B_ir = img.select("CMI_C01").max(IR_n)
+        # Add infrared to rgb bands. The single-band IR_n is broadcast across all three.
+        rgb_ir = img.select(["CMI_C02", "CMI_GREEN", "CMI_C01"]).max(IR_n)
 
-        return img.addBands([R_ir, G_ir, B_ir], overwrite=True)
+        return img.addBands(rgb_ir, overwrite=True)
 
     # Show at clouds at night (b-mode)
     def showNightb(img):
-        night = img.select("CMI_C03").unitScale(0, 0.016).subtract(1).multiply(-1)
+        night = (
+            img.select("CMI_C03")
+            .unitScale(*_GOES_NIGHT_B_C03_RANGE)
+            .subtract(1)
+            .multiply(-1)
+        )
 
-        cmi11 = img.select("CMI_C11").unitScale(100, 310)
-        cmi13 = img.select("CMI_C13").unitScale(100, 300)
-        cmi15 = img.select("CMI_C15").unitScale(100, 310)
-        iNight = cmi15.addBands([cmi13, cmi11]).clamp(0, 1).subtract(1).multiply(-1)
+        # Unit-scale the C15/C13/C11 stack in one band-wise expression.
+        iNight = (
+            img.expression(
+                "(ir - low) / (high - low)",
+                {
+                    "ir": img.select(["CMI_C15", "CMI_C13", "CMI_C11"]),
+                    "low": ee.Image.constant(_GOES_NIGHT_B_IR_LOW),
+                    "high": ee.Image.constant(_GOES_NIGHT_B_IR_HIGH),
+                },
+            )
+            .clamp(0, 1)
+            .subtract(1)
+            .multiply(-1)
+        )
 
         iRGBNight = iNight.visualize(**{"min": 0, "max": 1, "gamma": 1.4}).updateMask(
             night
@@ -3875,6 +4397,7 @@ def goes_timeseries(
                 "gamma": 1.4,
             }
         )
+        # blend (not a firstNonNull reduction) keeps the fractional night mask as alpha.
         return iRGB.blend(iRGBNight).set(
             "system:time_start", img.get("system:time_start")
         )
@@ -3883,7 +4406,6 @@ def goes_timeseries(
     def scaleForVis(img):
         return (
             img.select(["CMI_C01", "CMI_GREEN", "CMI_C02", "CMI_C03", "CMI_C05"])
-            .resample("bicubic")
             .log10()
             .interpolate([-1.6, 0.176], [0, 1], "clamp")
             .unmask(0)
@@ -3905,6 +4427,14 @@ def goes_timeseries(
     return col.filterDate(start_date, end_date).filterBounds(region).map(processForVis)
 
 
+def _goes_fire_overlay_vis(img):
+    """Blends the joined fire detections ("match") over the CMI true-color image."""
+    cmi = ee.Image(img).visualize(**_CMI_VIS)
+    fdc = ee.Image(ee.Element(img).get("match")).visualize(**_FDC_VIS)
+    # blend (not a firstNonNull reduction) is required to honor the overlay opacity.
+    return cmi.blend(fdc).set("system:time_start", img.get("system:time_start"))
+
+
 def goes_fire_timeseries(
     start_date="2020-09-05T15:00",
     end_date="2020-09-06T02:00",
@@ -3932,31 +4462,22 @@ def goes_fire_timeseries(
         ee.ImageCollection: GOES fire timeseries.
     """
 
-    if data not in ["GOES-16", "GOES-17"]:
+    if data not in _GOES_DATASETS:
         raise ValueError("The data must be either GOES-16 or GOES-17.")
 
-    if scan.lower() not in ["full_disk", "conus"]:
+    if scan.lower() not in _GOES_FDC_SCANS:
         raise ValueError("The scan must be either full_disk or conus.")
 
-    scan_types = {
-        "full_disk": "FDCF",
-        "conus": "FDCC",
-    }
-
     if region is None:
         region = ee.Geometry.BBox(-123.17, 36.56, -118.22, 40.03)
 
     # Get the fire/hotspot characterization dataset.
-    col = ee.ImageCollection(f"NOAA/GOES/{data[-2:]}/{scan_types[scan.lower()]}")
+    col = _goes_collection(data[-2:], _GOES_FDC_SCANS[scan.lower()])
     fdcCol = col.filterDate(start_date, end_date)
 
     # Identify fire-detected pixels of medium to high confidence.
-    fireMaskCodes = [10, 30, 11, 31, 12, 32, 13, 33, 14, 34, 15, 35]
-    confVals = [1.0, 1.0, 0.9, 0.9, 0.8, 0.8, 0.5, 0.5, 0.3, 0.3, 0.1, 0.1]
-    defaultConfVal = 0
-
     def fdcVis(img):
-        confImg = img.remap(fireMaskCodes, confVals, defaultConfVal, "Mask")
+        confImg = img.remap(_FDC_MASK_CODES, _FDC_CONF_VALS, 0, "Mask")
         return (
             confImg.gte(0.3)
             .selfMask()
@@ -3972,26 +4493,79 @@ def goes_fire_timeseries(
         joinFilter = ee.Filter.equals(
             **{"leftField": "system:time_start", "rightField": "system:time_start"}
         )
-        joinedCol = ee.Join.saveFirst("match").apply(geosVisCol, fdcVisCol, joinFilter)
-
-        def overlayVis(img):
-            cmi = ee.Image(img).visualize(
-                **{
-                    "bands": ["CMI_C02", "CMI_GREEN", "CMI_C01"],
-                    "min": 0,
-                    "max": 0.8,
-                    "gamma": 0.8,
-                }
-            )
-            fdc = ee.Image(img.get("match")).visualize(
-                **{"palette": ["ff5349"], "min": 0, "max": 1, "opacity": 0.7}
-            )
-            return cmi.blend(fdc).set("system:time_start", img.get("system:time_start"))
+        join = ee.Join.saveFirst(
+            matchKey="match", ordering="system:time_start", ascending=True
+        )
+        joinedCol = join.apply(geosVisCol, fdcVisCol, joinFilter)
 
-        cmiFdcVisCol = ee.ImageCollection(joinedCol.map(overlayVis))
+        cmiFdcVisCol = ee.ImageCollection(joinedCol.map(_goes_fire_overlay_vis))
         return cmiFdcVisCol
 
 
+def _finalize_text_timelapse(
+    out_gif,
+    xy,
+    text_sequence,
+    font_type,
+    font_size,
+    font_color,
+    add_progress_bar,
+    progress_bar_color,
+    progress_bar_height,
+    frames_per_second,
+    loop,
+    fading,
+):
+    """Adds the animated text to a downloaded timelapse GIF in place, then either fades or shrinks it.
+
+    This is the shared post-processing tail of the GOES and MODIS NDVI timelapses.
+
+    Args:
+        out_gif (str): The timelapse GIF to update in place.
+        xy (tuple): Top left corner of the text.
+        text_sequence (int, str, list, ee.List): Text to be drawn.
+        font_type (str): Font type.
+        font_size (int): Font size.
+        font_color (str): Font color.
+        add_progress_bar (bool): Whether to add a progress bar at the bottom of the GIF.
+        progress_bar_color (str): Color for the progress bar.
+        progress_bar_height (int): Height of the progress bar.
+        frames_per_second (int): Animation speed.
+        loop (int): How many times the animation repeats.
+        fading (int | bool): The fading duration in seconds, or a bool for 1 second/no fading.
+    """
+    add_text_to_gif(
+        out_gif,
+        out_gif,
+        xy,
+        text_sequence,
+        font_type,
+        font_size,
+        font_color,
+        add_progress_bar,
+        progress_bar_color,
+        progress_bar_height,
+        duration=1000 / frames_per_second,
+        loop=loop,
+    )
+
+    if isinstance(fading, bool):
+        fading = int(fading)
+
+    # The text is drawn on frames decoded by Pillow, while the size reduction
+    # and the fading are ffmpeg passes over the file, and the fading blends
+    # neighbouring frames into new ones, so the steps cannot share one decode.
+    # gif_fading re-encodes the GIF with ffmpeg itself, which makes a separate
+    # reduce_gif_size pass redundant when fading.
+    try:
+        if fading > 0:
+            gif_fading(out_gif, out_gif, duration=fading, verbose=False)
+        else:
+            reduce_gif_size(out_gif)
+    except Exception as e:
+        print(e)
+
+
 def goes_timelapse(
     roi=None,
     out_gif=None,
@@ -4019,6 +4593,7 @@ def goes_timelapse(
     overlay_opacity=1.0,
     mp4=False,
     fading=False,
+    wait_mp4=True,
     **kwargs,
 ):
     """Create a timelapse of GOES data. The code is adapted from Justin Braaten's code: https://code.earthengine.google.com/57245f2d3d04233765c42fb5ef19c1f4.
@@ -4043,15 +4618,17 @@ def goes_timelapse(
         add_progress_bar (bool, optional): Whether to add a progress bar at the bottom of the GIF. Defaults to True.
         progress_bar_color (str, optional): Color for the progress bar. Defaults to 'white'.
         progress_bar_height (int, optional): Height of the progress bar. Defaults to 5.        loop (int, optional): controls how many times the animation repeats. The default, 1, means that the animation will play once and then stop (displaying the last frame). A value of 0 means that the animation will repeat forever. Defaults to 0.
-        crs (str, optional): The coordinate reference system to use, e.g., "EPSG:3857". Defaults to None.
+        crs (str, optional): The coordinate reference system to use, e.g., "EPSG:3857". Defaults to None, which uses the native projection of the frames.
         overlay_data (int, str, list, optional): Administrative boundary to be drawn on the timelapse. Defaults to None.
         overlay_color (str, optional): Color for the overlay data. Can be any color name or hex color code. Defaults to 'black'.
         overlay_width (int, optional): Line width of the overlay. Defaults to 1.
         overlay_opacity (float, optional): Opacity of the overlay. Defaults to 1.0.
         mp4 (bool, optional): Whether to save the animation as an mp4 file. Defaults to False.
         fading (int | bool, optional): If True, add fading effect to the timelapse. Defaults to False, no fading. To add fading effect, set it to True (1 second fading duration) or to an integer value (fading duration).
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
     Raises:
         Exception: Raise exception.
+
     """
 
     try:
@@ -4074,10 +4651,9 @@ def goes_timelapse(
                 }
             )
         )
-        if overlay_data is not None:
-            col = add_overlay(
-                col, overlay_data, overlay_color, overlay_width, overlay_opacity
-            )
+        col = _maybe_add_overlay(
+            col, overlay_data, overlay_color, overlay_width, overlay_opacity
+        )
 
         if roi is None:
             roi = ee.Geometry.Polygon(
@@ -4093,9 +4669,6 @@ def goes_timelapse(
                 False,
             )
 
-        if crs is None:
-            crs = col.first().projection()
-
         videoParams = {
             "bands": ["vis-red", "vis-green", "vis-blue"],
             "min": 0,
@@ -4103,17 +4676,22 @@ def goes_timelapse(
             "dimensions": dimensions,
             "framesPerSecond": framesPerSecond,
             "region": roi,
-            "crs": crs,
         }
+        if crs is not None:
+            videoParams["crs"] = crs
 
+        labels = None
         if text_sequence is None:
-            text_sequence = image_dates(col, date_format=date_format).getInfo()
+            labels = image_dates(col, date_format=date_format)
 
-        download_ee_video(col, videoParams, out_gif)
+        dates = _download_video_with_labels(
+            col, videoParams, out_gif, labels, (font_type, font_size)
+        )
+        if dates is not None:
+            text_sequence = dates
 
         if os.path.exists(out_gif):
-            add_text_to_gif(
-                out_gif,
+            _finalize_text_timelapse(
                 out_gif,
                 xy,
                 text_sequence,
@@ -4123,26 +4701,14 @@ def goes_timelapse(
                 add_progress_bar,
                 progress_bar_color,
                 progress_bar_height,
-                duration=1000 / framesPerSecond,
-                loop=loop,
+                framesPerSecond,
+                loop,
+                fading,
             )
 
-            try:
-                reduce_gif_size(out_gif)
-
-                if isinstance(fading, bool):
-                    fading = int(fading)
-                if fading > 0:
-                    gif_fading(out_gif, out_gif, duration=fading, verbose=False)
-
-            except Exception as _:
-                pass
-
-            if mp4:
-                out_mp4 = out_gif.replace(".gif", ".mp4")
-                gif_to_mp4(out_gif, out_mp4)
+            future = _finalize_mp4(out_gif, wait=wait_mp4) if mp4 else None
 
-            return out_gif
+            return out_gif if wait_mp4 else (out_gif, future)
 
     except Exception as e:
         raise Exception(e)
@@ -4174,6 +4740,7 @@ def goes_fire_timelapse(
     overlay_opacity=1.0,
     mp4=False,
     fading=False,
+    wait_mp4=True,
     **kwargs,
 ):
     """Create a timelapse of GOES fire data. The code is adapted from Justin Braaten's code: https://code.earthengine.google.com/8a083a7fb13b95ad4ba148ed9b65475e.
@@ -4198,16 +4765,18 @@ def goes_fire_timelapse(
         progress_bar_color (str, optional): Color for the progress bar. Defaults to 'white'.
         progress_bar_height (int, optional): Height of the progress bar. Defaults to 5.
         loop (int, optional): controls how many times the animation repeats. The default, 1, means that the animation will play once and then stop (displaying the last frame). A value of 0 means that the animation will repeat forever. Defaults to 0.
-        crs (str, optional): The coordinate reference system to use, e.g., "EPSG:3857". Defaults to None.
+        crs (str, optional): The coordinate reference system to use, e.g., "EPSG:3857". Defaults to None, which uses the native projection of the frames.
         overlay_data (int, str, list, optional): Administrative boundary to be drawn on the timelapse. Defaults to None.
         overlay_color (str, optional): Color for the overlay data. Can be any color name or hex color code. Defaults to 'black'.
         overlay_width (int, optional): Width of the overlay. Defaults to 1.
         overlay_opacity (float, optional): Opacity of the overlay. Defaults to 1.0.
         mp4 (bool, optional): Whether to convert the GIF to MP4. Defaults to False.
         fading (int | bool, optional): If True, add fading effect to the timelapse. Defaults to False, no fading. To add fading effect, set it to True (1 second fading duration) or to an integer value (fading duration).
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
 
     Raises:
         Exception: Raise exception.
+
     """
 
     try:
@@ -4221,10 +4790,9 @@ def goes_fire_timelapse(
             roi = ee.Geometry.BBox(-123.17, 36.56, -118.22, 40.03)
 
         col = goes_fire_timeseries(start_date, end_date, data, scan, roi)
-        if overlay_data is not None:
-            col = add_overlay(
-                col, overlay_data, overlay_color, overlay_width, overlay_opacity
-            )
+        col = _maybe_add_overlay(
+            col, overlay_data, overlay_color, overlay_width, overlay_opacity
+        )
 
         # visParams = {
         #     "bands": ["CMI_C02", "CMI_GREEN", "CMI_C01"],
@@ -4236,24 +4804,26 @@ def goes_fire_timelapse(
         #     "crs": col.first().projection(),
         # }
 
-        if crs is None:
-            crs = col.first().projection()
-
         cmiFdcVisParams = {
             "dimensions": dimensions,
             "framesPerSecond": framesPerSecond,
             "region": roi,
-            "crs": crs,
         }
+        if crs is not None:
+            cmiFdcVisParams["crs"] = crs
 
+        labels = None
         if text_sequence is None:
-            text_sequence = image_dates(col, date_format=date_format).getInfo()
+            labels = image_dates(col, date_format=date_format)
 
-        download_ee_video(col, cmiFdcVisParams, out_gif)
+        dates = _download_video_with_labels(
+            col, cmiFdcVisParams, out_gif, labels, (font_type, font_size)
+        )
+        if dates is not None:
+            text_sequence = dates
 
         if os.path.exists(out_gif):
-            add_text_to_gif(
-                out_gif,
+            _finalize_text_timelapse(
                 out_gif,
                 xy,
                 text_sequence,
@@ -4263,30 +4833,24 @@ def goes_fire_timelapse(
                 add_progress_bar,
                 progress_bar_color,
                 progress_bar_height,
-                duration=1000 / framesPerSecond,
-                loop=loop,
+                framesPerSecond,
+                loop,
+                fading,
             )
 
-            try:
-                reduce_gif_size(out_gif)
-                if isinstance(fading, bool):
-                    fading = int(fading)
-                if fading > 0:
-                    gif_fading(out_gif, out_gif, duration=fading, verbose=False)
-
-            except Exception as _:
-                pass
-
-            if mp4:
-                out_mp4 = out_gif.replace(".gif", ".mp4")
-                gif_to_mp4(out_gif, out_mp4)
+            future = _finalize_mp4(out_gif, wait=wait_mp4) if mp4 else None
 
-            return out_gif
+            return out_gif if wait_mp4 else (out_gif, future)
 
     except Exception as e:
         raise Exception(e)
 
 
+# Supported MODIS satellites and vegetation index bands.
+_MODIS_SATELLITES = frozenset(["Terra", "Aqua"])
+_MODIS_VI_BANDS = frozenset(["NDVI", "EVI"])
+
+
 def modis_ndvi_doy_ts(
     data="Terra", band="NDVI", start_date=None, end_date=None, region=None
 ):
@@ -4302,10 +4866,10 @@ def modis_ndvi_doy_ts(
     Returns:
         ee.ImageCollection: The MODIS NDVI time series.
     """
-    if data not in ["Terra", "Aqua"]:
+    if data not in _MODIS_SATELLITES:
         raise Exception("data must be 'Terra' or 'Aqua'.")
 
-    if band not in ["NDVI", "EVI"]:
+    if band not in _MODIS_VI_BANDS:
         raise Exception("band must be 'NDVI' or 'EVI'.")
 
     if region is not None:
@@ -4328,27 +4892,17 @@ def modis_ndvi_doy_ts(
 
     col = col.map(set_doy)
 
-    # Get a collection of distinct images by 'doy'.
-    distinctDOY = col.filterDate("2013-01-01", "2014-01-01")
-
-    # Define a filter that identifies which images from the complete
-    # collection match the DOY from the distinct DOY collection.
-    filter = ee.Filter.equals(**{"leftField": "doy", "rightField": "doy"})
-
-    # Define a join.
-    join = ee.Join.saveAll("doy_matches")
-
-    # Apply the join and convert the resulting FeatureCollection to an
-    # ImageCollection.
-    joinCol = ee.ImageCollection(join.apply(distinctDOY, col, filter))
-
-    # Apply median reduction among matching DOY collections.
+    # Get a collection of distinct images by 'doy', taken from the data itself so
+    # that date ranges not covering a fixed anchor year still yield composites.
+    distinctDOY = col.distinct("doy").sort("doy")
 
+    # Apply median reduction among images sharing the same DOY. Filtering the
+    # collection directly avoids materializing a saveAll join list per image.
     def match_doy(img):
-        doyCol = ee.ImageCollection.fromImages(img.get("doy_matches"))
+        doyCol = col.filter(ee.Filter.eq("doy", img.get("doy")))
         return doyCol.reduce(ee.Reducer.median())
 
-    comp = joinCol.map(match_doy)
+    comp = distinctDOY.map(match_doy)
 
     if region is not None:
         return comp.map(lambda img: img.clip(region))
@@ -4381,6 +4935,7 @@ def modis_ndvi_timelapse(
     overlay_opacity=1.0,
     mp4=False,
     fading=False,
+    wait_mp4=True,
     **kwargs,
 ):
     """Create MODIS NDVI timelapse. The source code is adapted from https://developers.google.com/earth-engine/tutorials/community/modis-ndvi-time-series-animation.
@@ -4410,6 +4965,7 @@ def modis_ndvi_timelapse(
         overlay_opacity (float, optional): Opacity of the overlay. Defaults to 1.0.
         mp4 (bool, optional): Whether to convert the output gif to mp4. Defaults to False.
         fading (int | bool, optional): If True, add fading effect to the timelapse. Defaults to False, no fading. To add fading effect, set it to True (1 second fading duration) or to an integer value (fading duration).
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
 
     """
 
@@ -4458,18 +5014,18 @@ def modis_ndvi_timelapse(
             ],
         }
 
-        # Create RGB visualization images for use as animation frames.
-        rgbVis = col.map(lambda img: img.visualize(**visParams).clip(roi))
+        # Create RGB visualization images for use as animation frames. The frames are
+        # already clipped to roi by modis_ndvi_doy_ts.
+        rgbVis = col.map(lambda img: img.visualize(**visParams))
 
-        if overlay_data is not None:
-            rgbVis = add_overlay(
-                rgbVis,
-                overlay_data,
-                overlay_color,
-                overlay_width,
-                overlay_opacity,
-                roi,
-            )
+        rgbVis = _maybe_add_overlay(
+            rgbVis,
+            overlay_data,
+            overlay_color,
+            overlay_width,
+            overlay_opacity,
+            roi,
+        )
 
         # Define GIF visualization arguments.
         videoArgs = {
@@ -4479,15 +5035,18 @@ def modis_ndvi_timelapse(
             "framesPerSecond": framesPerSecond,
         }
 
-        download_ee_video(rgbVis, videoArgs, out_gif)
-
+        labels = None
         if text_sequence is None:
-            text = rgbVis.aggregate_array("system:index").getInfo()
+            labels = rgbVis.aggregate_array("system:index")
+
+        text = _download_video_with_labels(
+            rgbVis, videoArgs, out_gif, labels, (font_type, font_size)
+        )
+        if text is not None:
             text_sequence = [d.replace("_", "-")[5:] for d in text]
 
         if os.path.exists(out_gif):
-            add_text_to_gif(
-                out_gif,
+            _finalize_text_timelapse(
                 out_gif,
                 xy,
                 text_sequence,
@@ -4497,25 +5056,14 @@ def modis_ndvi_timelapse(
                 add_progress_bar,
                 progress_bar_color,
                 progress_bar_height,
-                duration=1000 / framesPerSecond,
-                loop=loop,
+                framesPerSecond,
+                loop,
+                fading,
             )
 
-            try:
-                reduce_gif_size(out_gif)
-                if isinstance(fading, bool):
-                    fading = int(fading)
-                if fading > 0:
-                    gif_fading(out_gif, out_gif, duration=fading, verbose=False)
-
-            except Exception as _:
-                pass
-
-        if mp4:
-            out_mp4 = out_gif.replace(".gif", ".mp4")
-            gif_to_mp4(out_gif, out_mp4)
+        future = _finalize_mp4(out_gif, wait=wait_mp4) if mp4 else None
 
-        return out_gif
+        return out_gif if wait_mp4 else (out_gif, future)
 
     except Exception as e:
         raise Exception(e)
@@ -4551,7 +5099,7 @@ def modis_ocean_color_timeseries(
         ee.ImageCollection: The timeseries.
     """
 
-    if satellite not in ["Terra", "Aqua"]:
+    if satellite not in _MODIS_SATELLITES:
         raise Exception("Satellite must be 'Terra' or 'Aqua'.")
 
     allowed_frequency = ["year", "quarter", "month", "week", "day"]
@@ -4631,6 +5179,7 @@ def modis_ocean_color_timelapse(
     loop=0,
     mp4=False,
     fading=False,
+    wait_mp4=True,
 ):
     """Creates a ocean color timelapse from MODIS. https://developers.google.com/earth-engine/datasets/catalog/NASA_OCEANDATA_MODIS-Aqua_L3SMI
 
@@ -4680,6 +5229,7 @@ def modis_ocean_color_timelapse(
         loop (int, optional): Controls how many times the animation repeats. The default, 1, means that the animation will play once and then stop (displaying the last frame). A value of 0 means that the animation will repeat forever. Defaults to 0.
         mp4 (bool, optional): Whether to create an mp4 file. Defaults to False.
         fading (int | bool, optional): If True, add fading effect to the timelapse. Defaults to False, no fading. To add fading effect, set it to True (1 second fading duration) or to an integer value (fading duration).
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
 
     Returns:
         str: File path to the timelapse gif.
@@ -4698,50 +5248,51 @@ def modis_ocean_color_timelapse(
         roi = ee.Geometry.BBox(-99.755133, 18.316722, -79.761194, 31.206929)
 
     out_gif = create_timelapse(
-        collection,
-        start_date,
-        end_date,
-        roi,
-        bands,
-        frequency,
-        reducer,
-        date_format,
-        out_gif,
-        palette,
-        vis_params,
-        dimensions,
-        frames_per_second,
-        crs,
-        overlay_data,
-        overlay_color,
-        overlay_width,
-        overlay_opacity,
-        title,
-        title_xy,
-        add_text,
-        text_xy,
-        text_sequence,
-        font_type,
-        font_size,
-        font_color,
-        add_progress_bar,
-        progress_bar_color,
-        progress_bar_height,
-        add_colorbar,
-        colorbar_width,
-        colorbar_height,
-        colorbar_label,
-        colorbar_label_size,
-        colorbar_label_weight,
-        colorbar_tick_size,
-        colorbar_bg_color,
-        colorbar_orientation,
-        colorbar_dpi,
-        colorbar_xy,
-        colorbar_size,
-        loop,
-        mp4,
-        fading,
+        collection=collection,
+        start_date=start_date,
+        end_date=end_date,
+        region=roi,
+        bands=bands,
+        frequency=frequency,
+        reducer=reducer,
+        date_format=date_format,
+        out_gif=out_gif,
+        palette=palette,
+        vis_params=vis_params,
+        dimensions=dimensions,
+        frames_per_second=frames_per_second,
+        crs=crs,
+        overlay_data=overlay_data,
+        overlay_color=overlay_color,
+        overlay_width=overlay_width,
+        overlay_opacity=overlay_opacity,
+        title=title,
+        title_xy=title_xy,
+        add_text=add_text,
+        text_xy=text_xy,
+        text_sequence=text_sequence,
+        font_type=font_type,
+        font_size=font_size,
+        font_color=font_color,
+        add_progress_bar=add_progress_bar,
+        progress_bar_color=progress_bar_color,
+        progress_bar_height=progress_bar_height,
+        add_colorbar=add_colorbar,
+        colorbar_width=colorbar_width,
+        colorbar_height=colorbar_height,
+        colorbar_label=colorbar_label,
+        colorbar_label_size=colorbar_label_size,
+        colorbar_label_weight=colorbar_label_weight,
+        colorbar_tick_size=colorbar_tick_size,
+        colorbar_bg_color=colorbar_bg_color,
+        colorbar_orientation=colorbar_orientation,
+        colorbar_dpi=colorbar_dpi,
+        colorbar_xy=colorbar_xy,
+        colorbar_size=colorbar_size,
+        loop=loop,
+        mp4=mp4,
+        fading=fading,
+        wait_mp4=wait_mp4,
     )
 
     return out_gif
@@ -4802,10 +5353,15 @@ def dynamic_world_timeseries(
         .filter(ee.Filter.lte("CLOUDY_PIXEL_PERCENTAGE", cloud_pct))
     )
 
+    # Keep the ids server-side, and narrow Dynamic World by date and bounds first
+    # so the inList filter only scans candidate images.
     ids = s2.aggregate_array("system:index")
 
-    dw = ee.ImageCollection("GOOGLE/DYNAMICWORLD/V1").filter(
-        ee.Filter.inList("system:index", ids)
+    dw = (
+        ee.ImageCollection("GOOGLE/DYNAMICWORLD/V1")
+        .filterDate(start_date, end_date)
+        .filterBounds(region)
+        .filter(ee.Filter.inList("system:index", ids))
     )
 
     collection = dw.select("label")
@@ -4861,6 +5417,9 @@ def dynamic_world_timeseries(
         # Select probability bands
         probabilityCol = dw.select(probabilityBands)
 
+        # create_timeseries only builds a deferred expression, so the class and
+        # probability timeseries are computed together by the single request that
+        # later fetches the result; there is no round trip here to overlap.
         prob_col = create_timeseries(
             probabilityCol,
             start_date,
@@ -4886,26 +5445,65 @@ def dynamic_world_timeseries(
             return prob_images
 
         elif return_type == "hillshade":
-            count = prob_images.size()
-            nums = ee.List.sequence(0, count.subtract(1))
+            # Pair each class image with its probability image by date once,
+            # instead of indexing both collections through toList() per frame.
+            joined = ee.ImageCollection(
+                ee.Join.saveFirst("prob").apply(
+                    images,
+                    prob_images,
+                    ee.Filter.equals(
+                        leftField="system:time_start", rightField="system:time_start"
+                    ),
+                )
+            )
 
-            def create_hillshade(d):
-                proj = ee.Projection("EPSG:3857").atScale(10)
-                img = ee.Image(images.toList(images.size()).get(d))
-                prob_img = ee.Image(prob_images.toList(prob_images.size()).get(d))
+            proj = ee.Projection("EPSG:3857").atScale(10)
+            percent = ee.Image.constant(100)
+            max_byte = ee.Image.constant(255)
+
+            def create_hillshade(img):
+                prob_img = ee.Image(img.get("prob"))
                 prob_img = prob_img.setDefaultProjection(proj)
-                top1Confidence = prob_img.multiply(100).int()
-                hillshade = ee.Terrain.hillshade(top1Confidence).divide(255)
-                rgbImage = img.visualize(**dwVisParams).divide(255)
+                top1Confidence = prob_img.multiply(percent).int()
+                hillshade = ee.Terrain.hillshade(top1Confidence).divide(max_byte)
+                rgbImage = img.visualize(**dwVisParams).divide(max_byte)
                 probabilityHillshade = rgbImage.multiply(hillshade)
                 return probabilityHillshade.set(
                     "system:time_start", img.get("system:time_start")
                 )
 
-            result = ee.ImageCollection(nums.map(create_hillshade))
+            result = joined.map(create_hillshade)
             return result
 
 
+def _sentinel1_collection(roi, start, end, orbit, band, **kwargs):
+    """Builds the filtered Sentinel-1 collection used by the Sentinel-1 timelapses.
+
+    Args:
+        roi (ee.Geometry): The region to use to filter the collection of images.
+        start (str): The start date, e.g., '2015-01-01'.
+        end (str): The end date, e.g., '2024-12-31'.
+        orbit (list): Orbit directions to include, e.g., ["ascending", "descending"].
+        band (str): The band passed to sentinel1_filtering().
+        **kwargs: Arguments for sentinel1_filtering().
+
+    Returns:
+        ee.ImageCollection: The filtered Sentinel-1 collection.
+    """
+    collection = (
+        ee.ImageCollection("COPERNICUS/S1_GRD").filterDate(start, end).filterBounds(roi)
+    )
+
+    # Apply orbit filtering
+    if orbit:
+        # Convert orbit strings to uppercase for consistency
+        orbit_upper = [o.upper() for o in orbit]
+        orbit_filter = ee.Filter.inList("orbitProperties_pass", orbit_upper)
+        collection = collection.filter(orbit_filter)
+
+    return sentinel1_filtering(collection, band, **kwargs)
+
+
 def sentinel1_timelapse(
     roi,
     out_gif=None,
@@ -4953,6 +5551,8 @@ def sentinel1_timelapse(
     loop=0,
     mp4=False,
     fading=False,
+    collection=None,
+    wait_mp4=True,
     **kwargs,
 ):
     """Create a timelapse from any ee.ImageCollection.
@@ -5005,6 +5605,8 @@ def sentinel1_timelapse(
         loop (int, optional): Controls how many times the animation repeats. The default, 1, means that the animation will play once and then stop (displaying the last frame). A value of 0 means that the animation will repeat forever. Defaults to 0.
         mp4 (bool, optional): Whether to create an mp4 file. Defaults to False.
         fading (int | bool, optional): If True, add fading effect to the timelapse. Defaults to False, no fading. To add fading effect, set it to True (1 second fading duration) or to an integer value (fading duration).
+        collection (ee.ImageCollection, optional): A Sentinel-1 collection already filtered by date, roi, orbit and sentinel1_filtering(), e.g., to share it with sampling. Defaults to None, which builds it from the other arguments.
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
         **kwargs: Arguments for sentinel1_filtering(). Same filters will be applied to all bands.
 
     Returns:
@@ -5035,76 +5637,68 @@ def sentinel1_timelapse(
     if vis_params is None:
         vis_params = {"min": -30, "max": 0}
 
-    collection = (
-        ee.ImageCollection("COPERNICUS/S1_GRD").filterDate(start, end).filterBounds(roi)
+    if collection is None:
+        collection = _sentinel1_collection(roi, start, end, orbit, band, **kwargs)
+
+    return create_timelapse(
+        collection=collection,
+        start_date=start,
+        end_date=end,
+        region=roi,
+        bands=bands,
+        frequency=frequency,
+        reducer=reducer,
+        date_format=date_format,
+        out_gif=out_gif,
+        palette=palette,
+        vis_params=vis_params,
+        dimensions=dimensions,
+        frames_per_second=frames_per_second,
+        crs=crs,
+        overlay_data=overlay_data,
+        overlay_color=overlay_color,
+        overlay_width=overlay_width,
+        overlay_opacity=overlay_opacity,
+        title=title,
+        title_xy=title_xy,
+        add_text=add_text,
+        text_xy=text_xy,
+        text_sequence=text_sequence,
+        font_type=font_type,
+        font_size=font_size,
+        font_color=font_color,
+        add_progress_bar=add_progress_bar,
+        progress_bar_color=progress_bar_color,
+        progress_bar_height=progress_bar_height,
+        add_colorbar=add_colorbar,
+        colorbar_width=colorbar_width,
+        colorbar_height=colorbar_height,
+        colorbar_label=colorbar_label,
+        colorbar_label_size=colorbar_label_size,
+        colorbar_label_weight=colorbar_label_weight,
+        colorbar_tick_size=colorbar_tick_size,
+        colorbar_bg_color=colorbar_bg_color,
+        colorbar_orientation=colorbar_orientation,
+        colorbar_dpi=colorbar_dpi,
+        colorbar_xy=colorbar_xy,
+        colorbar_size=colorbar_size,
+        loop=loop,
+        mp4=mp4,
+        fading=fading,
+        wait_mp4=wait_mp4,
     )
 
-    # Apply orbit filtering
-    if orbit:
-        # Convert orbit strings to uppercase for consistency
-        orbit_upper = [o.upper() for o in orbit]
-        orbit_filter = ee.Filter.inList("orbitProperties_pass", orbit_upper)
-        collection = collection.filter(orbit_filter)
 
-    collection = sentinel1_filtering(collection, band, **kwargs)
-
-    return create_timelapse(
-        collection,
-        start,
-        end,
-        roi,
-        bands,
-        frequency,
-        reducer,
-        date_format,
-        out_gif,
-        palette,
-        vis_params,
-        dimensions,
-        frames_per_second,
-        crs,
-        overlay_data,
-        overlay_color,
-        overlay_width,
-        overlay_opacity,
-        title,
-        title_xy,
-        add_text,
-        text_xy,
-        text_sequence,
-        font_type,
-        font_size,
-        font_color,
-        add_progress_bar,
-        progress_bar_color,
-        progress_bar_height,
-        add_colorbar,
-        colorbar_width,
-        colorbar_height,
-        colorbar_label,
-        colorbar_label_size,
-        colorbar_label_weight,
-        colorbar_tick_size,
-        colorbar_bg_color,
-        colorbar_orientation,
-        colorbar_dpi,
-        colorbar_xy,
-        colorbar_size,
-        loop,
-        mp4,
-        fading,
-    )
-
-
-def add_progress_bar_to_gif(
-    in_gif,
-    out_gif,
-    progress_bar_color="blue",
-    progress_bar_height=5,
-    duration=100,
-    loop=0,
-):
-    """Adds a progress bar to a GIF image.
+def add_progress_bar_to_gif(
+    in_gif,
+    out_gif,
+    progress_bar_color="blue",
+    progress_bar_height=5,
+    duration=100,
+    loop=0,
+    mp4=False,
+):
+    """Adds a progress bar to a GIF image.
 
     Args:
         in_gif (str): The file path to the input GIF image.
@@ -5113,12 +5707,14 @@ def add_progress_bar_to_gif(
         progress_bar_height (int, optional): Height of the progress bar. Defaults to 5.
         duration (int, optional): controls how long each frame will be displayed for, in milliseconds. It is the inverse of the frame rate. Setting it to 100 milliseconds gives 10 frames per second. You can decrease the duration to give a smoother animation.. Defaults to 100.
         loop (int, optional): controls how many times the animation repeats. The default, 1, means that the animation will play once and then stop (displaying the last frame). A value of 0 means that the animation will repeat forever. Defaults to 0.
+        mp4 (bool, optional): Whether to also encode the frames into an MP4 next to the output GIF. Defaults to False.
 
     """
-    import io
     import warnings
+    from concurrent.futures import ThreadPoolExecutor
 
-    from PIL import Image, ImageDraw, ImageSequence
+    import numpy as np
+    from PIL import Image, ImageColor, ImageSequence
 
     warnings.simplefilter("ignore")
 
@@ -5129,8 +5725,7 @@ def add_progress_bar_to_gif(
         print("The input gif file does not exist.")
         return
 
-    if not os.path.exists(os.path.dirname(out_gif)):
-        os.makedirs(os.path.dirname(out_gif))
+    os.makedirs(os.path.dirname(out_gif), exist_ok=True)
 
     progress_bar_color = check_color(progress_bar_color)
 
@@ -5141,40 +5736,157 @@ def add_progress_bar_to_gif(
 
     count = image.n_frames
     W, H = image.size
-    progress_bar_widths = [i * 1.0 / count * W for i in range(1, count + 1)]
-    progress_bar_shapes = [
-        [(0, H - progress_bar_height), (x, H)] for x in progress_bar_widths
-    ]
+    bar_rgb = np.array(ImageColor.getrgb(progress_bar_color)[:3], dtype=np.uint8)
+    progress_bar_widths = np.linspace(0, W, count + 1)[1:].round().astype(np.int32)
+
+    def add_bar(index, frame):
+        # Paint the progress bar directly into the frame's pixel buffer
+        arr = np.array(frame if frame.mode == "RGB" else frame.convert("RGB"))
+        arr[H - progress_bar_height : H, : progress_bar_widths[index]] = bar_rgb
+        return Image.fromarray(arr, mode="RGB")
+
+    def painted_frames():
+        # Frames must be decoded in order, but the RGB conversion and painting of
+        # each decoded copy are independent and release the GIL. Only one batch of
+        # RGB frames per worker exists at a time; Pillow's GIF writer still keeps
+        # every palettized output frame until the file is written.
+        workers = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batch = []
+            for index, frame in enumerate(ImageSequence.Iterator(image)):
+                batch.append(executor.submit(add_bar, index, frame.copy()))
+                if len(batch) == workers:
+                    yield from (future.result() for future in batch)
+                    batch = []
+            yield from (future.result() for future in batch)
+
+    # The input is read lazily while the output is written, so write to a
+    # temporary file when updating the GIF in place.
+    tmp_gif = out_gif.replace(".gif", "_tmp.gif") if out_gif == in_gif else out_gif
+    use_gifsicle = is_tool("gifsicle")
+
+    mp4_writer = None
+    if mp4:
+        if is_tool("ffmpeg"):
+            # Encode the painted frames as they are written to the GIF, rather
+            # than decoding the finished GIF again with gif_to_mp4.
+            out_mp4 = out_gif.replace(".gif", ".mp4")
+            mp4_writer = _mp4_pipe(out_mp4, W, H, 1000 / duration)
+        else:
+            print("ffmpeg is not installed on your computer.")
 
-    try:
-        frames = []
-        # Loop over each frame in the animated image
-        for index, frame in enumerate(ImageSequence.Iterator(image)):
-            # Draw the text on the frame
-            frame = frame.convert("RGB")
-            draw = ImageDraw.Draw(frame)
-            # w, h = draw.textsize(text[index])
-            draw.rectangle(progress_bar_shapes[index], fill=progress_bar_color)
-            del draw
+    def tee_mp4(frames):
+        for frame in frames:
+            if mp4_writer is not None:
+                mp4_writer.stdin.write(frame.tobytes())
+            yield frame
 
-            b = io.BytesIO()
-            frame.save(b, format="GIF")
-            frame = Image.open(b)
-
-            frames.append(frame)
+    try:
+        if count * W * H * 3 < 512 * 1024 * 1024:
+            # Small GIFs are decoded once into a single array and painted in place.
+            stack = np.stack(
+                [
+                    np.asarray(frame if frame.mode == "RGB" else frame.convert("RGB"))
+                    for frame in ImageSequence.Iterator(image)
+                ]
+            )
+            for index, width in enumerate(progress_bar_widths):
+                stack[index, H - progress_bar_height : H, :width] = bar_rgb
+            frames = (Image.fromarray(arr, mode="RGB") for arr in stack)
+        else:
+            frames = painted_frames()
+        frames = tee_mp4(frames)
         # https://www.pythoninformer.com/python-libraries/pillow/creating-animated-gif/
-        # Save the frames as a new image
-
-        frames[0].save(
-            out_gif,
+        # Save the frames as a new image. Pillow's GIF writer skips a frame that
+        # is identical to the previous one and adds its duration to that frame,
+        # so repeated frames are not re-encoded.
+        next(frames).save(
+            tmp_gif,
             save_all=True,
-            append_images=frames[1:],
+            append_images=frames,
             duration=duration,
             loop=loop,
-            optimize=True,
+            optimize=not use_gifsicle,
         )
     except Exception as e:
         raise Exception(e)
+    finally:
+        image.close()
+        if mp4_writer is not None:
+            mp4_writer.stdin.close()
+            mp4_writer.wait()
+
+    if tmp_gif != out_gif:
+        os.replace(tmp_gif, out_gif)
+
+    if use_gifsicle:
+        _gifsicle_optimize(out_gif)
+
+    if mp4_writer is not None and not os.path.exists(out_mp4):
+        raise Exception(f"Failed to create mp4 file.")
+
+
+_vector_frame_state = {}
+
+
+def _init_vector_frame_worker(gdf, colname, frame_args):
+    """Initializes a vector_to_gif worker process.
+
+    Args:
+        gdf (geopandas.GeoDataFrame): The GeoDataFrame, sorted by colname.
+        colname (str): The column used to select the features of each frame.
+        frame_args (dict): The plotting options shared by all frames.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    _vector_frame_state.update(frame_args)
+    _vector_frame_state["gdf"] = gdf
+    _vector_frame_state["sorted_values"] = gdf[colname].to_numpy()
+    # Each worker draws all of its frames on one Agg figure, created at the
+    # output dpi and kept outside of pyplot's global figure manager.
+    fig = Figure(figsize=frame_args["figsize"], dpi=frame_args["dpi"])
+    FigureCanvasAgg(fig)
+    _vector_frame_state["fig"] = fig
+    _vector_frame_state["ax"] = fig.subplots()
+
+
+def _render_vector_frame(v):
+    """Renders the vector_to_gif frame with all features whose value is <= v.
+
+    Args:
+        v (int | float): The value of the frame.
+
+    Returns:
+        int | float: The value of the rendered frame.
+    """
+    import numpy as np
+
+    state = _vector_frame_state
+    fig, ax = state["fig"], state["ax"]
+    bbox = state["bbox"]
+    fontsize = state["fontsize"]
+
+    ax.cla()
+    # Remove axes added by the previous frame, e.g., a legend colorbar.
+    for extra_ax in fig.axes[1:]:
+        extra_ax.remove()
+
+    end = np.searchsorted(state["sorted_values"], v, side="right")
+    yrdf = state["gdf"].iloc[:end]
+    yrdf.plot(ax=ax, facecolor=state["facecolor"], **state["plot_args"])
+    ax.set_title(state["title"], fontsize=fontsize)
+    ax.set_axis_off()
+    ax.set_xlim([bbox[0], bbox[2]])
+    ax.set_ylim([bbox[1], bbox[3]])
+    if state["add_text"]:
+        ax.text(*state["xy"], v, fontsize=fontsize)
+    fig.tight_layout(pad=state["padding"])
+    # The PNG is only read back by png_to_gif, so favor write speed over size
+    fig.canvas.print_png(
+        state["tmp_dir"] + os.sep + "%s.png" % v, pil_kwargs={"compress_level": 1}
+    )
+    return v
 
 
 def vector_to_gif(
@@ -5202,6 +5914,7 @@ def vector_to_gif(
     verbose=True,
     open_args={},
     plot_args={},
+    processes=None,
 ):
     """Convert a vector to a gif. This function was inspired by by Johannes Uhl's shapefile2gif repo at
             https://github.com/johannesuhl/shapefile2gif. Credits to Johannes Uhl.
@@ -5231,15 +5944,19 @@ def vector_to_gif(
         verbose (bool, optional): Whether to print the progress. Defaults to True.
         open_args (dict, optional): The arguments for the geopandas.read_file() function. Defaults to {}.
         plot_args (dict, optional): The arguments for the geopandas.GeoDataFrame.plot() function. Defaults to {}.
+        processes (int, optional): The number of worker processes to render the frames with. Process pools re-import the caller's module under the spawn start method and require an ``if __name__ == "__main__"`` guard in scripts, so the frames are rendered in the current process unless this is greater than 1. Defaults to None.
 
     """
+    import itertools
+    from concurrent.futures import ProcessPoolExecutor
+
     import geopandas as gpd
-    import matplotlib.pyplot as plt
+    import numpy as np
+    from PIL import Image, ImageColor
 
     out_dir = os.path.dirname(out_gif)
     tmp_dir = os.path.join(out_dir, "tmp_png")
-    if not os.path.exists(tmp_dir):
-        os.makedirs(tmp_dir)
+    os.makedirs(tmp_dir, exist_ok=True)
 
     if isinstance(filename, str):
         gdf = gpd.read_file(filename, **open_args)
@@ -5257,8 +5974,7 @@ def vector_to_gif(
             f"{colname} is not in the columns of the GeoDataFrame. It must be one of {gdf.columns}"
         )
 
-    values = gdf[colname].unique().tolist()
-    values.sort()
+    values = np.unique(gdf[colname].to_numpy()).tolist()
 
     if vmin is None:
         vmin = values[0]
@@ -5276,7 +5992,7 @@ def vector_to_gif(
     elif (xy is not None) and (not isinstance(xy, tuple)) and (len(xy) == 2):
         raise Exception("xy must be a tuple, e.g., (10, 10), ('10%', '10%')")
 
-    elif all(isinstance(item, int) for item in xy) and (len(xy) == 2):
+    elif len(xy) == 2 and isinstance(xy[0], int) and isinstance(xy[1], int):
         x, y = xy
         if (x > 0) and (x < W) and (y > 0) and (y < H):
             pass
@@ -5285,7 +6001,7 @@ def vector_to_gif(
                 f"xy is out of bounds. x must be within [0, {W}], and y must be within [0, {H}]"
             )
             return
-    elif all(isinstance(item, str) for item in xy) and (len(xy) == 2):
+    elif len(xy) == 2 and isinstance(xy[0], str) and isinstance(xy[1], str):
         x, y = xy
         if ("%" in x) and ("%" in y):
             try:
@@ -5303,38 +6019,101 @@ def vector_to_gif(
     x = bbox[0] + x
     y = bbox[1] + y
 
-    for index, v in enumerate(options):
-        if verbose:
-            print(f"Processing {index+1}/{len(options)}: {v}...")
-        yrdf = gdf[gdf[colname] <= v]
-        fig, ax = plt.subplots()
-        ax = yrdf.plot(facecolor=facecolor, figsize=figsize, **plot_args)
-        ax.set_title(title, fontsize=fontsize)
-        ax.set_axis_off()
-        ax.set_xlim([bbox[0], bbox[2]])
-        ax.set_ylim([bbox[1], bbox[3]])
-        if add_text:
-            ax.text(x, y, v, fontsize=fontsize)
-        fig = ax.get_figure()
-        plt.tight_layout(pad=padding)
-        fig.savefig(tmp_dir + os.sep + "%s.png" % v, dpi=dpi)
-        plt.clf()
-        plt.close("all")
+    # Each frame shows every feature with a value <= v, so sort once and take a
+    # prefix per frame instead of scanning the whole column for every frame.
+    gdf = gdf.sort_values(colname, kind="stable")
+
+    frame_args = {
+        "tmp_dir": tmp_dir,
+        "bbox": bbox,
+        "facecolor": facecolor,
+        "figsize": figsize,
+        "padding": padding,
+        "title": title,
+        "add_text": add_text,
+        "xy": (x, y),
+        "fontsize": fontsize,
+        "dpi": dpi,
+        "plot_args": plot_args,
+    }
 
-    png_to_gif(tmp_dir, out_gif, fps=fps, loop=loop)
+    # Rendering is CPU-bound Python in matplotlib and holds the GIL, so on
+    # request the frames are rendered in worker processes that each receive the
+    # GeoDataFrame once.
+    count = len(options)
+    workers = min(processes or 1, count)
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_vector_frame_worker,
+            initargs=(gdf, colname, frame_args),
+        ) as executor:
+            for index, v in enumerate(executor.map(_render_vector_frame, options)):
+                if verbose:
+                    print(f"Processing {index+1}/{count}: {v}...")
+    else:
+        _init_vector_frame_worker(gdf, colname, frame_args)
+        try:
+            for index, v in enumerate(map(_render_vector_frame, options)):
+                if verbose:
+                    print(f"Processing {index+1}/{count}: {v}...")
+        finally:
+            _vector_frame_state.clear()
+
+    # Encode the GIF (and MP4) in a single pass over the rendered frames, painting
+    # the progress bar into each frame instead of re-reading the finished GIF.
+    bar_rgb = np.array(
+        ImageColor.getrgb(check_color(progress_bar_color))[:3], dtype=np.uint8
+    )
 
-    if add_progress_bar:
-        add_progress_bar_to_gif(
-            out_gif,
+    def rendered_frames():
+        for index, v in enumerate(options):
+            with Image.open(os.path.join(tmp_dir, "%s.png" % v)) as png:
+                arr = np.array(png.convert("RGB"))
+            if add_progress_bar:
+                H, W = arr.shape[:2]
+                bar_width = round(W * (index + 1) / count)
+                arr[H - progress_bar_height : H, :bar_width] = bar_rgb
+            yield Image.fromarray(arr, mode="RGB")
+
+    frames = rendered_frames()
+    first_frame = next(frames)
+
+    mp4_writer = None
+    if mp4:
+        if is_tool("ffmpeg"):
+            out_mp4 = out_gif.replace(".gif", ".mp4")
+            mp4_writer = _mp4_pipe(out_mp4, *first_frame.size, fps)
+        else:
+            print("ffmpeg is not installed on your computer.")
+
+    def tee_mp4(frames):
+        for frame in frames:
+            if mp4_writer is not None:
+                mp4_writer.stdin.write(frame.tobytes())
+            yield frame
+
+    frames = tee_mp4(itertools.chain([first_frame], frames))
+    use_gifsicle = is_tool("gifsicle")
+    try:
+        next(frames).save(
             out_gif,
-            progress_bar_color,
-            progress_bar_height,
+            save_all=True,
+            append_images=frames,
             duration=1000 / fps,
             loop=loop,
+            optimize=not use_gifsicle,
         )
+    finally:
+        if mp4_writer is not None:
+            mp4_writer.stdin.close()
+            mp4_writer.wait()
 
-    if mp4:
-        gif_to_mp4(out_gif, out_gif.replace(".gif", ".mp4"))
+    if use_gifsicle:
+        _gifsicle_optimize(out_gif)
+
+    if mp4_writer is not None and not os.path.exists(out_mp4):
+        raise Exception(f"Failed to create mp4 file.")
 
     if not keep_png:
         shutil.rmtree(tmp_dir)
@@ -5343,6 +6122,61 @@ def vector_to_gif(
         print(f"Done. The GIF is saved to {out_gif}.")
 
 
+# Default colors of the sample point markers and chart series, one per point.
+_SAMPLE_MARKER_COLORS = ("red", "blue", "green", "orange", "purple")
+
+
+def _bounds_from_ring(ring):
+    """Computes the bounding box of a ring of [lon, lat] coordinates.
+
+    Args:
+        ring (list): The ring coordinates, e.g., the first ring of roi.bounds().getInfo()["coordinates"].
+
+    Returns:
+        list: The bounds as [min_lon, min_lat, max_lon, max_lat].
+    """
+    # ee.Geometry.bounds() returns an axis-aligned box ordered [SW, SE, NE, NW, SW],
+    # so the extremes are the first and third vertices.
+    if len(ring) == 5:
+        (west, south), (east, north) = ring[0][:2], ring[2][:2]
+        if (
+            west <= east
+            and south <= north
+            and list(ring[1][:2]) == [east, south]
+            and list(ring[3][:2]) == [west, north]
+        ):
+            return [west, south, east, north]
+
+    import numpy as np
+
+    coords = np.asarray(ring, dtype=float)[:, :2]
+    return [*coords.min(axis=0).tolist(), *coords.max(axis=0).tolist()]
+
+
+# Bounds of the ROIs fetched by _roi_bounds, keyed by their serialized geometry.
+_roi_bounds_cache = {}
+
+
+def _roi_bounds(roi):
+    """Fetches the bounds of an ROI, reusing the result for the same geometry.
+
+    Args:
+        roi (ee.Geometry): The region of interest.
+
+    Returns:
+        list: The bounds as [min_lon, min_lat, max_lon, max_lat].
+    """
+    # The serialized graph identifies the geometry, so repeated timelapses over
+    # the same ROI in a session skip the getInfo() round trip.
+    key = ee.serializer.toJSON(roi)
+    if key not in _roi_bounds_cache:
+        if len(_roi_bounds_cache) >= 32:
+            _roi_bounds_cache.pop(next(iter(_roi_bounds_cache)))
+        ring = roi.bounds().getInfo()["coordinates"][0]
+        _roi_bounds_cache[key] = _bounds_from_ring(ring)
+    return list(_roi_bounds_cache[key])
+
+
 def sentinel1_timelapse_with_samples(
     roi,
     out_gif=None,
@@ -5403,6 +6237,7 @@ def sentinel1_timelapse_with_samples(
     spacer_width=20,
     chart_xlabel_format="auto",
     chart_xlabel_interval="auto",
+    wait_mp4=True,
     **kwargs,
 ):
     """Create a Sentinel-1 timelapse with optional sample points and time series chart.
@@ -5467,6 +6302,7 @@ def sentinel1_timelapse_with_samples(
         spacer_width (int, optional): Width of spacer between gif and chart. Defaults to 20.
         chart_xlabel_format (str, optional): Format for x-axis labels ('auto', '%Y-%m', '%m-%d', '%Y-%m-%d'). Defaults to 'auto'.
         chart_xlabel_interval (str, optional): Interval for x-axis labels ('auto', 'day', 'week', 'month', 'year'). Defaults to 'auto'.
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
         **kwargs: Additional arguments for sentinel1_filtering().
 
     Returns:
@@ -5490,21 +6326,19 @@ def sentinel1_timelapse_with_samples(
 
     # Set default marker colors if not provided
     if sample_points is not None and marker_colors is None:
-        marker_colors = ["red", "blue", "green", "orange", "purple"][
-            : len(sample_points)
-        ]
+        marker_colors = list(_SAMPLE_MARKER_COLORS[: len(sample_points)])
     elif sample_points is not None and len(marker_colors) < len(sample_points):
-        default_colors = ["red", "blue", "green", "orange", "purple"]
-        marker_colors.extend(default_colors[len(marker_colors) : len(sample_points)])
+        marker_colors.extend(
+            _SAMPLE_MARKER_COLORS[len(marker_colors) : len(sample_points)]
+        )
+
+    # Adjust dimensions to avoid Earth Engine limits. Dimensions given in WxH
+    # format are used as is.
+    adjusted_dimensions = dimensions
 
-    # Adjust dimensions to avoid Earth Engine limits
     # Calculate optimal dimensions based on ROI
-    if isinstance(roi, ee.Geometry):
-        roi_bounds = roi.bounds().getInfo()["coordinates"][0]
-        min_lon = min([coord[0] for coord in roi_bounds])
-        max_lon = max([coord[0] for coord in roi_bounds])
-        min_lat = min([coord[1] for coord in roi_bounds])
-        max_lat = max([coord[1] for coord in roi_bounds])
+    if isinstance(roi, ee.Geometry) and isinstance(dimensions, int):
+        min_lon, min_lat, max_lon, max_lat = _roi_bounds(roi)
 
         # Calculate aspect ratio
         lon_range = max_lon - min_lon
@@ -5515,35 +6349,44 @@ def sentinel1_timelapse_with_samples(
         # Max pixels = 26,214,400 (approximately 5120x5120)
         max_pixels = 26214400
 
-        if isinstance(dimensions, int):
-            # Single dimension - calculate based on aspect ratio
-            if aspect_ratio > 1:
-                # Wider than tall
-                width = min(dimensions, int(math.sqrt(max_pixels * aspect_ratio)))
-                height = int(width / aspect_ratio)
-            else:
-                # Taller than wide
-                height = min(dimensions, int(math.sqrt(max_pixels / aspect_ratio)))
-                width = int(height * aspect_ratio)
+        # Single dimension - calculate based on aspect ratio
+        if aspect_ratio > 1:
+            # Wider than tall
+            width = min(dimensions, int(math.sqrt(max_pixels * aspect_ratio)))
+            height = int(width / aspect_ratio)
+        else:
+            # Taller than wide
+            height = min(dimensions, int(math.sqrt(max_pixels / aspect_ratio)))
+            width = int(height * aspect_ratio)
 
-            # Ensure minimum size
-            width = max(256, width)
-            height = max(256, height)
+        # Ensure minimum size
+        width = max(256, width)
+        height = max(256, height)
 
-            # Final check
-            if width * height > max_pixels:
-                scale_factor = math.sqrt(max_pixels / (width * height))
-                width = int(width * scale_factor)
-                height = int(height * scale_factor)
+        # Final check
+        if width * height > max_pixels:
+            scale_factor = math.sqrt(max_pixels / (width * height))
+            width = int(width * scale_factor)
+            height = int(height * scale_factor)
 
-            adjusted_dimensions = f"{width}x{height}"
-        else:
-            # Already in WxH format
-            adjusted_dimensions = dimensions
+        adjusted_dimensions = f"{width}x{height}"
 
         print(f"Adjusted dimensions: {adjusted_dimensions}")
-    else:
-        adjusted_dimensions = dimensions
+
+    # Build the filtered collection once and share it between the base timelapse
+    # and the sampling below. Order dual-polarization bands as sentinel1_timelapse
+    # expects, without modifying the caller's list.
+    if bands in (["VH", "VV"], ["HV", "HH"]):
+        bands = bands[::-1]
+    band = bands[0]
+
+    if end_year is None:
+        end_year = date.today().year
+
+    start = f"{start_year}-{start_date}"
+    end = f"{end_year}-{end_date}"
+
+    collection = _sentinel1_collection(roi, start, end, orbit, band, **kwargs)
 
     # Create the base timelapse
     try:
@@ -5594,7 +6437,7 @@ def sentinel1_timelapse_with_samples(
             loop=loop,
             mp4=False,
             fading=fading,
-            **kwargs,
+            collection=collection,
         )
     except Exception as e:
         print(f"Error creating base timelapse: {str(e)}")
@@ -5607,42 +6450,18 @@ def sentinel1_timelapse_with_samples(
     # If no sample points, return the base gif (map only)
     if sample_points is None or len(sample_points) == 0:
         print("No sample points provided. Returning map-only timelapse.")
-        if mp4:
-            gif_to_mp4(base_gif, base_gif.replace(".gif", ".mp4"))
-        return base_gif
+        future = _finalize_mp4(base_gif, wait=wait_mp4) if mp4 else None
+        return base_gif if wait_mp4 else (base_gif, future)
 
     # Get the Sentinel-1 time series for sampling
-    if end_year is None:
-        end_year = date.today().year
-
-    start = f"{start_year}-{start_date}"
-    end = f"{end_year}-{end_date}"
-
-    # Create collection with error handling
     try:
-        collection = (
-            ee.ImageCollection("COPERNICUS/S1_GRD")
-            .filterDate(start, end)
-            .filterBounds(roi)
-        )
-
-        # Apply orbit filtering
-        if orbit:
-            orbit_upper = [o.upper() for o in orbit]
-            orbit_filter = ee.Filter.inList("orbitProperties_pass", orbit_upper)
-            collection = collection.filter(orbit_filter)
-
-        band = bands[0]
-        collection = sentinel1_filtering(collection, band, **kwargs)
-
         # Check if collection is empty
         collection_size = collection.size().getInfo()
         if collection_size == 0:
             print("Warning: No Sentinel-1 images found for the specified parameters")
             # Return base gif without sampling
-            if mp4:
-                gif_to_mp4(base_gif, base_gif.replace(".gif", ".mp4"))
-            return base_gif
+            future = _finalize_mp4(base_gif, wait=wait_mp4) if mp4 else None
+            return base_gif if wait_mp4 else (base_gif, future)
 
         print(f"Found {collection_size} Sentinel-1 images for sampling")
 
@@ -5661,22 +6480,11 @@ def sentinel1_timelapse_with_samples(
             1,
         )
 
-        # Check if time series is empty
-        ts_size = ts_collection.size().getInfo()
-        if ts_size == 0:
-            print("Warning: No time series data generated")
-            if mp4:
-                gif_to_mp4(base_gif, base_gif.replace(".gif", ".mp4"))
-            return base_gif
-
-        print(f"Generated {ts_size} time series images")
-
     except Exception as e:
         print(f"Error creating time series: {str(e)}")
         # Return base gif without sampling
-        if mp4:
-            gif_to_mp4(base_gif, base_gif.replace(".gif", ".mp4"))
-        return base_gif
+        future = _finalize_mp4(base_gif, wait=wait_mp4) if mp4 else None
+        return base_gif if wait_mp4 else (base_gif, future)
 
     # Sample points from the time series
     sample_data = {}
@@ -5692,54 +6500,71 @@ def sentinel1_timelapse_with_samples(
 
                 point_geometries.append(geometry)
 
-                # Sample the time series at this point
-                def sample_point(image):
-                    sampled = image.sample(geometry, 30)
-                    return sampled.first().set(
+            points_fc = ee.FeatureCollection(
+                [
+                    ee.Feature(geometry, {"point_index": i})
+                    for i, geometry in enumerate(point_geometries)
+                ]
+            )
+            first_reducer = ee.Reducer.first().setOutputs([band])
+
+            # Sample all points in every time series image on the server
+            def sample_points_in_image(image):
+                samples = image.select(band).reduceRegions(points_fc, first_reducer, 30)
+                return samples.map(
+                    lambda feature: feature.set(
                         {
-                            "system:time_start": image.get("system:time_start"),
-                            "system:date": image.get("system:date"),
+                            "time_start": image.get("system:time_start"),
+                            "date": image.get("system:date"),
                         }
                     )
+                )
 
-                sampled = ts_collection.map(sample_point)
+            # Fetch the samples of all points and dates in a single request
+            features = (
+                ts_collection.map(sample_points_in_image)
+                .flatten()
+                .select(["point_index", "time_start", "date", band], None, False)
+                .getInfo()["features"]
+            )
 
-                # Get the time series data with error handling
-                try:
-                    time_series = sampled.aggregate_array("system:time_start").getInfo()
-                    values = sampled.aggregate_array(band).getInfo()
-                    dates = sampled.aggregate_array("system:date").getInfo()
+            # Every image yields one sample per point, so count the time series
+            # images from the samples rather than with a separate size() request
+            ts_size = len({feature["properties"]["time_start"] for feature in features})
+            if ts_size == 0:
+                print("Warning: No time series data generated")
+            else:
+                print(f"Generated {ts_size} time series images")
+
+            # Group the samples by point, skipping null values
+            point_samples = [[] for _ in point_geometries]
+            for feature in features:
+                props = feature["properties"]
+                if props.get(band) is not None:
+                    point_samples[props["point_index"]].append(
+                        (props["time_start"], props[band], props["date"])
+                    )
 
-                    # Filter out null values
-                    valid_data = [
-                        (t, v, d)
-                        for t, v, d in zip(time_series, values, dates)
-                        if v is not None
-                    ]
+            for i, geometry in enumerate(point_geometries):
+                valid_data = point_samples[i]
 
-                    if valid_data:
-                        time_series, values, dates = zip(*valid_data)
+                if valid_data:
+                    time_series, values, dates = zip(*valid_data)
 
-                        # Convert timestamps to datetime objects
-                        datetimes = [
-                            datetime.fromtimestamp(ts / 1000) for ts in time_series
-                        ]
+                    # Convert the millisecond timestamps to datetime objects
+                    datetimes = np.array(time_series, dtype="datetime64[ms]").tolist()
 
-                        sample_data[f"Point_{i+1}"] = {
-                            "dates": datetimes,
-                            "values": list(values),
-                            "date_strings": list(dates),
-                            "color": marker_colors[i],
-                            "geometry": geometry,
-                        }
-
-                        print(f"Point {i+1}: {len(values)} valid samples")
-                    else:
-                        print(f"Warning: No valid data for point {i+1}")
+                    sample_data[f"Point_{i+1}"] = {
+                        "dates": datetimes,
+                        "values": list(values),
+                        "date_strings": list(dates),
+                        "color": marker_colors[i],
+                        "geometry": geometry,
+                    }
 
-                except Exception as e:
-                    print(f"Error sampling point {i+1}: {str(e)}")
-                    continue
+                    print(f"Point {i+1}: {len(values)} valid samples")
+                else:
+                    print(f"Warning: No valid data for point {i+1}")
 
         except Exception as e:
             print(f"Error during point sampling: {str(e)}")
@@ -5750,13 +6575,9 @@ def sentinel1_timelapse_with_samples(
     # Add sample point markers to the base gif if requested
     if show_sample_markers and sample_points is not None and len(sample_points) > 0:
         try:
-            # Get ROI bounds for coordinate conversion
-            roi_bounds = roi.bounds().getInfo()["coordinates"][0]
-            min_lon = min([coord[0] for coord in roi_bounds])
-            max_lon = max([coord[0] for coord in roi_bounds])
-            min_lat = min([coord[1] for coord in roi_bounds])
-            max_lat = max([coord[1] for coord in roi_bounds])
-            bounds = [min_lon, min_lat, max_lon, max_lat]
+            # Get ROI bounds for coordinate conversion, reusing the bounds
+            # fetched for the dimension adjustment when available
+            bounds = _roi_bounds(roi)
 
             # Add markers to the gif
             add_sample_markers_to_gif(
@@ -5767,11 +6588,7 @@ def sentinel1_timelapse_with_samples(
                 marker_size,
                 marker_style,
                 bounds,
-                (
-                    adjusted_dimensions
-                    if "adjusted_dimensions" in locals()
-                    else dimensions
-                ),
+                adjusted_dimensions,
             )
             print("Added sample markers to GIF")
 
@@ -5785,11 +6602,7 @@ def sentinel1_timelapse_with_samples(
                 sample_data,
                 chart_title,
                 chart_ylabel,
-                (
-                    adjusted_dimensions
-                    if "adjusted_dimensions" in locals()
-                    else dimensions
-                ),
+                adjusted_dimensions,
                 frames_per_second,
                 chart_xlabel_format,
                 chart_xlabel_interval,
@@ -5816,10 +6629,9 @@ def sentinel1_timelapse_with_samples(
         final_gif = base_gif
 
     # Handle MP4 conversion
-    if mp4:
-        gif_to_mp4(final_gif, final_gif.replace(".gif", ".mp4"))
+    future = _finalize_mp4(final_gif, wait=wait_mp4) if mp4 else None
 
-    return final_gif
+    return final_gif if wait_mp4 else (final_gif, future)
 
 
 def add_sample_markers_to_gif(
@@ -5844,9 +6656,8 @@ def add_sample_markers_to_gif(
         roi_bounds (list): [min_lon, min_lat, max_lon, max_lat] bounds of the ROI
         gif_dimensions (int): Dimensions of the GIF
     """
-    import io
     import warnings
-    from PIL import Image, ImageDraw, ImageSequence
+    from PIL import Image, ImageSequence
     import math
 
     warnings.simplefilter("ignore")
@@ -5868,73 +6679,61 @@ def add_sample_markers_to_gif(
         gif_width, gif_height = gif.size
 
         # Convert sample points to pixel coordinates
-        sample_points_pixel = []
-
-        for i, point in enumerate(sample_points):
-            lon, lat = point[0], point[1]
+        lons = [point[0] for point in sample_points]
+        lats = [point[1] for point in sample_points]
+        pixel_xs, pixel_ys = get_pixel_coordinates_from_geo_batch(
+            lons, lats, roi_bounds, gif_width, gif_height
+        )
 
-            # Convert geographic coordinates to pixel coordinates
-            pixel_x, pixel_y = get_pixel_coordinates_from_geo(
-                lon, lat, roi_bounds, gif_width, gif_height
-            )
+        sample_points_pixel = [
+            {
+                "x": int(pixel_x),
+                "y": int(pixel_y),
+                "color": marker_colors[i] if i < len(marker_colors) else "red",
+            }
+            for i, (pixel_x, pixel_y) in enumerate(zip(pixel_xs, pixel_ys))
+        ]
 
-            sample_points_pixel.append(
-                {
-                    "x": pixel_x,
-                    "y": pixel_y,
-                    "color": marker_colors[i] if i < len(marker_colors) else "red",
-                }
-            )
+        # Draw each marker once and paste it onto every frame. Pasting through the
+        # sprite's own alpha mask is a single C-level masked copy per marker, so it
+        # needs no per-frame ImageDraw calls or numpy round trip of the frame.
+        markers = []
+        for point in sample_points_pixel:
+            sprite, center = _marker_sprite(marker_style, marker_size, point["color"])
+            markers.append((sprite, (point["x"] - center, point["y"] - center)))
 
-        # Process each frame
+        # Process each frame, decoding the GIF in a single forward pass
         frames = []
-        frame_count = 0
+        durations = []
 
-        try:
-            while True:
-                frame = gif.copy()
-                frame = frame.convert("RGB")
-
-                # Draw markers on the frame
-                draw = ImageDraw.Draw(frame)
-
-                for point in sample_points_pixel:
-                    x, y = point["x"], point["y"]
-                    color = point["color"]
-
-                    # Draw marker based on style
-                    if marker_style == "circle":
-                        draw_circle_marker(draw, x, y, marker_size, color)
-                    elif marker_style == "square":
-                        draw_square_marker(draw, x, y, marker_size, color)
-                    else:  # default to cross
-                        draw_cross_marker(draw, x, y, marker_size, color)
-
-                # Convert back to GIF frame format
-                b = io.BytesIO()
-                frame.save(b, format="GIF")
-                frame = Image.open(b)
-                frames.append(frame)
-
-                # Move to next frame
-                gif.seek(gif.tell() + 1)
-                frame_count += 1
-
-        except EOFError:
-            # End of GIF frames
-            pass
+        for gif_frame in ImageSequence.Iterator(gif):
+            # Keep each frame's own duration, which may span several time steps
+            # where identical consecutive frames were merged
+            durations.append(gif_frame.info.get("duration", 100))
+            frame = gif_frame.convert("RGB")
+
+            for sprite, offset in markers:
+                frame.paste(sprite, offset, sprite)
+
+            # Keep the RGB frame; it is quantized once when the GIF is saved
+            frames.append(frame)
 
-        # Save the new GIF with markers
+        # Save the new GIF with markers. Each frame keeps its own adaptive
+        # palette, since the map colors can change a lot over a timelapse; the
+        # size optimization is left to gifsicle when it is available.
         if frames:
             frames[0].save(
                 out_gif,
                 save_all=True,
                 append_images=frames[1:],
-                duration=gif.info.get("duration", 100),
+                duration=durations,
                 loop=gif.info.get("loop", 0),
-                optimize=True,
+                optimize=False,
             )
 
+            if is_tool("gifsicle"):
+                _gifsicle_optimize(out_gif)
+
     except Exception as e:
         raise Exception(f"Error processing GIF: {str(e)}")
 
@@ -5985,6 +6784,34 @@ def draw_square_marker(draw, x, y, size, color):
     )
 
 
+def _marker_sprite(marker_style, marker_size, color):
+    """Draws a sample point marker on a transparent image.
+
+    Args:
+        marker_style (str): Style of the marker ('cross', 'circle', 'square').
+        marker_size (int): Size of the marker in pixels.
+        color (str): Color of the marker.
+
+    Returns:
+        tuple: The RGBA marker image and the offset of its center from the top-left corner.
+    """
+    from PIL import Image, ImageDraw
+
+    # Leave room for the outline, which extends past the marker size
+    center = marker_size // 2 + 2
+    sprite = Image.new("RGBA", (2 * center + 1, 2 * center + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+
+    if marker_style == "circle":
+        draw_circle_marker(draw, center, center, marker_size, color)
+    elif marker_style == "square":
+        draw_square_marker(draw, center, center, marker_size, color)
+    else:  # default to cross
+        draw_cross_marker(draw, center, center, marker_size, color)
+
+    return sprite, center
+
+
 def get_pixel_coordinates_from_geo(lon, lat, roi_bounds, gif_width, gif_height):
     """Convert geographic coordinates to pixel coordinates.
 
@@ -6011,6 +6838,139 @@ def get_pixel_coordinates_from_geo(lon, lat, roi_bounds, gif_width, gif_height):
     return pixel_x, pixel_y
 
 
+def get_pixel_coordinates_from_geo_batch(lon, lat, roi_bounds, gif_width, gif_height):
+    """Convert arrays of geographic coordinates to pixel coordinates.
+
+    Args:
+        lon (array-like): Longitudes
+        lat (array-like): Latitudes
+        roi_bounds (list): [min_lon, min_lat, max_lon, max_lat]
+        gif_width (int): Width of GIF in pixels
+        gif_height (int): Height of GIF in pixels
+
+    Returns:
+        tuple: (pixel_x, pixel_y) integer arrays
+    """
+    import numpy as np
+
+    min_lon, min_lat, max_lon, max_lat = roi_bounds
+    lon = np.asarray(lon, dtype=float)
+    lat = np.asarray(lat, dtype=float)
+
+    # Linear transformation from geographic to pixel coordinates, truncated
+    # toward zero like int() in get_pixel_coordinates_from_geo
+    pixel_x = np.trunc((lon - min_lon) / (max_lon - min_lon) * gif_width)
+    pixel_y = np.trunc((max_lat - lat) / (max_lat - min_lat) * gif_height)
+
+    # Ensure coordinates are within bounds
+    pixel_x = np.clip(pixel_x, 0, gif_width - 1).astype(np.int32)
+    pixel_y = np.clip(pixel_y, 0, gif_height - 1).astype(np.int32)
+
+    return pixel_x, pixel_y
+
+
+_chart_frame_state = {}
+
+
+def _init_chart_frame_worker(fig, vline):
+    """Initializes a chart frame worker process.
+
+    Args:
+        fig (matplotlib.figure.Figure): The fully formatted time series chart.
+        vline (matplotlib.lines.Line2D): The current time indicator of the chart.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    # A figure passed to a worker process loses its Agg canvas when pickled
+    if not isinstance(fig.canvas, FigureCanvasAgg):
+        FigureCanvasAgg(fig)
+
+    # Only the current time indicator moves between frames. Draw everything else
+    # once and cache it, leaving out the indicator and the artists drawn on top of
+    # it (the axes spines and the legend), which are redrawn over the cached
+    # background in the same order as a full draw.
+    ax = vline.axes
+    overlay = [vline, *ax.spines.values()]
+    if ax.get_legend() is not None:
+        overlay.append(ax.get_legend())
+    for artist in overlay:
+        artist.set_visible(False)
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+    for artist in overlay:
+        artist.set_visible(True)
+
+    _chart_frame_state["fig"] = fig
+    _chart_frame_state["vline"] = vline
+    _chart_frame_state["overlay"] = overlay
+    _chart_frame_state["background"] = background
+
+
+def _render_chart_frame(current_date):
+    """Renders the chart frame with the current time indicator at current_date.
+
+    Args:
+        current_date (datetime.datetime): The date of the frame.
+
+    Returns:
+        PIL.Image.Image: The rendered RGB frame.
+    """
+    from PIL import Image
+
+    fig = _chart_frame_state["fig"]
+    vline = _chart_frame_state["vline"]
+    vline.set_xdata([current_date, current_date])
+
+    # Restore the cached background and draw only the moving artists on top
+    fig.canvas.restore_region(_chart_frame_state["background"])
+    for artist in _chart_frame_state["overlay"]:
+        vline.axes.draw_artist(artist)
+
+    # convert() copies the canvas buffer, which is reused by the next frame
+    return Image.frombuffer(
+        "RGBA",
+        fig.canvas.get_width_height(),
+        fig.canvas.buffer_rgba(),
+        "raw",
+        "RGBA",
+        0,
+        1,
+    ).convert("RGB")
+
+
+def _render_chart_frames(fig, vline, dates, processes=None):
+    """Renders one chart frame per date, moving the current time indicator.
+
+    Args:
+        fig (matplotlib.figure.Figure): The fully formatted time series chart.
+        vline (matplotlib.lines.Line2D): The current time indicator of the chart.
+        dates (list): The dates of the frames.
+        processes (int, optional): The number of worker processes to split the frames across. Process pools re-import the caller's module under the spawn start method and require an ``if __name__ == "__main__"`` guard in scripts, so the frames are rendered in the current process unless this is greater than 1. Defaults to None.
+
+    Returns:
+        list: List of chart frames as PIL images
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Drawing a frame is CPU-bound and holds the GIL, so on request the frames
+    # are split across processes, each drawing on its own copy of the chart.
+    workers = min(processes or 1, len(dates))
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_chart_frame_worker,
+            initargs=(fig, vline),
+        ) as executor:
+            chunksize = -(-len(dates) // workers)
+            return list(executor.map(_render_chart_frame, dates, chunksize=chunksize))
+
+    _init_chart_frame_worker(fig, vline)
+    try:
+        return [_render_chart_frame(current_date) for current_date in dates]
+    finally:
+        _chart_frame_state.clear()
+
+
 def create_time_series_chart_frames(
     sample_data,
     chart_title,
@@ -6019,30 +6979,48 @@ def create_time_series_chart_frames(
     fps,
     xlabel_format="auto",
     xlabel_interval="auto",
+    processes=None,
 ):
-    """Create frames for the time series chart with current time indicator."""
-    import matplotlib.pyplot as plt
+    """Create frames for the time series chart with current time indicator.
+
+    Args:
+        sample_data (dict): Dictionary containing sample data for each point
+        chart_title (str): Title for the chart
+        chart_ylabel (str): Y-axis label
+        dimensions (int/str): Dimensions for the chart
+        fps (int): Frames per second
+        xlabel_format (str): Format for x-axis labels
+        xlabel_interval (str): Interval for x-axis labels
+        processes (int, optional): The number of worker processes used to render the frames. Frames are rendered in the current process unless this is greater than 1. Defaults to None.
+
+    Returns:
+        list: List of chart frames as PIL images
+    """
     import matplotlib.dates as mdates
+    from matplotlib.artist import setp
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
     import numpy as np
     from datetime import datetime
-    import tempfile
 
     if not sample_data:
         return []
 
-    # Get all unique dates across all points
-    all_dates = set()
-    for point_data in sample_data.values():
-        all_dates.update(point_data["dates"])
+    # Get all unique dates across all points, sorted
+    all_dates = np.concatenate(
+        [
+            np.asarray(point_data["dates"], dtype="datetime64[ms]")
+            for point_data in sample_data.values()
+        ]
+    )
 
-    if not all_dates:
+    if all_dates.size == 0:
         return []
 
-    sorted_dates = sorted(list(all_dates))
+    sorted_dates = np.unique(all_dates).tolist()
 
     # Create chart frames
     chart_frames = []
-    temp_dir = tempfile.mkdtemp()
 
     # Calculate chart dimensions
     if isinstance(dimensions, str) and "x" in dimensions:
@@ -6054,227 +7032,302 @@ def create_time_series_chart_frames(
     chart_height = height
 
     try:
-        for frame_idx, current_date in enumerate(sorted_dates):
-            fig, ax = plt.subplots(
-                figsize=(chart_width / 100, chart_height / 100), dpi=100
+        # The series, axes and layout are the same for every frame, so draw them
+        # once and only move the current time indicator per frame.
+        # Render on an Agg canvas directly, without pyplot's global figure state
+        fig = Figure(
+            figsize=(chart_width / 100, chart_height / 100),
+            dpi=100,
+            facecolor="white",
+        )
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+
+        # Cast every series to numpy arrays once, shared by the plots and the
+        # y-axis limits below (missing values become NaN)
+        series = {
+            point_name: (
+                np.asarray(point_data["dates"], dtype="datetime64[ms]"),
+                np.asarray(point_data["values"], dtype=float),
             )
+            for point_name, point_data in sample_data.items()
+        }
 
-            # Plot all time series
-            for point_name, point_data in sample_data.items():
-                if point_data["dates"] and point_data["values"]:
-                    ax.plot(
-                        point_data["dates"],
-                        point_data["values"],
-                        color=point_data["color"],
-                        label=point_name,
-                        linewidth=2,
-                        marker="o",
-                        markersize=4,
-                    )
-
-            # Add vertical line for current time
-            ax.axvline(
-                x=current_date, color="red", linestyle="--", linewidth=2, alpha=0.8
-            )
+        # Plot all time series
+        for point_name, point_data in sample_data.items():
+            dates, values = series[point_name]
+            if dates.size and values.size:
+                ax.plot(
+                    dates,
+                    values,
+                    color=point_data["color"],
+                    label=point_name,
+                    linewidth=2,
+                    marker="o",
+                    markersize=4,
+                )
 
-            # Formatting
-            ax.set_xlabel("Date", fontsize=10)
-            ax.set_ylabel(chart_ylabel, fontsize=10)
-            ax.set_title(chart_title, fontsize=12)
-            ax.legend(fontsize=8)
-            ax.grid(True, alpha=0.3)
-
-            # Format x-axis based on parameters or auto-detect
-            date_range = (max(sorted_dates) - min(sorted_dates)).days
-
-            if xlabel_format == "auto" or xlabel_interval == "auto":
-                # Auto-detect based on data characteristics
-                if date_range <= 30:  # Less than 1 month - likely daily/weekly data
-                    format_str = "%m-%d"
-                    if len(sorted_dates) <= 10:
-                        # Few points, show all
-                        locator = mdates.DayLocator(interval=max(1, date_range // 10))
-                    else:
-                        # Many points, show weekly
-                        locator = mdates.WeekdayLocator(interval=1)
-                elif date_range <= 90:  # Less than 3 months - likely weekly data
-                    format_str = "%m-%d"
-                    if len(sorted_dates) <= 15:
-                        # Weekly data with few points
-                        locator = mdates.WeekdayLocator(interval=1)
-                    else:
-                        # Weekly data with many points
-                        locator = mdates.WeekdayLocator(
-                            interval=max(1, len(sorted_dates) // 10)
-                        )
-                elif date_range <= 365:  # Less than 1 year - likely monthly data
-                    format_str = "%Y-%m"
-                    locator = mdates.MonthLocator(
-                        interval=max(1, len(sorted_dates) // 8)
-                    )
-                else:  # More than 1 year - yearly data
-                    format_str = "%Y"
-                    locator = mdates.YearLocator()
-            else:
-                # Use manual settings
-                format_str = xlabel_format if xlabel_format != "auto" else "%Y-%m-%d"
+        # Add vertical line for current time, moved to each frame's date below
+        vline = ax.axvline(
+            x=sorted_dates[0], color="red", linestyle="--", linewidth=2, alpha=0.8
+        )
 
-                if xlabel_interval == "day":
-                    locator = mdates.DayLocator(
-                        interval=max(1, len(sorted_dates) // 15)
-                    )
-                elif xlabel_interval == "week":
-                    locator = mdates.WeekdayLocator(
-                        interval=max(1, len(sorted_dates) // 10)
-                    )
-                elif xlabel_interval == "month":
-                    locator = mdates.MonthLocator(
-                        interval=max(1, len(sorted_dates) // 8)
-                    )
-                elif xlabel_interval == "year":
-                    locator = mdates.YearLocator()
+        # Formatting
+        ax.set_xlabel("Date", fontsize=10)
+        ax.set_ylabel(chart_ylabel, fontsize=10)
+        ax.set_title(chart_title, fontsize=12)
+        ax.legend(fontsize=8)
+        ax.grid(True, alpha=0.3)
+
+        # Format x-axis based on parameters or auto-detect
+        # The dates are sorted, so the range spans the first and last date
+        date_range = (sorted_dates[-1] - sorted_dates[0]).days
+
+        if xlabel_format == "auto" or xlabel_interval == "auto":
+            # Auto-detect based on data characteristics
+            if date_range <= 30:  # Less than 1 month - likely daily/weekly data
+                format_str = "%m-%d"
+                if len(sorted_dates) <= 10:
+                    # Few points, show all
+                    locator = mdates.DayLocator(interval=max(1, date_range // 10))
+                else:
+                    # Many points, show weekly
+                    locator = mdates.WeekdayLocator(interval=1)
+            elif date_range <= 90:  # Less than 3 months - likely weekly data
+                format_str = "%m-%d"
+                if len(sorted_dates) <= 15:
+                    # Weekly data with few points
+                    locator = mdates.WeekdayLocator(interval=1)
                 else:
+                    # Weekly data with many points
                     locator = mdates.WeekdayLocator(
                         interval=max(1, len(sorted_dates) // 10)
                     )
+            elif date_range <= 365:  # Less than 1 year - likely monthly data
+                format_str = "%Y-%m"
+                locator = mdates.MonthLocator(interval=max(1, len(sorted_dates) // 8))
+            else:  # More than 1 year - yearly data
+                format_str = "%Y"
+                locator = mdates.YearLocator()
+        else:
+            # Use manual settings
+            format_str = xlabel_format if xlabel_format != "auto" else "%Y-%m-%d"
+
+            if xlabel_interval == "day":
+                locator = mdates.DayLocator(interval=max(1, len(sorted_dates) // 15))
+            elif xlabel_interval == "week":
+                locator = mdates.WeekdayLocator(
+                    interval=max(1, len(sorted_dates) // 10)
+                )
+            elif xlabel_interval == "month":
+                locator = mdates.MonthLocator(interval=max(1, len(sorted_dates) // 8))
+            elif xlabel_interval == "year":
+                locator = mdates.YearLocator()
+            else:
+                locator = mdates.WeekdayLocator(
+                    interval=max(1, len(sorted_dates) // 10)
+                )
 
-            ax.xaxis.set_major_formatter(mdates.DateFormatter(format_str))
-            ax.xaxis.set_major_locator(locator)
-
-            # Add minor ticks for better granularity on weekly data
-            if date_range <= 90:
-                ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter(format_str))
+        ax.xaxis.set_major_locator(locator)
 
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, fontsize=8)
+        # Add minor ticks for better granularity on weekly data
+        if date_range <= 90:
+            ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
 
-            # Set consistent y-axis limits
-            all_values = []
-            for point_data in sample_data.values():
-                all_values.extend([v for v in point_data["values"] if v is not None])
+        setp(ax.xaxis.get_majorticklabels(), rotation=45, fontsize=8)
 
-            if all_values:
-                y_min, y_max = min(all_values), max(all_values)
-                y_range = y_max - y_min
-                if y_range > 0:
-                    ax.set_ylim(y_min - y_range * 0.1, y_max + y_range * 0.1)
-                else:
-                    ax.set_ylim(y_min - 1, y_max + 1)
+        # Set consistent y-axis limits, ignoring missing values (NaN after the
+        # float cast)
+        all_values = np.concatenate([values for _, values in series.values()])
 
-            plt.tight_layout()
+        if not np.isnan(all_values).all():
+            y_min = float(np.nanmin(all_values))
+            y_max = float(np.nanmax(all_values))
+            y_range = y_max - y_min
+            if y_range > 0:
+                ax.set_ylim(y_min - y_range * 0.1, y_max + y_range * 0.1)
+            else:
+                ax.set_ylim(y_min - 1, y_max + 1)
 
-            # Save frame
-            frame_path = os.path.join(temp_dir, f"chart_frame_{frame_idx:04d}.png")
-            plt.savefig(frame_path, dpi=100, bbox_inches="tight", facecolor="white")
-            plt.close()
+        fig.tight_layout()
 
-            chart_frames.append(frame_path)
+        chart_frames = _render_chart_frames(
+            fig, vline, sorted_dates, processes=processes
+        )
 
     except Exception as e:
         print(f"Error creating chart frames: {str(e)}")
-        # Clean up any created frames
-        for frame_path in chart_frames:
-            if os.path.exists(frame_path):
-                os.remove(frame_path)
         return []
 
     return chart_frames
 
 
+def _chart_layout(chart_position, base_size, chart_size, spacer_width):
+    """Lays out a timelapse frame and its chart side by side or stacked.
+
+    Args:
+        chart_position (str): Position of the chart, "right", "left" or "bottom".
+            Any other value places the chart on the right.
+        base_size (tuple): The (width, height) of the timelapse frames.
+        chart_size (tuple): The (width, height) of the chart frames.
+        spacer_width (int): The space between the frame and the chart in pixels.
+
+    Returns:
+        tuple: The combined (width, height), and the (x, y) offsets of the
+            timelapse frame and of the chart.
+    """
+    base_width, base_height = base_size
+    chart_width, chart_height = chart_size
+
+    if chart_position == "left":
+        combined_size = (
+            chart_width + spacer_width + base_width,
+            max(base_height, chart_height),
+        )
+        return combined_size, (chart_width + spacer_width, 0), (0, 0)
+
+    elif chart_position == "bottom":
+        combined_size = (
+            max(base_width, chart_width),
+            base_height + spacer_width + chart_height,
+        )
+        return combined_size, (0, 0), (0, base_height + spacer_width)
+
+    else:  # default to right
+        combined_size = (
+            base_width + spacer_width + chart_width,
+            max(base_height, chart_height),
+        )
+        return combined_size, (0, 0), (base_width + spacer_width, 0)
+
+
 def combine_gif_with_chart(
-    base_gif, chart_frames, chart_position, chart_size_ratio, spacer_width, fps, loop
+    base_gif,
+    chart_frames,
+    chart_position,
+    chart_size_ratio,
+    spacer_width,
+    fps,
+    loop,
+    use_gifski=False,
 ):
-    """Combine GIF with chart frames."""
-    from PIL import Image, ImageDraw
-    import tempfile
+    """Combine GIF with chart frames, given as PIL images or PNG file paths.
 
-    # Open the base gif
-    base_image = Image.open(base_gif)
-    base_frames = []
+    Args:
+        base_gif (str): File path to the timelapse GIF.
+        chart_frames (list): The chart frames, as PIL images or PNG file paths.
+        chart_position (str): Position of the chart relative to the GIF, "right", "left" or "bottom". Any other value places the chart on the right.
+        chart_size_ratio (float): Size of the chart relative to the GIF. Unused, as the chart frames are already sized.
+        spacer_width (int): Width of the space between the GIF and the chart, in pixels.
+        fps (int): Frames per second of the combined GIF.
+        loop (int): How many times the animation repeats. 0 means forever.
+        use_gifski (bool, optional): Whether to encode the combined GIF with gifski if it is installed. gifski quantizes each frame separately with dithering, so gradients look smoother, but the colors and file size differ from the default Pillow encoding, which maps every frame to one shared palette without dithering. Defaults to False.
 
-    # Extract all frames from base gif
-    try:
-        while True:
-            base_frames.append(base_image.copy())
-            base_image.seek(base_image.tell() + 1)
-    except EOFError:
-        pass
+    Returns:
+        str: File path to the combined GIF.
+    """
+    from PIL import Image, ImageSequence
 
-    # Create combined frames
-    combined_frames = []
-    temp_dir = tempfile.mkdtemp()
+    frame_duration = round(1000 / fps)
+    base_image = Image.open(base_gif)
 
-    for i, base_frame in enumerate(base_frames):
-        base_frame = base_frame.convert("RGB")
+    def base_frames():
+        # Decode the base gif lazily, one RGB frame at a time, so that no list of
+        # RGB frames is built. Pillow's GIF writer still keeps every quantized
+        # frame until the file is written, about one byte per pixel per frame.
+        # Pillow merges identical consecutive frames when writing a GIF and adds
+        # up their durations, so a frame may span several time steps. Repeat such
+        # frames to keep every time step paired with its chart frame.
+        for frame in ImageSequence.Iterator(base_image):
+            steps = round(frame.info.get("duration", frame_duration) / frame_duration)
+            frame = frame.convert("RGB")
+            for _ in range(max(1, steps)):
+                yield frame
 
+    def get_chart_frame(index):
         # Get corresponding chart frame (cycle if needed)
-        chart_idx = i % len(chart_frames) if chart_frames else 0
-
-        if chart_frames:
-            chart_frame = Image.open(chart_frames[chart_idx])
+        chart_frame = chart_frames[index % len(chart_frames)]
+        if isinstance(chart_frame, str):
+            chart_frame = Image.open(chart_frame)
+        if chart_frame.mode != "RGB":
             chart_frame = chart_frame.convert("RGB")
+        return chart_frame
 
-            # Calculate dimensions
-            base_width, base_height = base_frame.size
-            chart_width, chart_height = chart_frame.size
-
-            # Create combined image based on position
-            if chart_position == "right":
-                combined_width = base_width + spacer_width + chart_width
-                combined_height = max(base_height, chart_height)
-                combined_frame = Image.new(
-                    "RGB", (combined_width, combined_height), "white"
-                )
-                combined_frame.paste(base_frame, (0, 0))
-                combined_frame.paste(chart_frame, (base_width + spacer_width, 0))
-
-            elif chart_position == "left":
-                combined_width = chart_width + spacer_width + base_width
-                combined_height = max(base_height, chart_height)
-                combined_frame = Image.new(
-                    "RGB", (combined_width, combined_height), "white"
-                )
-                combined_frame.paste(chart_frame, (0, 0))
-                combined_frame.paste(base_frame, (chart_width + spacer_width, 0))
-
-            elif chart_position == "bottom":
-                combined_width = max(base_width, chart_width)
-                combined_height = base_height + spacer_width + chart_height
-                combined_frame = Image.new(
-                    "RGB", (combined_width, combined_height), "white"
-                )
-                combined_frame.paste(base_frame, (0, 0))
-                combined_frame.paste(chart_frame, (0, base_height + spacer_width))
-
-            else:  # default to right
-                combined_width = base_width + spacer_width + chart_width
-                combined_height = max(base_height, chart_height)
-                combined_frame = Image.new(
-                    "RGB", (combined_width, combined_height), "white"
-                )
-                combined_frame.paste(base_frame, (0, 0))
-                combined_frame.paste(chart_frame, (base_width + spacer_width, 0))
-
-        else:
-            combined_frame = base_frame
+    if chart_frames:
+        # The frame sizes and chart position are the same for every frame, so
+        # lay out a single canvas once and paste each frame pair into it
+        (combined_width, combined_height), base_xy, chart_xy = _chart_layout(
+            chart_position, base_image.size, get_chart_frame(0).size, spacer_width
+        )
+        canvas = Image.new("RGB", (combined_width, combined_height), "white")
+
+        def compose(index, base_frame):
+            canvas.paste(base_frame, base_xy)
+            canvas.paste(get_chart_frame(index), chart_xy)
+            return canvas
+
+    else:
+        combined_width, combined_height = base_image.size
 
-        combined_frames.append(combined_frame)
+        def compose(index, base_frame):
+            return base_frame
 
     # Save combined gif
     output_path = base_gif.replace(".gif", "_with_chart.gif")
 
-    if combined_frames:
-        combined_frames[0].save(
+    if use_gifski and is_tool("gifski"):
+        _gifski_encode(
+            (compose(index, frame) for index, frame in enumerate(base_frames())),
+            output_path,
+            fps,
+            loop,
+        )
+    else:
+        # Quantize every frame against one palette built from a montage of evenly
+        # spaced frames, rather than a separate palette per frame, which avoids
+        # color flicker between frames and repeated median-cut passes. The montage
+        # is built in a first pass that stops after the last sampled frame.
+        n_frames = base_image.n_frames
+        sample_indices = range(0, n_frames, max(1, n_frames // 8))[:8]
+        montage = Image.new(
+            "RGB", (combined_width, combined_height * len(sample_indices))
+        )
+        for index, base_frame in enumerate(base_frames()):
+            if index in sample_indices:
+                row = sample_indices.index(index)
+                montage.paste(compose(index, base_frame), (0, combined_height * row))
+            if index == sample_indices[-1]:
+                break
+        palette = montage.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+
+        # quantize() returns a new image, so the canvas can be reused for every
+        # frame. Frames are decoded, composed and quantized lazily in a second pass
+        # while the GIF is written.
+        quantized_frames = (
+            compose(index, base_frame).quantize(
+                palette=palette, dither=Image.Dither.NONE
+            )
+            for index, base_frame in enumerate(base_frames())
+        )
+
+        next(quantized_frames).save(
             output_path,
             save_all=True,
-            append_images=combined_frames[1:],
-            duration=int(1000 / fps),
+            append_images=quantized_frames,
+            duration=frame_duration,
             loop=loop,
-            optimize=True,
+            optimize=False,
         )
 
-    # Clean up chart frames
+        # The frames share one palette, so Pillow's optimizer has little to
+        # gain; gifsicle's inter-frame optimization compresses far better.
+        if is_tool("gifsicle"):
+            _gifsicle_optimize(output_path)
+
+    # Clean up chart frames written to disk
     for frame_path in chart_frames:
-        if os.path.exists(frame_path):
+        if isinstance(frame_path, str) and os.path.exists(frame_path):
             os.remove(frame_path)
 
     return output_path
@@ -6345,6 +7398,7 @@ def sentinel2_timelapse_with_samples(
     chart_band_labels=None,
     indices=None,
     index_vis_params=None,
+    wait_mp4=True,
     **kwargs,
 ):
     """Create a Sentinel-2 timelapse with optional sample points and time series chart.
@@ -6414,6 +7468,7 @@ def sentinel2_timelapse_with_samples(
         chart_band_labels (dict, optional): Custom labels for bands in chart. Defaults to None.
         indices (list, optional): List of indices to calculate ['NDVI', 'EVI', 'NDWI', 'NDBI', 'MNDWI', 'NBR']. Defaults to None.
         index_vis_params (dict, optional): Visualization parameters for indices. Defaults to None.
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
         **kwargs: Additional arguments for create_timeseries().
 
     Returns:
@@ -6432,22 +7487,10 @@ def sentinel2_timelapse_with_samples(
             indices = [indices]
 
         # Validate indices
-        valid_indices = [
-            "NDVI",
-            "EVI",
-            "NDWI",
-            "MNDWI",
-            "NDBI",
-            "NBR",
-            "SAVI",
-            "GNDVI",
-            "NDRE",
-            "CIRE",
-        ]
         for idx in indices:
-            if idx not in valid_indices:
+            if idx not in _S2_INDICES:
                 raise ValueError(
-                    f"Index '{idx}' not supported. Valid indices: {valid_indices}"
+                    f"Index '{idx}' not supported. Valid indices: {list(_S2_INDICES)}"
                 )
 
         # If using indices, update defaults
@@ -6488,12 +7531,11 @@ def sentinel2_timelapse_with_samples(
 
     # Set default marker colors if not provided
     if sample_points is not None and marker_colors is None:
-        marker_colors = ["red", "blue", "green", "orange", "purple"][
-            : len(sample_points)
-        ]
+        marker_colors = list(_SAMPLE_MARKER_COLORS[: len(sample_points)])
     elif sample_points is not None and len(marker_colors) < len(sample_points):
-        default_colors = ["red", "blue", "green", "orange", "purple"]
-        marker_colors.extend(default_colors[len(marker_colors) : len(sample_points)])
+        marker_colors.extend(
+            _SAMPLE_MARKER_COLORS[len(marker_colors) : len(sample_points)]
+        )
 
     # Set default sample bands if not provided
     if sample_bands is None:
@@ -6501,29 +7543,16 @@ def sentinel2_timelapse_with_samples(
 
     # Set default chart band labels
     if chart_band_labels is None:
-        chart_band_labels = {
-            "B2": "Blue",
-            "B3": "Green",
-            "B4": "Red",
-            "B5": "Red Edge 1",
-            "B6": "Red Edge 2",
-            "B7": "Red Edge 3",
-            "B8": "NIR",
-            "B8A": "Red Edge 4",
-            "B11": "SWIR1",
-            "B12": "SWIR2",
-        }
+        chart_band_labels = dict(_S2_BAND_LABELS)
         # Add index labels
         index_labels = get_index_chart_labels()
         chart_band_labels.update(index_labels)
 
-    # Adjust dimensions to avoid Earth Engine limits
-    if isinstance(roi, ee.Geometry):
-        roi_bounds = roi.bounds().getInfo()["coordinates"][0]
-        min_lon = min([coord[0] for coord in roi_bounds])
-        max_lon = max([coord[0] for coord in roi_bounds])
-        min_lat = min([coord[1] for coord in roi_bounds])
-        max_lat = max([coord[1] for coord in roi_bounds])
+    # Adjust dimensions to avoid Earth Engine limits. Dimensions given in WxH
+    # format are used as is.
+    adjusted_dimensions = dimensions
+    if isinstance(roi, ee.Geometry) and isinstance(dimensions, int):
+        min_lon, min_lat, max_lon, max_lat = _roi_bounds(roi)
 
         # Calculate aspect ratio and adjust dimensions
         lon_range = max_lon - min_lon
@@ -6532,29 +7561,24 @@ def sentinel2_timelapse_with_samples(
 
         max_pixels = 26214400  # Earth Engine limit
 
-        if isinstance(dimensions, int):
-            if aspect_ratio > 1:
-                width = min(dimensions, int(math.sqrt(max_pixels * aspect_ratio)))
-                height = int(width / aspect_ratio)
-            else:
-                height = min(dimensions, int(math.sqrt(max_pixels / aspect_ratio)))
-                width = int(height * aspect_ratio)
+        if aspect_ratio > 1:
+            width = min(dimensions, int(math.sqrt(max_pixels * aspect_ratio)))
+            height = int(width / aspect_ratio)
+        else:
+            height = min(dimensions, int(math.sqrt(max_pixels / aspect_ratio)))
+            width = int(height * aspect_ratio)
 
-            width = max(256, width)
-            height = max(256, height)
+        width = max(256, width)
+        height = max(256, height)
 
-            if width * height > max_pixels:
-                scale_factor = math.sqrt(max_pixels / (width * height))
-                width = int(width * scale_factor)
-                height = int(height * scale_factor)
+        if width * height > max_pixels:
+            scale_factor = math.sqrt(max_pixels / (width * height))
+            width = int(width * scale_factor)
+            height = int(height * scale_factor)
 
-            adjusted_dimensions = f"{width}x{height}"
-        else:
-            adjusted_dimensions = dimensions
+        adjusted_dimensions = f"{width}x{height}"
 
         print(f"Adjusted dimensions: {adjusted_dimensions}")
-    else:
-        adjusted_dimensions = dimensions
 
     # Create the base timelapse
     try:
@@ -6658,9 +7682,8 @@ def sentinel2_timelapse_with_samples(
     # If no sample points, return the base gif (map only)
     if sample_points is None or len(sample_points) == 0:
         print("No sample points provided. Returning map-only timelapse.")
-        if mp4:
-            gif_to_mp4(base_gif, base_gif.replace(".gif", ".mp4"))
-        return base_gif
+        future = _finalize_mp4(base_gif, wait=wait_mp4) if mp4 else None
+        return base_gif if wait_mp4 else (base_gif, future)
 
     # Get the Sentinel-2 time series for sampling
     if end_year is None:
@@ -6671,38 +7694,12 @@ def sentinel2_timelapse_with_samples(
 
     # Create collection with error handling
     try:
-        # Map band names to Sentinel-2 band names
-        allowed_bands = {
-            "Blue": "B2",
-            "Green": "B3",
-            "Red": "B4",
-            "Red Edge 1": "B5",
-            "Red Edge 2": "B6",
-            "Red Edge 3": "B7",
-            "NIR": "B8",
-            "Red Edge 4": "B8A",
-            "SWIR1": "B11",
-            "SWIR2": "B12",
-            "QA60": "QA60",
-        }
-
-        # Convert sample band names if needed (include indices)
+        # Convert sample band names to Sentinel-2 band names if needed (include indices)
         s2_sample_bands = []
         for band in sample_bands:
-            if band in allowed_bands:
-                s2_sample_bands.append(allowed_bands[band])
-            elif band in [
-                "NDVI",
-                "EVI",
-                "NDWI",
-                "MNDWI",
-                "NDBI",
-                "NBR",
-                "SAVI",
-                "GNDVI",
-                "NDRE",
-                "CIRE",
-            ]:
+            if band in _S2_BAND_NAMES:
+                s2_sample_bands.append(_S2_BAND_NAMES[band])
+            elif band in _S2_INDICES:
                 s2_sample_bands.append(band)  # Keep index names as-is
             else:
                 s2_sample_bands.append(band)
@@ -6751,22 +7748,11 @@ def sentinel2_timelapse_with_samples(
                 1,
             )
 
-        # Check if time series is empty
-        ts_size = ts_collection.size().getInfo()
-        if ts_size == 0:
-            print("Warning: No time series data generated")
-            if mp4:
-                gif_to_mp4(base_gif, base_gif.replace(".gif", ".mp4"))
-            return base_gif
-
-        print(f"Generated {ts_size} time series images")
-
     except Exception as e:
         print(f"Error creating time series: {str(e)}")
         # Return base gif without sampling
-        if mp4:
-            gif_to_mp4(base_gif, base_gif.replace(".gif", ".mp4"))
-        return base_gif
+        future = _finalize_mp4(base_gif, wait=wait_mp4) if mp4 else None
+        return base_gif if wait_mp4 else (base_gif, future)
 
     # Sample points from the time series
     sample_data = {}
@@ -6782,102 +7768,128 @@ def sentinel2_timelapse_with_samples(
 
                 point_geometries.append(geometry)
 
-                # Sample the time series at this point for each band
-                for band_idx, band in enumerate(s2_sample_bands):
-
-                    def sample_point_band(image):
-                        sampled = image.select(band).sample(geometry, 30)
-                        return sampled.first().set(
-                            {
-                                "system:time_start": image.get("system:time_start"),
-                                "system:date": image.get("system:date"),
-                            }
-                        )
-
-                    sampled = ts_collection.map(sample_point_band)
-
-                    # Get the time series data with error handling
-                    try:
-                        time_series = sampled.aggregate_array(
-                            "system:time_start"
-                        ).getInfo()
-                        values = sampled.aggregate_array(band).getInfo()
-                        dates = sampled.aggregate_array("system:date").getInfo()
-
-                        # Filter out null values
-                        valid_data = [
-                            (t, v, d)
-                            for t, v, d in zip(time_series, values, dates)
-                            if v is not None
-                        ]
+            points_fc = ee.FeatureCollection(
+                [
+                    ee.Feature(geometry, {"point_index": i})
+                    for i, geometry in enumerate(point_geometries)
+                ]
+            )
+            first_reducer = ee.Reducer.first().forEach(s2_sample_bands)
 
-                        if valid_data:
-                            time_series, values, dates = zip(*valid_data)
+            # Sample all points and bands in every time series image on the server
+            def sample_points_in_image(image):
+                samples = image.select(s2_sample_bands).reduceRegions(
+                    points_fc, first_reducer, 30
+                )
+                return samples.map(
+                    lambda feature: feature.set(
+                        {
+                            "time_start": image.get("system:time_start"),
+                            "date": image.get("system:date"),
+                        }
+                    )
+                )
 
-                            # Convert timestamps to datetime objects
-                            datetimes = [
-                                datetime.fromtimestamp(ts / 1000) for ts in time_series
-                            ]
+            # Fetch the samples of all points, bands and dates in a single request
+            features = (
+                ts_collection.map(sample_points_in_image)
+                .flatten()
+                .select(
+                    ["point_index", "time_start", "date"] + s2_sample_bands, None, False
+                )
+                .getInfo()["features"]
+            )
 
-                            # Create unique key for point and band combination
-                            point_band_key = f"Point_{i+1}_{band}"
-                            if len(s2_sample_bands) == 1:
-                                point_band_key = f"Point_{i+1}"
+            # Every image yields one sample per point, so count the time series
+            # images from the samples rather than with a separate size() request
+            ts_size = len({feature["properties"]["time_start"] for feature in features})
+            if ts_size == 0:
+                print("Warning: No time series data generated")
+            else:
+                print(f"Generated {ts_size} time series images")
 
-                            # Get display name for band
-                            band_display = chart_band_labels.get(band, band)
-                            if len(s2_sample_bands) > 1:
-                                label = f"Point {i+1} ({band_display})"
-                            else:
-                                label = f"Point {i+1}"
-
-                            # Color assignment for multi-band sampling
-                            if len(s2_sample_bands) > 1:
-                                base_color = (
-                                    marker_colors[i]
-                                    if i < len(marker_colors)
-                                    else "red"
+            # Group the samples by point and band, keeping nulls for the filter below
+            series = {
+                (i, band): {"time_series": [], "values": [], "dates": []}
+                for i in range(len(point_geometries))
+                for band in s2_sample_bands
+            }
+            for feature in features:
+                props = feature["properties"]
+                for band in s2_sample_bands:
+                    info = series[(props["point_index"], band)]
+                    info["time_series"].append(props["time_start"])
+                    info["values"].append(props.get(band))
+                    info["dates"].append(props["date"])
+
+            for i, geometry in enumerate(point_geometries):
+                for band_idx, band in enumerate(s2_sample_bands):
+                    info = series[(i, band)]
+
+                    # Filter out null values (NaN after the float cast)
+                    values = np.array(info["values"], dtype=float)
+                    valid = ~np.isnan(values)
+
+                    if valid.any():
+                        # Convert the millisecond timestamps to datetime
+                        # objects in one vectorized pass
+                        datetimes = np.array(
+                            info["time_series"], dtype="datetime64[ms]"
+                        )[valid].tolist()
+                        values = values[valid].tolist()
+                        dates = np.array(info["dates"], dtype=object)[valid]
+
+                        # Create unique key for point and band combination
+                        point_band_key = f"Point_{i+1}_{band}"
+                        if len(s2_sample_bands) == 1:
+                            point_band_key = f"Point_{i+1}"
+
+                        # Get display name for band
+                        band_display = chart_band_labels.get(band, band)
+                        if len(s2_sample_bands) > 1:
+                            label = f"Point {i+1} ({band_display})"
+                        else:
+                            label = f"Point {i+1}"
+
+                        # Color assignment for multi-band sampling
+                        if len(s2_sample_bands) > 1:
+                            base_color = (
+                                marker_colors[i] if i < len(marker_colors) else "red"
+                            )
+                            # Modify color for different bands
+                            if band_idx == 0:
+                                color = base_color
+                            elif band_idx == 1:
+                                color = (
+                                    f"dark{base_color}"
+                                    if base_color != "red"
+                                    else "darkred"
                                 )
-                                # Modify color for different bands
-                                if band_idx == 0:
-                                    color = base_color
-                                elif band_idx == 1:
-                                    color = (
-                                        f"dark{base_color}"
-                                        if base_color != "red"
-                                        else "darkred"
-                                    )
-                                else:
-                                    color = (
-                                        f"light{base_color}"
-                                        if base_color != "red"
-                                        else "lightcoral"
-                                    )
                             else:
                                 color = (
-                                    marker_colors[i]
-                                    if i < len(marker_colors)
-                                    else "red"
+                                    f"light{base_color}"
+                                    if base_color != "red"
+                                    else "lightcoral"
                                 )
-
-                            sample_data[point_band_key] = {
-                                "dates": datetimes,
-                                "values": list(values),
-                                "date_strings": list(dates),
-                                "color": color,
-                                "geometry": geometry,
-                                "label": label,
-                                "band": band,
-                                "point_idx": i,
-                            }
-
-                            print(f"Point {i+1} ({band}): {len(values)} valid samples")
                         else:
-                            print(f"Warning: No valid data for point {i+1} ({band})")
+                            color = (
+                                marker_colors[i] if i < len(marker_colors) else "red"
+                            )
+
+                        sample_data[point_band_key] = {
+                            "dates": datetimes,
+                            "values": list(values),
+                            "date_strings": list(dates),
+                            "color": color,
+                            "geometry": geometry,
+                            "label": label,
+                            "band": band,
+                            "point_idx": i,
+                        }
 
-                    except Exception as e:
-                        print(f"Error sampling point {i+1} ({band}): {str(e)}")
-                        continue
+                        print(f"Point {i+1} ({band}): {len(values)} valid samples")
+                    else:
+                        print(f"Warning: No valid data for point {i+1} ({band})")
 
         except Exception as e:
             print(f"Error during point sampling: {str(e)}")
@@ -6888,13 +7900,9 @@ def sentinel2_timelapse_with_samples(
     # Add sample point markers to the base gif if requested
     if show_sample_markers and sample_points is not None and len(sample_points) > 0:
         try:
-            # Get ROI bounds for coordinate conversion
-            roi_bounds = roi.bounds().getInfo()["coordinates"][0]
-            min_lon = min([coord[0] for coord in roi_bounds])
-            max_lon = max([coord[0] for coord in roi_bounds])
-            min_lat = min([coord[1] for coord in roi_bounds])
-            max_lat = max([coord[1] for coord in roi_bounds])
-            bounds = [min_lon, min_lat, max_lon, max_lat]
+            # Get ROI bounds for coordinate conversion, reusing the bounds
+            # fetched for the dimension adjustment when available
+            bounds = _roi_bounds(roi)
 
             # Add markers to the gif
             add_sample_markers_to_gif(
@@ -6905,11 +7913,7 @@ def sentinel2_timelapse_with_samples(
                 marker_size,
                 marker_style,
                 bounds,
-                (
-                    adjusted_dimensions
-                    if "adjusted_dimensions" in locals()
-                    else dimensions
-                ),
+                adjusted_dimensions,
             )
             print("Added sample markers to GIF")
 
@@ -6923,11 +7927,7 @@ def sentinel2_timelapse_with_samples(
                 sample_data,
                 chart_title,
                 chart_ylabel,
-                (
-                    adjusted_dimensions
-                    if "adjusted_dimensions" in locals()
-                    else dimensions
-                ),
+                adjusted_dimensions,
                 frames_per_second,
                 chart_xlabel_format,
                 chart_xlabel_interval,
@@ -6954,10 +7954,9 @@ def sentinel2_timelapse_with_samples(
         final_gif = base_gif
 
     # Handle MP4 conversion
-    if mp4:
-        gif_to_mp4(final_gif, final_gif.replace(".gif", ".mp4"))
+    future = _finalize_mp4(final_gif, wait=wait_mp4) if mp4 else None
 
-    return final_gif
+    return final_gif if wait_mp4 else (final_gif, future)
 
 
 def calculate_sentinel2_indices(image):
@@ -6969,17 +7968,19 @@ def calculate_sentinel2_indices(image):
     Returns:
         ee.Image: Image with added index bands
     """
+    # Select the bands used by the expression-based indices once and share them
+    nir = image.select("B8")
+    red = image.select("B4")
+    blue = image.select("B2")
+    re1 = image.select("B5")
+
     # Normalized Difference Vegetation Index
     ndvi = image.normalizedDifference(["B8", "B4"]).rename("NDVI")
 
     # Enhanced Vegetation Index
     evi = image.expression(
         "2.5 * ((NIR - RED) / (NIR + 6 * RED - 7.5 * BLUE + 1))",
-        {
-            "NIR": image.select("B8"),
-            "RED": image.select("B4"),
-            "BLUE": image.select("B2"),
-        },
+        {"NIR": nir, "RED": red, "BLUE": blue},
     ).rename("EVI")
 
     # Normalized Difference Water Index
@@ -6997,7 +7998,7 @@ def calculate_sentinel2_indices(image):
     # Soil Adjusted Vegetation Index
     savi = image.expression(
         "((NIR - RED) / (NIR + RED + 0.5)) * (1.5)",
-        {"NIR": image.select("B8"), "RED": image.select("B4")},
+        {"NIR": nir, "RED": red},
     ).rename("SAVI")
 
     # Green Normalized Difference Vegetation Index
@@ -7007,9 +8008,7 @@ def calculate_sentinel2_indices(image):
     ndre = image.normalizedDifference(["B8", "B5"]).rename("NDRE")
 
     # Chlorophyll Index Red Edge
-    cire = image.expression(
-        "(NIR / RE1) - 1", {"NIR": image.select("B8"), "RE1": image.select("B5")}
-    ).rename("CIRE")
+    cire = image.expression("(NIR / RE1) - 1", {"NIR": nir, "RE1": re1}).rename("CIRE")
 
     return image.addBands([ndvi, evi, ndwi, mndwi, ndbi, nbr, savi, gndvi, ndre, cire])
 
@@ -7224,6 +8223,7 @@ def create_s2_time_series_chart_frames(
     fps,
     xlabel_format="auto",
     xlabel_interval="auto",
+    processes=None,
 ):
     """Create frames for the Sentinel-2 time series chart with current time indicator.
 
@@ -7235,32 +8235,36 @@ def create_s2_time_series_chart_frames(
         fps (int): Frames per second
         xlabel_format (str): Format for x-axis labels
         xlabel_interval (str): Interval for x-axis labels
+        processes (int, optional): The number of worker processes used to render the frames. Frames are rendered in the current process unless this is greater than 1. Defaults to None.
 
     Returns:
-        list: List of paths to chart frame images
+        list: List of chart frames as PIL images
     """
-    import matplotlib.pyplot as plt
     import matplotlib.dates as mdates
+    from matplotlib.artist import setp
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
     import numpy as np
     from datetime import datetime
-    import tempfile
 
     if not sample_data:
         return []
 
-    # Get all unique dates across all points/bands
-    all_dates = set()
-    for point_data in sample_data.values():
-        all_dates.update(point_data["dates"])
+    # Get all unique dates across all points/bands, sorted
+    all_dates = np.concatenate(
+        [
+            np.asarray(point_data["dates"], dtype="datetime64[ms]")
+            for point_data in sample_data.values()
+        ]
+    )
 
-    if not all_dates:
+    if all_dates.size == 0:
         return []
 
-    sorted_dates = sorted(list(all_dates))
+    sorted_dates = np.unique(all_dates).tolist()
 
     # Create chart frames
     chart_frames = []
-    temp_dir = tempfile.mkdtemp()
 
     # Calculate chart dimensions
     if isinstance(dimensions, str) and "x" in dimensions:
@@ -7272,418 +8276,133 @@ def create_s2_time_series_chart_frames(
     chart_height = height
 
     try:
-        for frame_idx, current_date in enumerate(sorted_dates):
-            fig, ax = plt.subplots(
-                figsize=(chart_width / 100, chart_height / 100), dpi=100
-            )
-
-            # Plot all time series
-            for point_key, point_data in sample_data.items():
-                if point_data["dates"] and point_data["values"]:
-                    # Use custom label if available, otherwise use point_key
-                    label = point_data.get("label", point_key)
-
-                    ax.plot(
-                        point_data["dates"],
-                        point_data["values"],
-                        color=point_data["color"],
-                        label=label,
-                        linewidth=2,
-                        marker="o",
-                        markersize=4,
-                    )
-
-            # Add vertical line for current time
-            ax.axvline(
-                x=current_date, color="red", linestyle="--", linewidth=2, alpha=0.8
-            )
-
-            # Formatting
-            ax.set_xlabel("Date", fontsize=10)
-            ax.set_ylabel(chart_ylabel, fontsize=10)
-            ax.set_title(chart_title, fontsize=12)
-            ax.legend(fontsize=8, loc="upper left")
-            ax.grid(True, alpha=0.3)
-
-            # Format x-axis based on parameters or auto-detect
-            date_range = (max(sorted_dates) - min(sorted_dates)).days
-
-            if xlabel_format == "auto" or xlabel_interval == "auto":
-                # Auto-detect based on data characteristics
-                if date_range <= 30:  # Less than 1 month
-                    format_str = "%m-%d"
-                    if len(sorted_dates) <= 10:
-                        locator = mdates.DayLocator(interval=max(1, date_range // 10))
-                    else:
-                        locator = mdates.WeekdayLocator(interval=1)
-                elif date_range <= 90:  # Less than 3 months
-                    format_str = "%m-%d"
-                    if len(sorted_dates) <= 15:
-                        locator = mdates.WeekdayLocator(interval=1)
-                    else:
-                        locator = mdates.WeekdayLocator(
-                            interval=max(1, len(sorted_dates) // 10)
-                        )
-                elif date_range <= 365:  # Less than 1 year
-                    format_str = "%Y-%m"
-                    locator = mdates.MonthLocator(
-                        interval=max(1, len(sorted_dates) // 8)
-                    )
-                else:  # More than 1 year
-                    format_str = "%Y"
-                    locator = mdates.YearLocator()
-            else:
-                # Use manual settings
-                format_str = xlabel_format if xlabel_format != "auto" else "%Y-%m-%d"
-
-                if xlabel_interval == "day":
-                    locator = mdates.DayLocator(
-                        interval=max(1, len(sorted_dates) // 15)
-                    )
-                elif xlabel_interval == "week":
-                    locator = mdates.WeekdayLocator(
-                        interval=max(1, len(sorted_dates) // 10)
-                    )
-                elif xlabel_interval == "month":
-                    locator = mdates.MonthLocator(
-                        interval=max(1, len(sorted_dates) // 8)
-                    )
-                elif xlabel_interval == "year":
-                    locator = mdates.YearLocator()
-                else:
-                    locator = mdates.WeekdayLocator(
-                        interval=max(1, len(sorted_dates) // 10)
-                    )
-
-            ax.xaxis.set_major_formatter(mdates.DateFormatter(format_str))
-            ax.xaxis.set_major_locator(locator)
-
-            # Add minor ticks for better granularity
-            if date_range <= 90:
-                ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
-
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, fontsize=8)
-
-            # Set consistent y-axis limits
-            all_values = []
-            for point_data in sample_data.values():
-                all_values.extend([v for v in point_data["values"] if v is not None])
-
-            if all_values:
-                y_min, y_max = min(all_values), max(all_values)
-                y_range = y_max - y_min
-                if y_range > 0:
-                    ax.set_ylim(y_min - y_range * 0.1, y_max + y_range * 0.1)
-                else:
-                    ax.set_ylim(y_min - 0.01, y_max + 0.01)
-
-            plt.tight_layout()
-
-            # Save frame
-            frame_path = os.path.join(temp_dir, f"chart_frame_{frame_idx:04d}.png")
-            plt.savefig(frame_path, dpi=100, bbox_inches="tight", facecolor="white")
-            plt.close()
-
-            chart_frames.append(frame_path)
-
-    except Exception as e:
-        print(f"Error creating chart frames: {str(e)}")
-        # Clean up any created frames
-        for frame_path in chart_frames:
-            if os.path.exists(frame_path):
-                os.remove(frame_path)
-        return []
-
-    return chart_frames
-
-
-def add_sample_markers_to_gif(
-    in_gif,
-    out_gif,
-    sample_points,
-    marker_colors,
-    marker_size,
-    marker_style,
-    roi_bounds,
-    gif_dimensions,
-):
-    """Add sample point markers to a GIF.
-
-    Args:
-        in_gif (str): Path to input GIF file
-        out_gif (str): Path to output GIF file
-        sample_points (list): List of [lon, lat] coordinates
-        marker_colors (list): List of colors for each marker
-        marker_size (int): Size of markers in pixels
-        marker_style (str): Style of markers ('cross', 'circle', 'square')
-        roi_bounds (list): [min_lon, min_lat, max_lon, max_lat] bounds of the ROI
-        gif_dimensions (int): Dimensions of the GIF
-    """
-    import io
-    import warnings
-    from PIL import Image, ImageDraw, ImageSequence
-    import math
-
-    warnings.simplefilter("ignore")
-
-    in_gif = os.path.abspath(in_gif)
-    out_gif = os.path.abspath(out_gif)
-
-    if not os.path.exists(in_gif):
-        raise FileNotFoundError(f"Input GIF file does not exist: {in_gif}")
-
-    if not os.path.exists(os.path.dirname(out_gif)):
-        os.makedirs(os.path.dirname(out_gif))
-
-    try:
-        # Open the GIF
-        gif = Image.open(in_gif)
-
-        # Get GIF properties
-        gif_width, gif_height = gif.size
-
-        # Convert sample points to pixel coordinates
-        sample_points_pixel = []
-
-        for i, point in enumerate(sample_points):
-            lon, lat = point[0], point[1]
-
-            # Convert geographic coordinates to pixel coordinates
-            pixel_x, pixel_y = get_pixel_coordinates_from_geo(
-                lon, lat, roi_bounds, gif_width, gif_height
-            )
-
-            sample_points_pixel.append(
-                {
-                    "x": pixel_x,
-                    "y": pixel_y,
-                    "color": marker_colors[i] if i < len(marker_colors) else "red",
-                }
-            )
-
-        # Process each frame
-        frames = []
-        frame_count = 0
-
-        try:
-            while True:
-                frame = gif.copy()
-                frame = frame.convert("RGB")
-
-                # Draw markers on the frame
-                draw = ImageDraw.Draw(frame)
-
-                for point in sample_points_pixel:
-                    x, y = point["x"], point["y"]
-                    color = point["color"]
-
-                    # Draw marker based on style
-                    if marker_style == "circle":
-                        draw_circle_marker(draw, x, y, marker_size, color)
-                    elif marker_style == "square":
-                        draw_square_marker(draw, x, y, marker_size, color)
-                    else:  # default to cross
-                        draw_cross_marker(draw, x, y, marker_size, color)
-
-                # Convert back to GIF frame format
-                b = io.BytesIO()
-                frame.save(b, format="GIF")
-                frame = Image.open(b)
-                frames.append(frame)
-
-                # Move to next frame
-                gif.seek(gif.tell() + 1)
-                frame_count += 1
-
-        except EOFError:
-            # End of GIF frames
-            pass
-
-        # Save the new GIF with markers
-        if frames:
-            frames[0].save(
-                out_gif,
-                save_all=True,
-                append_images=frames[1:],
-                duration=gif.info.get("duration", 100),
-                loop=gif.info.get("loop", 0),
-                optimize=True,
+        # The series, axes and layout are the same for every frame, so draw them
+        # once and only move the current time indicator per frame.
+        fig = Figure(
+            figsize=(chart_width / 100, chart_height / 100),
+            dpi=100,
+            facecolor="white",
+        )
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+
+        # Cast every series to numpy arrays once, shared by the plots and the
+        # y-axis limits below (missing values become NaN)
+        series = {
+            point_key: (
+                np.asarray(point_data["dates"], dtype="datetime64[ms]"),
+                np.asarray(point_data["values"], dtype=float),
             )
+            for point_key, point_data in sample_data.items()
+        }
 
-    except Exception as e:
-        raise Exception(f"Error processing GIF: {str(e)}")
-
-
-def draw_cross_marker(draw, x, y, size, color):
-    """Draw a cross marker."""
-    half_size = size // 2
-    # Horizontal line
-    draw.line([x - half_size, y, x + half_size, y], fill=color, width=3)
-    # Vertical line
-    draw.line([x, y - half_size, x, y + half_size], fill=color, width=3)
-    # Add outline for better visibility
-    draw.line([x - half_size, y, x + half_size, y], fill="white", width=1)
-    draw.line([x, y - half_size, x, y + half_size], fill="white", width=1)
-
-
-def draw_circle_marker(draw, x, y, size, color):
-    """Draw a circle marker."""
-    half_size = size // 2
-    # Outer circle (outline)
-    draw.ellipse(
-        [x - half_size, y - half_size, x + half_size, y + half_size],
-        outline="white",
-        width=3,
-    )
-    # Inner circle (fill)
-    draw.ellipse(
-        [x - half_size + 2, y - half_size + 2, x + half_size - 2, y + half_size - 2],
-        fill=color,
-        outline=color,
-    )
-
-
-def draw_square_marker(draw, x, y, size, color):
-    """Draw a square marker."""
-    half_size = size // 2
-    # Outer square (outline)
-    draw.rectangle(
-        [x - half_size, y - half_size, x + half_size, y + half_size],
-        outline="white",
-        width=3,
-    )
-    # Inner square (fill)
-    draw.rectangle(
-        [x - half_size + 2, y - half_size + 2, x + half_size - 2, y + half_size - 2],
-        fill=color,
-        outline=color,
-    )
-
-
-def get_pixel_coordinates_from_geo(lon, lat, roi_bounds, gif_width, gif_height):
-    """Convert geographic coordinates to pixel coordinates.
-
-    Args:
-        lon (float): Longitude
-        lat (float): Latitude
-        roi_bounds (list): [min_lon, min_lat, max_lon, max_lat]
-        gif_width (int): Width of GIF in pixels
-        gif_height (int): Height of GIF in pixels
-
-    Returns:
-        tuple: (pixel_x, pixel_y)
-    """
-    min_lon, min_lat, max_lon, max_lat = roi_bounds
-
-    # Linear transformation from geographic to pixel coordinates
-    pixel_x = int(((lon - min_lon) / (max_lon - min_lon)) * gif_width)
-    pixel_y = int(((max_lat - lat) / (max_lat - min_lat)) * gif_height)  # Flip Y axis
-
-    # Ensure coordinates are within bounds
-    pixel_x = max(0, min(gif_width - 1, pixel_x))
-    pixel_y = max(0, min(gif_height - 1, pixel_y))
-
-    return pixel_x, pixel_y
-
-
-def combine_gif_with_chart(
-    base_gif, chart_frames, chart_position, chart_size_ratio, spacer_width, fps, loop
-):
-    """Combine GIF with chart frames."""
-    from PIL import Image, ImageDraw
-    import tempfile
-
-    # Open the base gif
-    base_image = Image.open(base_gif)
-    base_frames = []
-
-    # Extract all frames from base gif
-    try:
-        while True:
-            base_frames.append(base_image.copy())
-            base_image.seek(base_image.tell() + 1)
-    except EOFError:
-        pass
-
-    # Create combined frames
-    combined_frames = []
-    temp_dir = tempfile.mkdtemp()
-
-    for i, base_frame in enumerate(base_frames):
-        base_frame = base_frame.convert("RGB")
-
-        # Get corresponding chart frame (cycle if needed)
-        chart_idx = i % len(chart_frames) if chart_frames else 0
-
-        if chart_frames:
-            chart_frame = Image.open(chart_frames[chart_idx])
-            chart_frame = chart_frame.convert("RGB")
+        # Plot all time series
+        for point_key, point_data in sample_data.items():
+            dates, values = series[point_key]
+            if dates.size and values.size:
+                # Use custom label if available, otherwise use point_key
+                label = point_data.get("label", point_key)
+
+                ax.plot(
+                    dates,
+                    values,
+                    color=point_data["color"],
+                    label=label,
+                    linewidth=2,
+                    marker="o",
+                    markersize=4,
+                )
 
-            # Calculate dimensions
-            base_width, base_height = base_frame.size
-            chart_width, chart_height = chart_frame.size
+        # Add vertical line for current time, moved to each frame's date below
+        vline = ax.axvline(
+            x=sorted_dates[0], color="red", linestyle="--", linewidth=2, alpha=0.8
+        )
 
-            # Create combined image based on position
-            if chart_position == "right":
-                combined_width = base_width + spacer_width + chart_width
-                combined_height = max(base_height, chart_height)
-                combined_frame = Image.new(
-                    "RGB", (combined_width, combined_height), "white"
-                )
-                combined_frame.paste(base_frame, (0, 0))
-                combined_frame.paste(chart_frame, (base_width + spacer_width, 0))
-
-            elif chart_position == "left":
-                combined_width = chart_width + spacer_width + base_width
-                combined_height = max(base_height, chart_height)
-                combined_frame = Image.new(
-                    "RGB", (combined_width, combined_height), "white"
-                )
-                combined_frame.paste(chart_frame, (0, 0))
-                combined_frame.paste(base_frame, (chart_width + spacer_width, 0))
-
-            elif chart_position == "bottom":
-                combined_width = max(base_width, chart_width)
-                combined_height = base_height + spacer_width + chart_height
-                combined_frame = Image.new(
-                    "RGB", (combined_width, combined_height), "white"
+        # Formatting
+        ax.set_xlabel("Date", fontsize=10)
+        ax.set_ylabel(chart_ylabel, fontsize=10)
+        ax.set_title(chart_title, fontsize=12)
+        ax.legend(fontsize=8, loc="upper left")
+        ax.grid(True, alpha=0.3)
+
+        # Format x-axis based on parameters or auto-detect
+        # The dates are sorted, so the range spans the first and last date
+        date_range = (sorted_dates[-1] - sorted_dates[0]).days
+
+        if xlabel_format == "auto" or xlabel_interval == "auto":
+            # Auto-detect based on data characteristics
+            if date_range <= 30:  # Less than 1 month
+                format_str = "%m-%d"
+                if len(sorted_dates) <= 10:
+                    locator = mdates.DayLocator(interval=max(1, date_range // 10))
+                else:
+                    locator = mdates.WeekdayLocator(interval=1)
+            elif date_range <= 90:  # Less than 3 months
+                format_str = "%m-%d"
+                if len(sorted_dates) <= 15:
+                    locator = mdates.WeekdayLocator(interval=1)
+                else:
+                    locator = mdates.WeekdayLocator(
+                        interval=max(1, len(sorted_dates) // 10)
+                    )
+            elif date_range <= 365:  # Less than 1 year
+                format_str = "%Y-%m"
+                locator = mdates.MonthLocator(interval=max(1, len(sorted_dates) // 8))
+            else:  # More than 1 year
+                format_str = "%Y"
+                locator = mdates.YearLocator()
+        else:
+            # Use manual settings
+            format_str = xlabel_format if xlabel_format != "auto" else "%Y-%m-%d"
+
+            if xlabel_interval == "day":
+                locator = mdates.DayLocator(interval=max(1, len(sorted_dates) // 15))
+            elif xlabel_interval == "week":
+                locator = mdates.WeekdayLocator(
+                    interval=max(1, len(sorted_dates) // 10)
                 )
-                combined_frame.paste(base_frame, (0, 0))
-                combined_frame.paste(chart_frame, (0, base_height + spacer_width))
-
-            else:  # default to right
-                combined_width = base_width + spacer_width + chart_width
-                combined_height = max(base_height, chart_height)
-                combined_frame = Image.new(
-                    "RGB", (combined_width, combined_height), "white"
+            elif xlabel_interval == "month":
+                locator = mdates.MonthLocator(interval=max(1, len(sorted_dates) // 8))
+            elif xlabel_interval == "year":
+                locator = mdates.YearLocator()
+            else:
+                locator = mdates.WeekdayLocator(
+                    interval=max(1, len(sorted_dates) // 10)
                 )
-                combined_frame.paste(base_frame, (0, 0))
-                combined_frame.paste(chart_frame, (base_width + spacer_width, 0))
 
-        else:
-            combined_frame = base_frame
+        ax.xaxis.set_major_formatter(mdates.DateFormatter(format_str))
+        ax.xaxis.set_major_locator(locator)
 
-        combined_frames.append(combined_frame)
+        # Add minor ticks for better granularity
+        if date_range <= 90:
+            ax.xaxis.set_minor_locator(mdates.DayLocator(interval=1))
 
-    # Save combined gif
-    output_path = base_gif.replace(".gif", "_with_chart.gif")
+        setp(ax.xaxis.get_majorticklabels(), rotation=45, fontsize=8)
 
-    if combined_frames:
-        combined_frames[0].save(
-            output_path,
-            save_all=True,
-            append_images=combined_frames[1:],
-            duration=int(1000 / fps),
-            loop=loop,
-            optimize=True,
+        # Set consistent y-axis limits, ignoring missing values (NaN after the
+        # float cast)
+        all_values = np.concatenate([values for _, values in series.values()])
+
+        if not np.isnan(all_values).all():
+            y_min = float(np.nanmin(all_values))
+            y_max = float(np.nanmax(all_values))
+            y_range = y_max - y_min
+            if y_range > 0:
+                ax.set_ylim(y_min - y_range * 0.1, y_max + y_range * 0.1)
+            else:
+                ax.set_ylim(y_min - 0.01, y_max + 0.01)
+
+        fig.tight_layout()
+
+        chart_frames = _render_chart_frames(
+            fig, vline, sorted_dates, processes=processes
         )
 
-    # Clean up chart frames
-    for frame_path in chart_frames:
-        if os.path.exists(frame_path):
-            os.remove(frame_path)
+    except Exception as e:
+        print(f"Error creating chart frames: {str(e)}")
+        return []
 
-    return output_path
+    return chart_frames
 
 
 def landsat_timelapse_with_samples(
@@ -7751,6 +8470,7 @@ def landsat_timelapse_with_samples(
     chart_band_labels=None,
     indices=None,
     index_vis_params=None,
+    wait_mp4=True,
     **kwargs,
 ):
     """Create a Landsat timelapse with optional sample points and time series chart.
@@ -7820,6 +8540,7 @@ def landsat_timelapse_with_samples(
         chart_band_labels (dict, optional): Custom labels for bands in chart. Defaults to None.
         indices (list, optional): List of indices to calculate ['NDVI', 'EVI', 'NDWI', 'NDBI', 'MNDWI', 'NBR', 'SAVI', 'GNDVI', 'TCB', 'TCG', 'TCW']. Defaults to None.
         index_vis_params (dict, optional): Visualization parameters for indices. Defaults to None.
+        wait_mp4 (bool, optional): Whether to block until the MP4 is written. If False, the MP4 conversion runs in a background thread and the function returns an (out_gif, future) pair instead of the GIF path, where future is the concurrent.futures.Future of the conversion, or None if no conversion is pending. Defaults to True.
         **kwargs: Additional arguments for create_timeseries().
 
     Returns:
@@ -7838,27 +8559,10 @@ def landsat_timelapse_with_samples(
             indices = [indices]
 
         # Validate indices
-        valid_indices = [
-            "NDVI",
-            "EVI",
-            "NDWI",
-            "MNDWI",
-            "NDBI",
-            "NBR",
-            "SAVI",
-            "GNDVI",
-            "NDMI",
-            "TCB",
-            "TCG",
-            "TCW",
-            "MSAVI2",
-            "VARI",
-            "MCARI",
-        ]
         for idx in indices:
-            if idx not in valid_indices:
+            if idx not in _LANDSAT_INDICES:
                 raise ValueError(
-                    f"Index '{idx}' not supported. Valid indices: {valid_indices}"
+                    f"Index '{idx}' not supported. Valid indices: {list(_LANDSAT_INDICES)}"
                 )
 
         # If using indices, update defaults
@@ -7866,24 +8570,8 @@ def landsat_timelapse_with_samples(
             sample_bands = indices[:1]  # Default to first index
 
         if chart_ylabel == "Reflectance/Index Value":
-            if any(
-                idx
-                in [
-                    "NDVI",
-                    "EVI",
-                    "NDWI",
-                    "MNDWI",
-                    "NDBI",
-                    "NBR",
-                    "SAVI",
-                    "GNDVI",
-                    "NDMI",
-                    "MSAVI2",
-                    "VARI",
-                    "MCARI",
-                ]
-                for idx in indices
-            ):
+            # Tasseled Cap components are not index values, unlike the others
+            if any(idx not in ("TCB", "TCG", "TCW") for idx in indices):
                 chart_ylabel = "Index Value"
             elif any(idx in ["TCB", "TCG", "TCW"] for idx in indices):
                 chart_ylabel = "Tasseled Cap Component"
@@ -7919,12 +8607,11 @@ def landsat_timelapse_with_samples(
 
     # Set default marker colors if not provided
     if sample_points is not None and marker_colors is None:
-        marker_colors = ["red", "blue", "green", "orange", "purple"][
-            : len(sample_points)
-        ]
+        marker_colors = list(_SAMPLE_MARKER_COLORS[: len(sample_points)])
     elif sample_points is not None and len(marker_colors) < len(sample_points):
-        default_colors = ["red", "blue", "green", "orange", "purple"]
-        marker_colors.extend(default_colors[len(marker_colors) : len(sample_points)])
+        marker_colors.extend(
+            _SAMPLE_MARKER_COLORS[len(marker_colors) : len(sample_points)]
+        )
 
     # Set default sample bands if not provided
     if sample_bands is None:
@@ -7937,13 +8624,14 @@ def landsat_timelapse_with_samples(
         index_labels = get_landsat_index_chart_labels()
         chart_band_labels.update(index_labels)
 
-    # Adjust dimensions to avoid Earth Engine limits
-    if isinstance(roi, ee.Geometry):
-        roi_bounds = roi.bounds().getInfo()["coordinates"][0]
-        min_lon = min([coord[0] for coord in roi_bounds])
-        max_lon = max([coord[0] for coord in roi_bounds])
-        min_lat = min([coord[1] for coord in roi_bounds])
-        max_lat = max([coord[1] for coord in roi_bounds])
+    # Map chart display labels back to band names, built once for all bands
+    reverse_band_labels = {v: k for k, v in chart_band_labels.items()}
+
+    # Adjust dimensions to avoid Earth Engine limits. Dimensions given in WxH
+    # format are used as is.
+    adjusted_dimensions = dimensions
+    if isinstance(roi, ee.Geometry) and isinstance(dimensions, int):
+        min_lon, min_lat, max_lon, max_lat = _roi_bounds(roi)
 
         # Calculate aspect ratio and adjust dimensions
         lon_range = max_lon - min_lon
@@ -7952,29 +8640,34 @@ def landsat_timelapse_with_samples(
 
         max_pixels = 26214400  # Earth Engine limit
 
-        if isinstance(dimensions, int):
-            if aspect_ratio > 1:
-                width = min(dimensions, int(math.sqrt(max_pixels * aspect_ratio)))
-                height = int(width / aspect_ratio)
-            else:
-                height = min(dimensions, int(math.sqrt(max_pixels / aspect_ratio)))
-                width = int(height * aspect_ratio)
+        if aspect_ratio > 1:
+            width = min(dimensions, int(math.sqrt(max_pixels * aspect_ratio)))
+            height = int(width / aspect_ratio)
+        else:
+            height = min(dimensions, int(math.sqrt(max_pixels / aspect_ratio)))
+            width = int(height * aspect_ratio)
 
-            width = max(256, width)
-            height = max(256, height)
+        width = max(256, width)
+        height = max(256, height)
 
-            if width * height > max_pixels:
-                scale_factor = math.sqrt(max_pixels / (width * height))
-                width = int(width * scale_factor)
-                height = int(height * scale_factor)
+        if width * height > max_pixels:
+            scale_factor = math.sqrt(max_pixels / (width * height))
+            width = int(width * scale_factor)
+            height = int(height * scale_factor)
 
-            adjusted_dimensions = f"{width}x{height}"
-        else:
-            adjusted_dimensions = dimensions
+        adjusted_dimensions = f"{width}x{height}"
 
         print(f"Adjusted dimensions: {adjusted_dimensions}")
-    else:
-        adjusted_dimensions = dimensions
+
+    # Calculate only the indices that are displayed or sampled. The base timelapse
+    # and the sampling use the same set, so they share one time series.
+    if indices is not None:
+        index_names = _landsat_index_names(
+            indices,
+            bands,
+            sample_bands,
+            [reverse_band_labels.get(band, band) for band in sample_bands],
+        )
 
     # Create the base timelapse
     try:
@@ -7988,7 +8681,7 @@ def landsat_timelapse_with_samples(
                 start_date=start_date,
                 end_date=end_date,
                 bands=bands,
-                indices=indices,
+                indices=list(index_names),
                 vis_params=vis_params,
                 dimensions=adjusted_dimensions,
                 frames_per_second=frames_per_second,
@@ -8077,9 +8770,8 @@ def landsat_timelapse_with_samples(
     # If no sample points, return the base gif (map only)
     if sample_points is None or len(sample_points) == 0:
         print("No sample points provided. Returning map-only timelapse.")
-        if mp4:
-            gif_to_mp4(base_gif, base_gif.replace(".gif", ".mp4"))
-        return base_gif
+        future = _finalize_mp4(base_gif, wait=wait_mp4) if mp4 else None
+        return base_gif if wait_mp4 else (base_gif, future)
 
     # Get the Landsat time series for sampling
     if end_year is None:
@@ -8089,29 +8781,11 @@ def landsat_timelapse_with_samples(
     landsat_sample_bands = []
     for band in sample_bands:
         if band in chart_band_labels:
-            # Try to map display names back to actual band names
-            reverse_mapping = {v: k for k, v in chart_band_labels.items()}
-            if band in reverse_mapping:
-                landsat_sample_bands.append(reverse_mapping[band])
-            else:
-                landsat_sample_bands.append(band)
-        elif band in [
-            "NDVI",
-            "EVI",
-            "NDWI",
-            "MNDWI",
-            "NDBI",
-            "NBR",
-            "SAVI",
-            "GNDVI",
-            "NDMI",
-            "TCB",
-            "TCG",
-            "TCW",
-            "MSAVI2",
-            "VARI",
-            "MCARI",
-        ]:
+            landsat_sample_bands.append(band)
+        elif band in reverse_band_labels:
+            # Map display names back to actual band names
+            landsat_sample_bands.append(reverse_band_labels[band])
+        elif band in _LANDSAT_INDICES:
             landsat_sample_bands.append(band)  # Keep index names as-is
         else:
             landsat_sample_bands.append(band)
@@ -8120,8 +8794,8 @@ def landsat_timelapse_with_samples(
     try:
         # Create time series - if using indices, we need to add index calculation
         if indices is not None:
-            # Create base time series first
-            base_ts_collection = landsat_timeseries(
+            # Reuse the time series with indices built for the base timelapse
+            ts_collection = _landsat_index_timeseries(
                 roi,
                 start_year,
                 end_year,
@@ -8131,11 +8805,9 @@ def landsat_timelapse_with_samples(
                 frequency,
                 date_format,
                 step,
+                index_names,
             )
 
-            # Add indices to each image
-            ts_collection = base_ts_collection.map(calculate_landsat_indices)
-
             # Select only the bands we need for sampling
             ts_collection = ts_collection.select(landsat_sample_bands)
         else:
@@ -8155,22 +8827,11 @@ def landsat_timelapse_with_samples(
             # Select the sample bands
             ts_collection = base_landsat_collection.select(landsat_sample_bands)
 
-        # Check if time series is empty
-        ts_size = ts_collection.size().getInfo()
-        if ts_size == 0:
-            print("Warning: No time series data generated")
-            if mp4:
-                gif_to_mp4(base_gif, base_gif.replace(".gif", ".mp4"))
-            return base_gif
-
-        print(f"Generated {ts_size} time series images")
-
     except Exception as e:
         print(f"Error creating time series: {str(e)}")
         # Return base gif without sampling
-        if mp4:
-            gif_to_mp4(base_gif, base_gif.replace(".gif", ".mp4"))
-        return base_gif
+        future = _finalize_mp4(base_gif, wait=wait_mp4) if mp4 else None
+        return base_gif if wait_mp4 else (base_gif, future)
 
     # Sample points from the time series
     sample_data = {}
@@ -8186,102 +8847,131 @@ def landsat_timelapse_with_samples(
 
                 point_geometries.append(geometry)
 
-                # Sample the time series at this point for each band
-                for band_idx, band in enumerate(landsat_sample_bands):
-
-                    def sample_point_band(image):
-                        sampled = image.select(band).sample(geometry, 30)
-                        return sampled.first().set(
-                            {
-                                "system:time_start": image.get("system:time_start"),
-                                "system:date": image.get("system:date"),
-                            }
-                        )
+            points_fc = ee.FeatureCollection(
+                [
+                    ee.Feature(geometry, {"point_index": i})
+                    for i, geometry in enumerate(point_geometries)
+                ]
+            )
+            first_reducer = ee.Reducer.first().forEach(landsat_sample_bands)
 
-                    sampled = ts_collection.map(sample_point_band)
-
-                    # Get the time series data with error handling
-                    try:
-                        time_series = sampled.aggregate_array(
-                            "system:time_start"
-                        ).getInfo()
-                        values = sampled.aggregate_array(band).getInfo()
-                        dates = sampled.aggregate_array("system:date").getInfo()
-
-                        # Filter out null values
-                        valid_data = [
-                            (t, v, d)
-                            for t, v, d in zip(time_series, values, dates)
-                            if v is not None
-                        ]
+            # Sample all points and bands in every time series image on the server
+            def sample_points_in_image(image):
+                samples = image.select(landsat_sample_bands).reduceRegions(
+                    points_fc, first_reducer, 30
+                )
+                return samples.map(
+                    lambda feature: feature.set(
+                        {
+                            "time_start": image.get("system:time_start"),
+                            "date": image.get("system:date"),
+                        }
+                    )
+                )
 
-                        if valid_data:
-                            time_series, values, dates = zip(*valid_data)
+            # Fetch the samples of all points, bands and dates in a single request.
+            # Samples that are null in every band, e.g., under clouds, are dropped
+            # on the server rather than shipped and filtered out below.
+            not_null = ee.Filter.Or(
+                *[ee.Filter.notNull([band]) for band in landsat_sample_bands]
+            )
+            features = (
+                ts_collection.map(sample_points_in_image)
+                .flatten()
+                .filter(not_null)
+                .select(
+                    ["point_index", "time_start", "date"] + landsat_sample_bands,
+                    None,
+                    False,
+                )
+                .getInfo()["features"]
+            )
 
-                            # Convert timestamps to datetime objects
-                            datetimes = [
-                                datetime.fromtimestamp(ts / 1000) for ts in time_series
-                            ]
+            # Count the time series images from the samples rather than with a
+            # separate size() request
+            ts_size = len({feature["properties"]["time_start"] for feature in features})
+            if ts_size == 0:
+                print("Warning: No time series data generated")
+            else:
+                print(f"Generated {ts_size} time series images with valid samples")
 
-                            # Create unique key for point and band combination
-                            point_band_key = f"Point_{i+1}_{band}"
-                            if len(landsat_sample_bands) == 1:
-                                point_band_key = f"Point_{i+1}"
+            # Group the samples by point and band, keeping nulls for the filter below
+            series = {
+                (i, band): {"time_series": [], "values": [], "dates": []}
+                for i in range(len(point_geometries))
+                for band in landsat_sample_bands
+            }
+            for feature in features:
+                props = feature["properties"]
+                for band in landsat_sample_bands:
+                    info = series[(props["point_index"], band)]
+                    info["time_series"].append(props["time_start"])
+                    info["values"].append(props.get(band))
+                    info["dates"].append(props["date"])
+
+            # Resolve the band display names once rather than per point
+            band_displays = {
+                band: chart_band_labels.get(band, band) for band in landsat_sample_bands
+            }
 
-                            # Get display name for band
-                            band_display = chart_band_labels.get(band, band)
-                            if len(landsat_sample_bands) > 1:
-                                label = f"Point {i+1} ({band_display})"
-                            else:
-                                label = f"Point {i+1}"
-
-                            # Color assignment for multi-band sampling
-                            if len(landsat_sample_bands) > 1:
-                                base_color = (
-                                    marker_colors[i]
-                                    if i < len(marker_colors)
-                                    else "red"
-                                )
-                                # Modify color for different bands
-                                if band_idx == 0:
-                                    color = base_color
-                                elif band_idx == 1:
-                                    color = (
-                                        f"dark{base_color}"
-                                        if base_color != "red"
-                                        else "darkred"
-                                    )
-                                else:
-                                    color = (
-                                        f"light{base_color}"
-                                        if base_color != "red"
-                                        else "lightcoral"
-                                    )
-                            else:
-                                color = (
-                                    marker_colors[i]
-                                    if i < len(marker_colors)
-                                    else "red"
-                                )
+            for i, geometry in enumerate(point_geometries):
+                # Color assignment for multi-band sampling: the point color for
+                # the first band, then darker and lighter variants of it
+                base_color = marker_colors[i] if i < len(marker_colors) else "red"
+                if len(landsat_sample_bands) > 1:
+                    if base_color != "red":
+                        band_colors = [
+                            base_color,
+                            f"dark{base_color}",
+                            f"light{base_color}",
+                        ]
+                    else:
+                        band_colors = [base_color, "darkred", "lightcoral"]
+                else:
+                    band_colors = [base_color]
 
-                            sample_data[point_band_key] = {
-                                "dates": datetimes,
-                                "values": list(values),
-                                "date_strings": list(dates),
-                                "color": color,
-                                "geometry": geometry,
-                                "label": label,
-                                "band": band,
-                                "point_idx": i,
-                            }
-
-                            print(f"Point {i+1} ({band}): {len(values)} valid samples")
+                for band_idx, band in enumerate(landsat_sample_bands):
+                    info = series[(i, band)]
+
+                    # Filter out null values (NaN after the float cast)
+                    values = np.array(info["values"], dtype=float)
+                    valid = ~np.isnan(values)
+
+                    if valid.any():
+                        # Convert the millisecond timestamps to datetime
+                        # objects in one vectorized pass
+                        datetimes = np.array(
+                            info["time_series"], dtype="datetime64[ms]"
+                        )[valid].tolist()
+                        values = values[valid].tolist()
+                        dates = np.array(info["dates"], dtype=object)[valid]
+
+                        # Create unique key for point and band combination
+                        point_band_key = f"Point_{i+1}_{band}"
+                        if len(landsat_sample_bands) == 1:
+                            point_band_key = f"Point_{i+1}"
+
+                        if len(landsat_sample_bands) > 1:
+                            label = f"Point {i+1} ({band_displays[band]})"
                         else:
-                            print(f"Warning: No valid data for point {i+1} ({band})")
+                            label = f"Point {i+1}"
+
+                        color = band_colors[min(band_idx, len(band_colors) - 1)]
+
+                        sample_data[point_band_key] = {
+                            "dates": datetimes,
+                            "values": list(values),
+                            "date_strings": list(dates),
+                            "color": color,
+                            "geometry": geometry,
+                            "label": label,
+                            "band": band,
+                            "point_idx": i,
+                        }
 
-                    except Exception as e:
-                        print(f"Error sampling point {i+1} ({band}): {str(e)}")
-                        continue
+                        print(f"Point {i+1} ({band}): {len(values)} valid samples")
+                    else:
+                        print(f"Warning: No valid data for point {i+1} ({band})")
 
         except Exception as e:
             print(f"Error during point sampling: {str(e)}")
@@ -8292,13 +8982,9 @@ def landsat_timelapse_with_samples(
     # Add sample point markers to the base gif if requested
     if show_sample_markers and sample_points is not None and len(sample_points) > 0:
         try:
-            # Get ROI bounds for coordinate conversion
-            roi_bounds = roi.bounds().getInfo()["coordinates"][0]
-            min_lon = min([coord[0] for coord in roi_bounds])
-            max_lon = max([coord[0] for coord in roi_bounds])
-            min_lat = min([coord[1] for coord in roi_bounds])
-            max_lat = max([coord[1] for coord in roi_bounds])
-            bounds = [min_lon, min_lat, max_lon, max_lat]
+            # Get ROI bounds for coordinate conversion, reusing the bounds
+            # fetched for the dimension adjustment when available
+            bounds = _roi_bounds(roi)
 
             # Add markers to the gif
             add_sample_markers_to_gif(
@@ -8309,11 +8995,7 @@ def landsat_timelapse_with_samples(
                 marker_size,
                 marker_style,
                 bounds,
-                (
-                    adjusted_dimensions
-                    if "adjusted_dimensions" in locals()
-                    else dimensions
-                ),
+                adjusted_dimensions,
             )
             print("Added sample markers to GIF")
 
@@ -8327,11 +9009,7 @@ def landsat_timelapse_with_samples(
                 sample_data,
                 chart_title,
                 chart_ylabel,
-                (
-                    adjusted_dimensions
-                    if "adjusted_dimensions" in locals()
-                    else dimensions
-                ),
+                adjusted_dimensions,
                 frames_per_second,
                 chart_xlabel_format,
                 chart_xlabel_interval,
@@ -8358,255 +9036,218 @@ def landsat_timelapse_with_samples(
         final_gif = base_gif
 
     # Handle MP4 conversion
-    if mp4:
-        gif_to_mp4(final_gif, final_gif.replace(".gif", ".mp4"))
+    future = _finalize_mp4(final_gif, wait=wait_mp4) if mp4 else None
+
+    return final_gif if wait_mp4 else (final_gif, future)
+
 
-    return final_gif
+# Tasseled Cap coefficients for Landsat 8 OLI surface reflectance, one row each
+# for brightness, greenness and wetness over Blue, Green, Red, NIR, SWIR1, SWIR2.
+_LANDSAT_TASSELED_CAP_COEFFICIENTS = (
+    (0.3037, 0.2793, 0.4743, 0.5585, 0.5082, 0.1863),
+    (-0.2848, -0.2435, -0.5436, 0.7243, 0.0840, -0.1800),
+    (0.1509, 0.1973, 0.3279, 0.3406, -0.7112, -0.4572),
+)
 
 
-def calculate_landsat_indices(image):
+def calculate_landsat_indices(image, indices=None):
     """Calculate common vegetation and spectral indices for Landsat images.
 
     Args:
         image (ee.Image): Landsat image with bands Blue, Green, Red, NIR, SWIR1, SWIR2
+        indices (list, optional): The indices to calculate. Defaults to None, which calculates all supported indices.
 
     Returns:
         ee.Image: Image with added index bands
     """
+    if indices is None:
+        indices = _LANDSAT_INDICES
+
+    # Select the bands used by the expression-based indices once and share them
+    blue = image.select("Blue")
+    green = image.select("Green")
+    red = image.select("Red")
+    nir = image.select("NIR")
+
+    # Only build the requested indices, so that the graph sent to Earth Engine
+    # carries no unused band math
+    index_bands = []
+
     # Normalized Difference Vegetation Index
-    ndvi = image.normalizedDifference(["NIR", "Red"]).rename("NDVI")
+    if "NDVI" in indices:
+        index_bands.append(image.normalizedDifference(["NIR", "Red"]).rename("NDVI"))
 
     # Enhanced Vegetation Index
-    evi = image.expression(
-        "2.5 * ((NIR - RED) / (NIR + 6 * RED - 7.5 * BLUE + 1))",
-        {
-            "NIR": image.select("NIR"),
-            "RED": image.select("Red"),
-            "BLUE": image.select("Blue"),
-        },
-    ).rename("EVI")
+    if "EVI" in indices:
+        evi = image.expression(
+            "2.5 * ((NIR - RED) / (NIR + 6 * RED - 7.5 * BLUE + 1))",
+            {"NIR": nir, "RED": red, "BLUE": blue},
+        )
+        index_bands.append(evi.rename("EVI"))
 
     # Normalized Difference Water Index
-    ndwi = image.normalizedDifference(["Green", "NIR"]).rename("NDWI")
+    if "NDWI" in indices:
+        index_bands.append(image.normalizedDifference(["Green", "NIR"]).rename("NDWI"))
 
     # Modified Normalized Difference Water Index
-    mndwi = image.normalizedDifference(["Green", "SWIR1"]).rename("MNDWI")
+    if "MNDWI" in indices:
+        mndwi = image.normalizedDifference(["Green", "SWIR1"])
+        index_bands.append(mndwi.rename("MNDWI"))
 
     # Normalized Difference Built-up Index
-    ndbi = image.normalizedDifference(["SWIR1", "NIR"]).rename("NDBI")
+    if "NDBI" in indices:
+        index_bands.append(image.normalizedDifference(["SWIR1", "NIR"]).rename("NDBI"))
 
     # Normalized Burn Ratio
-    nbr = image.normalizedDifference(["NIR", "SWIR2"]).rename("NBR")
+    if "NBR" in indices:
+        index_bands.append(image.normalizedDifference(["NIR", "SWIR2"]).rename("NBR"))
 
     # Soil Adjusted Vegetation Index
-    savi = image.expression(
-        "((NIR - RED) / (NIR + RED + 0.5)) * (1.5)",
-        {"NIR": image.select("NIR"), "RED": image.select("Red")},
-    ).rename("SAVI")
+    if "SAVI" in indices:
+        savi = image.expression(
+            "((NIR - RED) / (NIR + RED + 0.5)) * (1.5)",
+            {"NIR": nir, "RED": red},
+        )
+        index_bands.append(savi.rename("SAVI"))
 
     # Green Normalized Difference Vegetation Index
-    gndvi = image.normalizedDifference(["NIR", "Green"]).rename("GNDVI")
+    if "GNDVI" in indices:
+        gndvi = image.normalizedDifference(["NIR", "Green"])
+        index_bands.append(gndvi.rename("GNDVI"))
 
     # Normalized Difference Moisture Index
-    ndmi = image.normalizedDifference(["NIR", "SWIR1"]).rename("NDMI")
+    if "NDMI" in indices:
+        index_bands.append(image.normalizedDifference(["NIR", "SWIR1"]).rename("NDMI"))
 
     # Modified Soil Adjusted Vegetation Index 2
-    msavi2 = image.expression(
-        "(2 * NIR + 1 - sqrt(pow((2 * NIR + 1), 2) - 8 * (NIR - RED))) / 2",
-        {"NIR": image.select("NIR"), "RED": image.select("Red")},
-    ).rename("MSAVI2")
+    if "MSAVI2" in indices:
+        msavi2 = image.expression(
+            "(2 * NIR + 1 - sqrt(pow((2 * NIR + 1), 2) - 8 * (NIR - RED))) / 2",
+            {"NIR": nir, "RED": red},
+        )
+        index_bands.append(msavi2.rename("MSAVI2"))
 
     # Visible Atmospherically Resistant Index
-    vari = image.expression(
-        "(GREEN - RED) / (GREEN + RED - BLUE)",
-        {
-            "GREEN": image.select("Green"),
-            "RED": image.select("Red"),
-            "BLUE": image.select("Blue"),
-        },
-    ).rename("VARI")
+    if "VARI" in indices:
+        vari = image.expression(
+            "(GREEN - RED) / (GREEN + RED - BLUE)",
+            {"GREEN": green, "RED": red, "BLUE": blue},
+        )
+        index_bands.append(vari.rename("VARI"))
 
     # Modified Chlorophyll Absorption Ratio Index
-    mcari = image.expression(
-        "((RE - RED) - 0.2 * (RE - GREEN)) * (RE / RED)",
-        {
-            "RE": image.select("NIR"),  # Using NIR as proxy for Red Edge
-            "RED": image.select("Red"),
-            "GREEN": image.select("Green"),
-        },
-    ).rename("MCARI")
+    if "MCARI" in indices:
+        mcari = image.expression(
+            "((RE - RED) - 0.2 * (RE - GREEN)) * (RE / RED)",
+            {
+                "RE": nir,  # Using NIR as proxy for Red Edge
+                "RED": red,
+                "GREEN": green,
+            },
+        )
+        index_bands.append(mcari.rename("MCARI"))
 
     # Tasseled Cap Transformation coefficients for Landsat 8 OLI
-    # These coefficients are for surface reflectance data
-    tcb = image.expression(
-        "0.3037*BLUE + 0.2793*GREEN + 0.4743*RED + 0.5585*NIR + 0.5082*SWIR1 + 0.1863*SWIR2",
-        {
-            "BLUE": image.select("Blue"),
-            "GREEN": image.select("Green"),
-            "RED": image.select("Red"),
-            "NIR": image.select("NIR"),
-            "SWIR1": image.select("SWIR1"),
-            "SWIR2": image.select("SWIR2"),
-        },
-    ).rename("TCB")
-
-    tcg = image.expression(
-        "-0.2848*BLUE - 0.2435*GREEN - 0.5436*RED + 0.7243*NIR + 0.0840*SWIR1 - 0.1800*SWIR2",
-        {
-            "BLUE": image.select("Blue"),
-            "GREEN": image.select("Green"),
-            "RED": image.select("Red"),
-            "NIR": image.select("NIR"),
-            "SWIR1": image.select("SWIR1"),
-            "SWIR2": image.select("SWIR2"),
-        },
-    ).rename("TCG")
-
-    tcw = image.expression(
-        "0.1509*BLUE + 0.1973*GREEN + 0.3279*RED + 0.3406*NIR - 0.7112*SWIR1 - 0.4572*SWIR2",
-        {
-            "BLUE": image.select("Blue"),
-            "GREEN": image.select("Green"),
-            "RED": image.select("Red"),
-            "NIR": image.select("NIR"),
-            "SWIR1": image.select("SWIR1"),
-            "SWIR2": image.select("SWIR2"),
-        },
-    ).rename("TCW")
+    # These coefficients are for surface reflectance data. Brightness, greenness
+    # and wetness are computed together as one matrix product of the six bands.
+    tasseled_cap_names = [name for name in ("TCB", "TCG", "TCW") if name in indices]
+    if tasseled_cap_names:
+        tasseled_cap = (
+            image.select(["Blue", "Green", "Red", "NIR", "SWIR1", "SWIR2"])
+            .toArray()
+            .toArray(1)
+        )
+        tasseled_cap = (
+            ee.Image(ee.Array(_LANDSAT_TASSELED_CAP_COEFFICIENTS))
+            .matrixMultiply(tasseled_cap)
+            .arrayProject([0])
+            .arrayFlatten([["TCB", "TCG", "TCW"]])
+        )
+        index_bands.append(tasseled_cap.select(tasseled_cap_names))
 
-    return image.addBands(
-        [
-            ndvi,
-            evi,
-            ndwi,
-            mndwi,
-            ndbi,
-            nbr,
-            savi,
-            gndvi,
-            ndmi,
-            msavi2,
-            vari,
-            mcari,
-            tcb,
-            tcg,
-            tcw,
-        ]
-    )
+    return image.addBands(index_bands)
 
 
 def get_default_landsat_index_vis_params():
     """Get default visualization parameters for different Landsat indices."""
+    # Build fresh inner dicts and palettes so callers can edit them safely
     return {
-        "NDVI": {
-            "min": -0.1,
-            "max": 1,
-            "palette": ["#d7191c", "#fdae61", "#ffffbf", "#abd9e9", "#2c7bb6"],
-        },
-        "EVI": {
-            "min": -0.2,
-            "max": 0.8,
-            "palette": ["#d7191c", "#fdae61", "#ffffbf", "#abd9e9", "#2c7bb6"],
-        },
-        "NDWI": {
-            "min": -0.3,
-            "max": 0.8,
-            "palette": ["#8b4513", "#daa520", "#ffffbf", "#87ceeb", "#0000ff"],
-        },
-        "MNDWI": {
-            "min": -0.3,
-            "max": 0.8,
-            "palette": ["#8b4513", "#daa520", "#ffffbf", "#87ceeb", "#0000ff"],
-        },
-        "NDBI": {
-            "min": -0.5,
-            "max": 0.5,
-            "palette": ["#0000ff", "#87ceeb", "#ffffbf", "#daa520", "#8b4513"],
-        },
-        "NBR": {
-            "min": -0.5,
-            "max": 0.8,
-            "palette": ["#d7191c", "#fdae61", "#ffffbf", "#abd9e9", "#2c7bb6"],
-        },
-        "SAVI": {
-            "min": -0.2,
-            "max": 0.8,
-            "palette": ["#d7191c", "#fdae61", "#ffffbf", "#abd9e9", "#2c7bb6"],
-        },
-        "GNDVI": {
-            "min": -0.2,
-            "max": 0.8,
-            "palette": ["#d7191c", "#fdae61", "#ffffbf", "#abd9e9", "#2c7bb6"],
-        },
-        "NDMI": {
-            "min": -0.2,
-            "max": 0.6,
-            "palette": ["#8b4513", "#daa520", "#ffffbf", "#87ceeb", "#0000ff"],
-        },
-        "MSAVI2": {
-            "min": -0.2,
-            "max": 0.8,
-            "palette": ["#d7191c", "#fdae61", "#ffffbf", "#abd9e9", "#2c7bb6"],
-        },
-        "VARI": {
-            "min": -0.2,
-            "max": 0.6,
-            "palette": ["#d7191c", "#fdae61", "#ffffbf", "#abd9e9", "#2c7bb6"],
-        },
-        "MCARI": {
-            "min": 0,
-            "max": 2,
-            "palette": ["#d7191c", "#fdae61", "#ffffbf", "#abd9e9", "#2c7bb6"],
-        },
-        "TCB": {
-            "min": 0,
-            "max": 0.4,
-            "palette": ["#000000", "#404040", "#808080", "#c0c0c0", "#ffffff"],
-        },
-        "TCG": {
-            "min": -0.1,
-            "max": 0.1,
-            "palette": ["#8b4513", "#daa520", "#ffffbf", "#90ee90", "#006400"],
-        },
-        "TCW": {
-            "min": -0.2,
-            "max": 0.1,
-            "palette": ["#8b4513", "#daa520", "#ffffbf", "#87ceeb", "#0000ff"],
-        },
+        index: {**vis_params, "palette": list(vis_params["palette"])}
+        for index, vis_params in _DEFAULT_LANDSAT_INDEX_VIS_PARAMS.items()
     }
 
 
 def get_default_landsat_band_labels():
     """Get default chart labels for Landsat bands."""
-    return {
-        "Blue": "Blue",
-        "Green": "Green",
-        "Red": "Red",
-        "NIR": "NIR",
-        "SWIR1": "SWIR1",
-        "SWIR2": "SWIR2",
-    }
+    return dict(_DEFAULT_LANDSAT_BAND_LABELS)
 
 
 def get_landsat_index_chart_labels():
     """Get chart labels for different Landsat indices."""
-    return {
-        "NDVI": "NDVI",
-        "EVI": "EVI",
-        "NDWI": "NDWI",
-        "MNDWI": "MNDWI",
-        "NDBI": "NDBI",
-        "NBR": "NBR",
-        "SAVI": "SAVI",
-        "GNDVI": "GNDVI",
-        "NDMI": "NDMI",
-        "MSAVI2": "MSAVI2",
-        "VARI": "VARI",
-        "MCARI": "MCARI",
-        "TCB": "Tasseled Cap Brightness",
-        "TCG": "Tasseled Cap Greenness",
-        "TCW": "Tasseled Cap Wetness",
-    }
+    return dict(_LANDSAT_INDEX_CHART_LABELS)
+
+
+def _landsat_index_timeseries(
+    roi,
+    start_year,
+    end_year,
+    start_date,
+    end_date,
+    apply_fmask,
+    frequency,
+    date_format,
+    step,
+    indices=None,
+):
+    """Builds a Landsat time series with index bands.
+
+    Args:
+        roi (ee.Geometry): The region of interest.
+        start_year (int): Starting year for the timelapse.
+        end_year (int): Ending year for the timelapse.
+        start_date (str): Starting date (month-day) each year.
+        end_date (str): Ending date (month-day) each year.
+        apply_fmask (bool): Whether to apply Fmask to mask clouds, shadows, and snow.
+        frequency (str): Frequency of the timelapse.
+        date_format (str): Date format for the timelapse.
+        step (int): The step size to use when creating the date sequence.
+        indices (tuple, optional): The indices to calculate. Defaults to None, which calculates all supported indices.
+
+    Returns:
+        ee.ImageCollection: The time series with the calculate_landsat_indices bands added.
+    """
+    if indices is None:
+        indices = _LANDSAT_INDICES
+
+    return landsat_timeseries(
+        roi,
+        start_year,
+        end_year,
+        start_date,
+        end_date,
+        apply_fmask,
+        frequency,
+        date_format,
+        step,
+    ).map(lambda image: calculate_landsat_indices(image, indices))
+
+
+def _landsat_index_names(*band_lists):
+    """Finds the supported Landsat indices named in any of the given band lists.
+
+    Args:
+        *band_lists (list | str | None): Band or index names, e.g., the displayed and sampled bands.
+
+    Returns:
+        tuple: The named indices in calculation order, or all supported indices if none is named.
+    """
+    names = set()
+    for bands in band_lists:
+        if isinstance(bands, str):
+            bands = [bands]
+        names.update(bands or [])
+    index_names = tuple(index for index in _LANDSAT_INDICES if index in names)
+    return index_names if index_names else _LANDSAT_INDICES
 
 
 def create_landsat_index_timelapse(
@@ -8662,8 +9303,8 @@ def create_landsat_index_timelapse(
     if end_year is None:
         end_year = get_current_year()
 
-    # Create time series with indices
-    base_ts_collection = landsat_timeseries(
+    # Create time series with the displayed indices only
+    ts_collection = _landsat_index_timeseries(
         roi,
         start_year,
         end_year,
@@ -8673,11 +9314,9 @@ def create_landsat_index_timelapse(
         frequency,
         date_format,
         step,
+        _landsat_index_names(indices, bands),
     )
 
-    # Add indices to each image
-    ts_collection = base_ts_collection.map(calculate_landsat_indices)
-
     # Use create_timelapse with the index collection
     start = f"{start_year}-{start_date}"
     end = f"{end_year}-{end_date}"
@@ -8725,10 +9364,11 @@ def create_landsat_index_timelapse(
         colorbar_xy,
         colorbar_size,
         loop,
-        False,
-        fading,
-        1,
-        1,
+        # The series is already stepped by landsat_timeseries
+        mp4=False,
+        fading=fading,
+        parallel_scale=1,
+        step=1,
     )
 
 
@@ -8740,6 +9380,7 @@ def create_landsat_time_series_chart_frames(
     fps,
     xlabel_format="auto",
     xlabel_interval="auto",
+    processes=None,
 ):
     """Create frames for the Landsat time series chart with current time indicator.
 
@@ -8751,32 +9392,36 @@ def create_landsat_time_series_chart_frames(
         fps (int): Frames per second
         xlabel_format (str): Format for x-axis labels
         xlabel_interval (str): Interval for x-axis labels
+        processes (int, optional): The number of worker processes used to render the frames. Frames are rendered in the current process unless this is greater than 1. Defaults to None.
 
     Returns:
-        list: List of paths to chart frame images
+        list: List of chart frames as PIL images
     """
-    import matplotlib.pyplot as plt
     import matplotlib.dates as mdates
+    from matplotlib.artist import setp
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
     import numpy as np
     from datetime import datetime
-    import tempfile
 
     if not sample_data:
         return []
 
-    # Get all unique dates across all points/bands
-    all_dates = set()
-    for point_data in sample_data.values():
-        all_dates.update(point_data["dates"])
+    # Get all unique dates across all points/bands, sorted
+    all_dates = np.concatenate(
+        [
+            np.asarray(point_data["dates"], dtype="datetime64[ms]")
+            for point_data in sample_data.values()
+        ]
+    )
 
-    if not all_dates:
+    if all_dates.size == 0:
         return []
 
-    sorted_dates = sorted(list(all_dates))
+    sorted_dates = np.unique(all_dates).tolist()
 
     # Create chart frames
     chart_frames = []
-    temp_dir = tempfile.mkdtemp()
 
     # Calculate chart dimensions
     if isinstance(dimensions, str) and "x" in dimensions:
@@ -8788,113 +9433,115 @@ def create_landsat_time_series_chart_frames(
     chart_height = height
 
     try:
-        for frame_idx, current_date in enumerate(sorted_dates):
-            fig, ax = plt.subplots(
-                figsize=(chart_width / 100, chart_height / 100), dpi=100
+        # The series, axes and layout are the same for every frame, so draw them
+        # once and only move the current time indicator per frame.
+        fig = Figure(
+            figsize=(chart_width / 100, chart_height / 100),
+            dpi=100,
+            facecolor="white",
+        )
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+
+        # Cast every series to numpy arrays once, shared by the plots and the
+        # y-axis limits below (missing values become NaN)
+        series = {
+            point_key: (
+                np.asarray(point_data["dates"], dtype="datetime64[ms]"),
+                np.asarray(point_data["values"], dtype=float),
             )
+            for point_key, point_data in sample_data.items()
+        }
 
-            # Plot all time series
-            for point_key, point_data in sample_data.items():
-                if point_data["dates"] and point_data["values"]:
-                    # Use custom label if available, otherwise use point_key
-                    label = point_data.get("label", point_key)
-
-                    ax.plot(
-                        point_data["dates"],
-                        point_data["values"],
-                        color=point_data["color"],
-                        label=label,
-                        linewidth=2,
-                        marker="o",
-                        markersize=4,
-                    )
+        # Plot all time series
+        for point_key, point_data in sample_data.items():
+            dates, values = series[point_key]
+            if dates.size and values.size:
+                # Use custom label if available, otherwise use point_key
+                label = point_data.get("label", point_key)
+
+                ax.plot(
+                    dates,
+                    values,
+                    color=point_data["color"],
+                    label=label,
+                    linewidth=2,
+                    marker="o",
+                    markersize=4,
+                )
 
-            # Add vertical line for current time
-            ax.axvline(
-                x=current_date, color="red", linestyle="--", linewidth=2, alpha=0.8
-            )
+        # Add vertical line for current time, moved to each frame's date below
+        vline = ax.axvline(
+            x=sorted_dates[0], color="red", linestyle="--", linewidth=2, alpha=0.8
+        )
 
-            # Formatting
-            ax.set_xlabel("Date", fontsize=10)
-            ax.set_ylabel(chart_ylabel, fontsize=10)
-            ax.set_title(chart_title, fontsize=12)
-            ax.legend(fontsize=8, loc="upper left")
-            ax.grid(True, alpha=0.3)
-
-            # Format x-axis based on parameters or auto-detect
-            date_range = (max(sorted_dates) - min(sorted_dates)).days
-
-            if xlabel_format == "auto" or xlabel_interval == "auto":
-                # Auto-detect based on data characteristics
-                # Landsat typically has longer time series (annual data)
-                if (
-                    date_range <= 365
-                ):  # Less than 1 year - likely monthly/quarterly data
-                    format_str = "%Y-%m"
-                    locator = mdates.MonthLocator(
-                        interval=max(1, len(sorted_dates) // 8)
-                    )
-                elif date_range <= 1825:  # Less than 5 years - yearly data
-                    format_str = "%Y"
-                    locator = mdates.YearLocator()
-                else:  # Long time series - multi-year intervals
-                    format_str = "%Y"
-                    year_interval = max(1, len(sorted_dates) // 15)
-                    locator = mdates.YearLocator(interval=year_interval)
+        # Formatting
+        ax.set_xlabel("Date", fontsize=10)
+        ax.set_ylabel(chart_ylabel, fontsize=10)
+        ax.set_title(chart_title, fontsize=12)
+        ax.legend(fontsize=8, loc="upper left")
+        ax.grid(True, alpha=0.3)
+
+        # Format x-axis based on parameters or auto-detect
+        # The dates are sorted, so the range spans the first and last date
+        date_range = (sorted_dates[-1] - sorted_dates[0]).days
+
+        if xlabel_format == "auto" or xlabel_interval == "auto":
+            # Auto-detect based on data characteristics
+            # Landsat typically has longer time series (annual data)
+            if date_range <= 365:  # Less than 1 year - likely monthly/quarterly data
+                format_str = "%Y-%m"
+                locator = mdates.MonthLocator(interval=max(1, len(sorted_dates) // 8))
+            elif date_range <= 1825:  # Less than 5 years - yearly data
+                format_str = "%Y"
+                locator = mdates.YearLocator()
+            else:  # Long time series - multi-year intervals
+                format_str = "%Y"
+                year_interval = max(1, len(sorted_dates) // 15)
+                locator = mdates.YearLocator(interval=year_interval)
+        else:
+            # Use manual settings
+            format_str = xlabel_format if xlabel_format != "auto" else "%Y"
+
+            if xlabel_interval == "day":
+                locator = mdates.DayLocator(interval=max(1, len(sorted_dates) // 15))
+            elif xlabel_interval == "week":
+                locator = mdates.WeekdayLocator(
+                    interval=max(1, len(sorted_dates) // 10)
+                )
+            elif xlabel_interval == "month":
+                locator = mdates.MonthLocator(interval=max(1, len(sorted_dates) // 8))
+            elif xlabel_interval == "year":
+                locator = mdates.YearLocator()
             else:
-                # Use manual settings
-                format_str = xlabel_format if xlabel_format != "auto" else "%Y"
-
-                if xlabel_interval == "day":
-                    locator = mdates.DayLocator(
-                        interval=max(1, len(sorted_dates) // 15)
-                    )
-                elif xlabel_interval == "week":
-                    locator = mdates.WeekdayLocator(
-                        interval=max(1, len(sorted_dates) // 10)
-                    )
-                elif xlabel_interval == "month":
-                    locator = mdates.MonthLocator(
-                        interval=max(1, len(sorted_dates) // 8)
-                    )
-                elif xlabel_interval == "year":
-                    locator = mdates.YearLocator()
-                else:
-                    locator = mdates.YearLocator()
+                locator = mdates.YearLocator()
 
-            ax.xaxis.set_major_formatter(mdates.DateFormatter(format_str))
-            ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter(format_str))
+        ax.xaxis.set_major_locator(locator)
 
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, fontsize=8)
+        setp(ax.xaxis.get_majorticklabels(), rotation=45, fontsize=8)
 
-            # Set consistent y-axis limits
-            all_values = []
-            for point_data in sample_data.values():
-                all_values.extend([v for v in point_data["values"] if v is not None])
+        # Set consistent y-axis limits, ignoring missing values (NaN after the
+        # float cast)
+        all_values = np.concatenate([values for _, values in series.values()])
 
-            if all_values:
-                y_min, y_max = min(all_values), max(all_values)
-                y_range = y_max - y_min
-                if y_range > 0:
-                    ax.set_ylim(y_min - y_range * 0.1, y_max + y_range * 0.1)
-                else:
-                    ax.set_ylim(y_min - 0.01, y_max + 0.01)
-
-            plt.tight_layout()
+        if not np.isnan(all_values).all():
+            y_min = float(np.nanmin(all_values))
+            y_max = float(np.nanmax(all_values))
+            y_range = y_max - y_min
+            if y_range > 0:
+                ax.set_ylim(y_min - y_range * 0.1, y_max + y_range * 0.1)
+            else:
+                ax.set_ylim(y_min - 0.01, y_max + 0.01)
 
-            # Save frame
-            frame_path = os.path.join(temp_dir, f"chart_frame_{frame_idx:04d}.png")
-            plt.savefig(frame_path, dpi=100, bbox_inches="tight", facecolor="white")
-            plt.close()
+        fig.tight_layout()
 
-            chart_frames.append(frame_path)
+        chart_frames = _render_chart_frames(
+            fig, vline, sorted_dates, processes=processes
+        )
 
     except Exception as e:
         print(f"Error creating chart frames: {str(e)}")
-        # Clean up any created frames
-        for frame_path in chart_frames:
-            if os.path.exists(frame_path):
-                os.remove(frame_path)
         return []
 
     return chart_frames
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+"""Tests for `timelapse` module."""
+
+import unittest
+
+from geemap import timelapse
+
+
+class TestBoundsFromRing(unittest.TestCase):
+    """Tests for _bounds_from_ring."""
+
+    def test_axis_aligned_box(self):
+        """Verifies the bounds of a box ordered like ee.Geometry.bounds()."""
+        ring = [[-10, 20], [30, 20], [30, 40], [-10, 40], [-10, 20]]
+        self.assertEqual(timelapse._bounds_from_ring(ring), [-10, 20, 30, 40])
+
+    def test_non_box_ring(self):
+        """Verifies the bounds of a ring that is not an axis-aligned box."""
+        ring = [[0, 0], [4, 1], [5, 6], [-2, 3], [0, 0]]
+        self.assertEqual(timelapse._bounds_from_ring(ring), [-2, 0, 5, 6])
+
+    def test_five_vertices_in_other_order(self):
+        """Verifies that a five-vertex ring not ordered [SW, SE, NE, NW, SW] is scanned."""
+        ring = [[30, 40], [-10, 40], [-10, 20], [30, 20], [30, 40]]
+        self.assertEqual(timelapse._bounds_from_ring(ring), [-10, 20, 30, 40])
+
+
+class TestChartLayout(unittest.TestCase):
+    """Tests for _chart_layout."""
+
+    def test_right(self):
+        """Verifies the chart is placed to the right of the frame."""
+        self.assertEqual(
+            timelapse._chart_layout("right", (100, 80), (60, 90), 10),
+            ((170, 90), (0, 0), (110, 0)),
+        )
+
+    def test_left(self):
+        """Verifies the chart is placed to the left of the frame."""
+        self.assertEqual(
+            timelapse._chart_layout("left", (100, 80), (60, 90), 10),
+            ((170, 90), (70, 0), (0, 0)),
+        )
+
+    def test_bottom(self):
+        """Verifies the chart is placed below the frame."""
+        self.assertEqual(
+            timelapse._chart_layout("bottom", (100, 80), (120, 50), 10),
+            ((120, 140), (0, 0), (0, 90)),
+        )
+
+    def test_unknown_position_defaults_to_right(self):
+        """Verifies an unknown position places the chart on the right."""
+        self.assertEqual(
+            timelapse._chart_layout("top", (100, 80), (60, 90), 10),
+            timelapse._chart_layout("right", (100, 80), (60, 90), 10),
+        )
+
+
+class TestPixelCoordinates(unittest.TestCase):
+    """Tests for get_pixel_coordinates_from_geo_batch."""
+
+    def test_batch_matches_single_point(self):
+        """Verifies the batch conversion matches the per-point conversion."""
+        roi_bounds = [-120.5, 35.25, -119.0, 36.75]
+        lon = [-120.5, -119.0, -119.75, -121.0, -118.0, -120.123, -119.001]
+        lat = [35.25, 36.75, 36.0, 37.0, 34.0, 35.987, 36.749]
+
+        pixel_x, pixel_y = timelapse.get_pixel_coordinates_from_geo_batch(
+            lon, lat, roi_bounds, 640, 480
+        )
+
+        for i, (x, y) in enumerate(zip(lon, lat)):
+            self.assertEqual(
+                (int(pixel_x[i]), int(pixel_y[i])),
+                timelapse.get_pixel_coordinates_from_geo(x, y, roi_bounds, 640, 480),
+            )